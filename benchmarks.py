@@ -0,0 +1,680 @@
+"""
+Power Market Dashboard Benchmarks
+=================================
+
+Micro‑benchmarks for the performance‑sensitive parts of
+`power_market_dashboard.py`.  Everything runs offline: network
+benchmarks talk to the local stand‑in server in `elexon_standin.py`,
+and processing benchmarks share FUELINST and TSDF data generated by
+`elexon_synthetic.py`.
+
+**Usage:**
+
+    python benchmarks.py            # run every benchmark
+    python benchmarks.py session    # run a single benchmark
+"""
+
+import argparse
+import functools
+import shutil
+import statistics
+import tempfile
+import tracemalloc
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+import plotly.express as px  # type: ignore
+import plotly.io as pio  # type: ignore
+import requests  # type: ignore
+
+import power_market_dashboard as pmd
+from elexon_standin import StandInServer
+from elexon_synthetic import FUEL_TYPES, generate_fuelinst, generate_tsdf
+
+# First day of the generated benchmark data.
+FIXTURE_START = "2024-01-01"
+
+
+@functools.lru_cache(maxsize=4)
+def _fixture(days: float, boundaries: Tuple[str, ...] = ("N",)) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Generated FUELINST and TSDF frames for `days` days, in the compact
+    ingestion schema (see `elexon_synthetic`).
+
+    The frames are cached and shared between benchmarks; copy before
+    modifying them.
+    """
+    return (
+        generate_fuelinst(FIXTURE_START, days),
+        generate_tsdf(FIXTURE_START, days, boundaries=boundaries),
+    )
+
+
+def _raw(df: pd.DataFrame) -> pd.DataFrame:
+    """`df` as decoded before the compact schema: ISO‑8601 strings, plain
+    string labels, int64 periods and float64 values."""
+    raw = pmd._fallback_values(df)
+    return raw.astype(
+        {
+            col: object if isinstance(raw[col].dtype, pd.CategoricalDtype) else "int64"
+            for col in raw.columns
+            if isinstance(raw[col].dtype, pd.CategoricalDtype) or raw[col].dtype == "int8"
+        }
+    )
+
+
+def _baseline_process_data(
+    fuel_df: pd.DataFrame, tsdf_df: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """The original row‑wise `process_data`, kept as a reference point.
+
+    It widens and mutates its inputs, categorises with a per‑row apply,
+    aggregates with ``pivot_table`` and computes carbon intensity one
+    column at a time.
+    """
+    fuel_df["StartTime"] = pd.to_datetime(fuel_df["StartTime"], utc=True)
+    fuel_df["LocalTime"] = fuel_df["StartTime"].dt.tz_convert("Europe/London")
+    fuel_df["Generation_clipped"] = fuel_df["Generation"].clip(lower=0)
+    fuel_df["Category"] = fuel_df["FuelType"].apply(pmd._categorise_fuel_types)
+    pivot = fuel_df.pivot_table(
+        index="LocalTime", columns="Category", values="Generation_clipped", aggfunc="sum"
+    ).fillna(0)
+    for col in pmd.CATEGORIES:
+        if col not in pivot.columns:
+            pivot[col] = 0.0
+    pivot["TotalGeneration"] = pivot[pmd.CATEGORIES].sum(axis=1)
+    ci_numerator = pd.Series(0.0, index=pivot.index)
+    for cat, ef in pmd.EMISSION_FACTORS.items():
+        ci_numerator += pivot[cat] * ef
+    pivot["CarbonIntensity"] = ci_numerator / pivot["TotalGeneration"].replace(0, pd.NA)
+    area_df = pivot[pmd.CATEGORIES].reset_index().melt(
+        id_vars="LocalTime", var_name="Category", value_name="Generation"
+    )
+    fuel_df["LocalHalfHour"] = fuel_df["LocalTime"].dt.floor("30min")
+    half_hour_gen = fuel_df.groupby("LocalHalfHour")["Generation_clipped"].sum().reset_index()
+    tsdf_df["StartTime"] = pd.to_datetime(tsdf_df["StartTime"], utc=True)
+    tsdf_df["LocalTime"] = tsdf_df["StartTime"].dt.tz_convert("Europe/London")
+    tsdf_df["LocalHalfHour"] = tsdf_df["LocalTime"].dt.floor("30min")
+    latest_tsdf = tsdf_df.sort_values("PublishTime").groupby("LocalHalfHour").tail(1)
+    demand_merge = pd.merge(
+        latest_tsdf[["LocalHalfHour", "demand"]], half_hour_gen, on="LocalHalfHour", how="inner"
+    ).rename(columns={"Generation_clipped": "TotalGeneration", "demand": "DemandForecast"})
+    demand_merge["SupplyMinusDemand"] = (
+        demand_merge["TotalGeneration"] - demand_merge["DemandForecast"]
+    )
+    return pivot, area_df, demand_merge
+
+
+def _baseline_figures(
+    area_df: pd.DataFrame, pivot_df: pd.DataFrame, demand_df: pd.DataFrame
+) -> List[object]:
+    """The original Plotly Express figures, kept as a reference point."""
+    area_fig = px.area(
+        area_df,
+        x="LocalTime",
+        y="Generation",
+        color="Category",
+        title="Generation Mix by Fuel Category",
+        labels={"LocalTime": "Time (Europe/London)", "Generation": "Generation (MW)"},
+    )
+    area_fig.update_layout(legend_title_text="Category")
+    ci_fig = px.line(
+        pivot_df.reset_index(),
+        x="LocalTime",
+        y="CarbonIntensity",
+        title="Estimated Carbon Intensity",
+        labels={"LocalTime": "Time (Europe/London)", "CarbonIntensity": "Carbon Intensity (g/kWh)"},
+    )
+    ci_max = pivot_df["CarbonIntensity"].max()
+    if pd.notna(ci_max) and ci_max > 0:
+        ci_fig.update_layout(yaxis_range=[0, ci_max * 1.1])
+    sd_fig = px.line(
+        demand_df,
+        x="LocalHalfHour",
+        y="SupplyMinusDemand",
+        title="Supply Minus Demand (Half‑hourly)",
+        labels={"LocalHalfHour": "Time (Europe/London)", "SupplyMinusDemand": "Supply − Demand (MW)"},
+    )
+    sd_fig.update_layout(yaxis_title="Supply − Demand (MW)", xaxis_title="Time (Europe/London)")
+    return [area_fig, ci_fig, sd_fig]
+
+
+def _peak_mb(func: Callable[[], object]) -> float:
+    """Returns the peak traced memory (MB) allocated while running `func`."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def _timeit(func: Callable[[], object], repeat: int) -> List[float]:
+    """Returns `repeat` wall‑clock timings of `func` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: List[float]) -> None:
+    print(
+        f"  {name:<28} median {statistics.median(timings) * 1000:8.2f} ms"
+        f"  min {min(timings) * 1000:8.2f} ms  (n={len(timings)})"
+    )
+
+
+def bench_session(refreshes: int = 50) -> None:
+    """Repeated refreshes: bare ``requests.get`` versus the shared session."""
+    print(f"HTTP session: {refreshes} refreshes of FUELINST + TSDF")
+    with StandInServer(n_intervals=48) as server:
+        base = f"{server.base_url}/datasets"
+
+        def bare() -> None:
+            for dataset in ("FUELINST", "TSDF"):
+                requests.get(f"{base}/{dataset}").json()
+
+        def pooled() -> None:
+            for dataset in ("FUELINST", "TSDF"):
+                response, _ = pmd._request_dataset(dataset)
+                assert response is not None
+                response.json()
+
+        original = pmd.ELEXON_API_URL
+        pmd.ELEXON_API_URL = server.base_url
+        try:
+            pooled()  # open the pooled connection before timing
+            _report("requests.get per call", _timeit(bare, refreshes))
+            _report("shared keep-alive session", _timeit(pooled, refreshes))
+        finally:
+            pmd.ELEXON_API_URL = original
+
+
+def bench_cache(refreshes: int = 20, n_intervals: int = 2016) -> None:
+    """Unchanged refreshes with and without conditional requests."""
+    print(f"HTTP cache: {refreshes} unchanged refreshes, {n_intervals} FUELINST intervals")
+    cache_dir = tempfile.mkdtemp(prefix="pmd-cache-")
+    original = (pmd.ELEXON_API_URL, pmd.CACHE_DIR, pmd.HTTP_CACHE_ENABLED)
+    with StandInServer(n_intervals=n_intervals) as server:
+        pmd.ELEXON_API_URL, pmd.CACHE_DIR = server.base_url, cache_dir
+        try:
+            pmd.HTTP_CACHE_ENABLED = False
+            _report("full download", _timeit(pmd.fetch_fuelinst_data, refreshes))
+            pmd.HTTP_CACHE_ENABLED = True
+            before = pmd.cache_stats()
+            pmd.fetch_fuelinst_data()  # prime the cache
+            _report("conditional (304)", _timeit(pmd.fetch_fuelinst_data, refreshes))
+            after = pmd.cache_stats()
+            print(
+                f"  cache hits {after['hits'] - before['hits']}, misses "
+                f"{after['misses'] - before['misses']}, "
+                f"{(after['bytes_saved'] - before['bytes_saved']) / 1e6:.1f} MB not re-downloaded"
+            )
+        finally:
+            pmd.ELEXON_API_URL, pmd.CACHE_DIR, pmd.HTTP_CACHE_ENABLED = original
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def bench_backfill(days: int = 14, latency: float = 0.05, error_rate: float = 0.2) -> None:
+    """Backfill of `days` days with one worker versus a bounded pool.
+
+    The stand‑in answers each request after `latency` seconds, like a
+    remote API, and a second pass fails a share of requests and then
+    resumes from the checkpoint.
+    """
+    print(f"Backfill: {days} days of FUELINST + TSDF in 1-day chunks, {latency * 1e3:.0f} ms latency")
+    end = f"2024-01-{1 + days:02d}"
+    original = pmd.ELEXON_API_URL
+    with StandInServer(latency=latency) as server:
+        pmd.ELEXON_API_URL = server.base_url
+        try:
+            for workers in (1, 4):
+                out_dir = tempfile.mkdtemp(prefix="pmd-backfill-")
+                try:
+                    timings = _timeit(
+                        lambda: pmd.backfill(
+                            "2024-01-01", end, out_dir, max_workers=workers, rate=1000.0
+                        ),
+                        1,
+                    )
+                finally:
+                    shutil.rmtree(out_dir, ignore_errors=True)
+                _report(f"{workers} worker(s)", timings)
+        finally:
+            pmd.ELEXON_API_URL = original
+    with StandInServer(latency=latency, error_rate=error_rate) as server:
+        pmd.ELEXON_API_URL = server.base_url
+        out_dir = tempfile.mkdtemp(prefix="pmd-backfill-")
+        try:
+            passes = []
+            while not passes or passes[-1]["failed"] and len(passes) < 10:
+                passes.append(
+                    pmd.backfill("2024-01-01", end, out_dir, max_workers=4, rate=1000.0)
+                )
+        finally:
+            pmd.ELEXON_API_URL = original
+            shutil.rmtree(out_dir, ignore_errors=True)
+        print(
+            f"  {error_rate:.0%} errors: {len(passes)} pass(es), failed per pass "
+            f"{[p['failed'] for p in passes]}, {server.stats['requests']} requests"
+        )
+
+
+def bench_store(days: int = 365, window_days: int = 7) -> None:
+    """Loading from the fallback CSV versus the partitioned columnar store."""
+    print(f"Columnar store: {days} days of FUELINST, {window_days}-day window")
+    if pmd.pq is None:
+        print("  skipped: pyarrow is not installed")
+        return
+    df = _raw(_fixture(days)[0])
+    root = tempfile.mkdtemp(prefix="pmd-store-")
+    try:
+        csv_path = f"{root}/FUELINST.csv"
+        df.to_csv(csv_path, index=False)
+        store = pmd.ColumnarStore(f"{root}/store")
+        store.write("FUELINST", df)
+        start = pd.Timestamp(FIXTURE_START, tz="UTC") + pd.Timedelta(days=days // 2)
+        end = start + pd.Timedelta(days=window_days)
+        for name, load in (
+            ("CSV (full file)", lambda: pd.read_csv(csv_path)),
+            ("store (full range)", lambda: store.read("FUELINST")),
+            ("store (window)", lambda: store.read("FUELINST", start, end)),
+        ):
+            frame = load()
+            _report(name, _timeit(load, 3))
+            print(f"  {'':<28} {len(frame):>9} rows, {frame.memory_usage(deep=True).sum() / 1e6:8.1f} MB")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def bench_categorise(days: int = 180) -> None:
+    """Per‑row ``apply`` versus the factorised fuel categorisation."""
+    fuel_types = _raw(_fixture(days)[0])["FuelType"]
+    print(f"Fuel categorisation: {len(fuel_types)} rows")
+    _report("Series.apply", _timeit(lambda: fuel_types.apply(pmd._categorise_fuel_types), 3))
+    _report("categorise_fuel_types", _timeit(lambda: pmd.categorise_fuel_types(fuel_types), 3))
+
+
+def bench_times(days: int = 180) -> None:
+    """Per‑row timestamp parsing versus parsing unique values only."""
+    start_times = _raw(_fixture(days)[0])["StartTime"]
+    print(f"Timestamp parsing: {len(start_times)} rows")
+
+    def per_row() -> None:
+        pd.to_datetime(start_times, utc=True).dt.tz_convert("Europe/London")
+
+    def unique_values() -> None:
+        codes, utc = pmd._time_codes(start_times)
+        utc.tz_convert("Europe/London")
+
+    _report("per row", _timeit(per_row, 3))
+    _report("unique values (_time_codes)", _timeit(unique_values, 3))
+
+
+def bench_aggregate(days: int = 180) -> None:
+    """``pivot_table`` versus the bincount aggregation kernel.
+
+    Equivalence of the full `process_data` output is checked in
+    ``tests/test_process_data.py``.
+    """
+    df = _fixture(days)[0]
+    codes, utc = pmd._time_codes(df["StartTime"])
+    times = utc.tz_convert("Europe/London").rename("LocalTime")
+    generation = df["Generation"].clip(lower=0)
+    frame = pd.DataFrame(
+        {"LocalTime": times.take(codes), "FuelType": df["FuelType"], "Generation": generation}
+    )
+    values = generation.to_numpy(dtype="float64")
+    print(f"Aggregation: {len(frame)} rows")
+
+    def pivot_table() -> pd.DataFrame:
+        return frame.pivot_table(
+            index="LocalTime", columns="FuelType", values="Generation",
+            aggfunc="sum", observed=True,
+        ).fillna(0)
+
+    def kernel() -> pd.DataFrame:
+        return pmd.aggregate_generation(codes, times, df["FuelType"], values)
+
+    _report("pivot_table", _timeit(pivot_table, 3))
+    _report("aggregate_generation", _timeit(kernel, 3))
+
+
+def bench_scenarios(days: int = 90, n_scenarios: int = 40) -> None:
+    """Per‑scenario column loops versus one carbon intensity matrix product."""
+    df = _fixture(days)[0]
+    codes, utc = pmd._time_codes(df["StartTime"])
+    fuel_matrix = pmd.aggregate_generation(
+        codes, utc.tz_convert("Europe/London"), df["FuelType"],
+        df["Generation"].clip(lower=0).to_numpy(dtype="float64"),
+    )
+    pivot = pmd.category_matrix(fuel_matrix)
+    scenarios = {
+        f"x{scale:.2f}": {cat: ef * scale for cat, ef in pmd.EMISSION_FACTORS.items()}
+        for scale in np.linspace(0.8, 1.2, n_scenarios)
+    }
+    print(f"Carbon intensity: {len(pivot)} timestamps, {n_scenarios} scenarios")
+
+    def loop() -> None:
+        total = pivot.sum(axis=1).replace(0, np.nan)
+        for factors in scenarios.values():
+            numerator = pd.Series(0.0, index=pivot.index)
+            for cat, ef in factors.items():
+                numerator += pivot[cat] * ef
+            numerator / total
+
+    _report("column loop per scenario", _timeit(loop, 3))
+    _report("carbon_intensity", _timeit(lambda: pmd.carbon_intensity(fuel_matrix, scenarios), 3))
+
+
+def bench_incremental(days: int = 7) -> None:
+    """Full ``process_data`` versus `IncrementalProcessor` for one new interval."""
+    df, tsdf = _fixture(days + 1)
+    fuels = len(FUEL_TYPES)
+    history, latest = df.iloc[: days * 288 * fuels], df.iloc[days * 288 * fuels :]
+    print(f"Incremental refresh: {days}-day window plus one 5-minute interval")
+    processor = pmd.IncrementalProcessor()
+    processor.update(history, tsdf)
+    batches = iter([latest.iloc[i : i + fuels] for i in range(0, len(latest), fuels)])
+    _report("process_data (full window)", _timeit(lambda: pmd.process_data(history, tsdf), 3))
+    _report("IncrementalProcessor.update", _timeit(lambda: processor.update(next(batches)), 20))
+
+
+def bench_refresh(sizes: Tuple[int, ...] = (1, 7, 30, 60)) -> None:
+    """Full ``process_data`` versus `SnapshotRefresher.ingest` of one interval."""
+    fuels = len(FUEL_TYPES)
+    print("Snapshot refresh: one new 5-minute interval per window")
+    for days in sizes:
+        df, tsdf = _fixture(days + 1)
+        window = days * 288 * fuels
+        refresher = pmd.SnapshotRefresher()
+        refresher.seed(df.iloc[:window], tsdf)
+        batches = iter([df.iloc[i : i + fuels] for i in range(window, len(df), fuels)])
+        _report(f"process_data {days}D", _timeit(lambda: pmd.process_data(df.iloc[:window], tsdf), 3))
+        _report(f"ingest {days}D", _timeit(lambda: refresher.ingest(next(batches)), 10))
+
+
+def bench_memory(days: int = 90) -> None:
+    """Peak memory of the original versus the copy‑free `process_data`."""
+    fuel_df, tsdf_df = (_raw(df) for df in _fixture(days))
+    print(
+        f"process_data memory: {len(fuel_df)} rows, "
+        f"input {fuel_df.memory_usage(deep=True).sum() / 1e6:.1f} MB"
+    )
+    fuel_copy, tsdf_copy = fuel_df.copy(), tsdf_df.copy()
+    baseline = _peak_mb(lambda: _baseline_process_data(fuel_copy, tsdf_copy))
+    print(f"  {'original (mutating)':<28} peak {baseline:8.1f} MB")
+    stages: Dict[str, float] = {}
+    current = _peak_mb(lambda: pmd.process_data(fuel_df, tsdf_df))
+    print(f"  {'copy-free':<28} peak {current:8.1f} MB")
+    pmd.process_data(fuel_df, tsdf_df, profile=stages)
+    for name, peak in stages.items():
+        print(f"    {name:<26} peak {peak:8.1f} MB")
+
+
+def bench_schema(days: int = 30) -> None:
+    """Memory of raw fetched frames versus the compact ingestion schema."""
+    raw = _raw(_fixture(days)[0])
+    typed = pmd.apply_schema(raw, pmd.FUELINST_SCHEMA)
+    before = raw.memory_usage(deep=True, index=False)
+    after = typed.memory_usage(deep=True, index=False)
+    print(f"Ingestion schema: {len(raw)} FUELINST rows ({days} days)")
+    for col in raw.columns:
+        print(
+            f"  {col:<18} {str(raw[col].dtype):>10} {before[col] / 1e6:8.1f} MB"
+            f"  ->  {str(typed[col].dtype):>10} {after[col] / 1e6:8.1f} MB"
+        )
+    print(
+        f"  {'total':<18} {'':>10} {before.sum() / 1e6:8.1f} MB  ->  {'':>10} "
+        f"{after.sum() / 1e6:8.1f} MB ({before.sum() / after.sum():.1f}x smaller)"
+    )
+    _report("apply_schema", _timeit(lambda: pmd.apply_schema(raw, pmd.FUELINST_SCHEMA), 3))
+
+
+def bench_decode(n_intervals: int = 8640) -> None:
+    """Whole‑payload ``response.json()`` versus the streaming decoder."""
+    print(f"Payload decode: {n_intervals * len(FUEL_TYPES)} FUELINST rows")
+    original = (pmd.ELEXON_API_URL, pmd.HTTP_CACHE_ENABLED)
+    with StandInServer(n_intervals=n_intervals) as server:
+        pmd.ELEXON_API_URL, pmd.HTTP_CACHE_ENABLED = server.base_url, False
+        print(f"  payload {len(server.payloads['FUELINST']) / 1e6:.1f} MB of JSON")
+
+        def whole() -> pd.DataFrame:
+            response, _ = pmd._request_dataset("FUELINST")
+            assert response is not None
+            df = pd.DataFrame(response.json().get("data", []))
+            return pmd.apply_schema(df.rename(columns=pmd.FUELINST_COLUMNS), pmd.FUELINST_SCHEMA)
+
+        def streamed() -> pd.DataFrame:
+            df, _ = pmd._fetch_dataset("FUELINST", use_cache=False)
+            assert df is not None
+            return df
+
+        try:
+            for name, func in (("response.json + DataFrame", whole), ("streaming decode", streamed)):
+                frame = func()
+                print(
+                    f"  {name:<28} peak {_peak_mb(func):8.1f} MB"
+                    f"  (final frame {frame.memory_usage(deep=True).sum() / 1e6:.1f} MB)"
+                )
+                _report(name, _timeit(func, 3))
+        finally:
+            pmd.ELEXON_API_URL, pmd.HTTP_CACHE_ENABLED = original
+
+
+def bench_downsample(days: int = 30) -> None:
+    """Figures built from every point versus downsampled to the chart width."""
+    fuel_df, tsdf_df = _fixture(days)
+    pivot, _, demand = pmd.process_data(fuel_df, tsdf_df)
+    rollups = pmd.RollupPyramid.from_frames(pivot, demand).levels()
+    print(f"Chart downsampling: {days} days, {len(pivot)} intervals")
+    original = pmd.CHART_WIDTH
+    try:
+        for name, width in (("every point", len(pivot)), (f"{original} px width", original)):
+            pmd.CHART_WIDTH = width
+            figures = pmd.build_figures(rollups)
+            points = sum(len(trace["x"]) for fig in figures.values() for trace in fig["data"])
+            size = sum(len(pio.to_json(fig, validate=False)) for fig in figures.values())
+            print(f"  {name:<28} {points:8d} points  {size / 1e6:6.2f} MB of JSON")
+            _report(name, _timeit(lambda: pmd.build_figures(rollups), 3))
+    finally:
+        pmd.CHART_WIDTH = original
+
+
+def bench_rollups(days: int = 120) -> None:
+    """Range queries: re-aggregating pivot rows versus the rollup pyramid."""
+    fuel_df, tsdf_df = _fixture(days)
+    pivot, _, demand = pmd.process_data(fuel_df, tsdf_df)
+    print(f"Rollup pyramid: {days} days, {len(pivot)} intervals")
+    _report("build pyramid", _timeit(lambda: pmd.RollupPyramid.from_frames(pivot, demand).levels(), 3))
+    pyramid = pmd.RollupPyramid.from_frames(pivot, demand)
+    revisions = iter(range(len(pivot)))
+
+    def revise_latest() -> None:
+        row = pivot.iloc[-1:] * (1.0 + next(revisions) * 1e-6)
+        pyramid.update(row)
+        pyramid.levels()
+
+    _report("update 1 interval + levels", _timeit(revise_latest, 5))
+    start = pivot.index[0]
+    for span in ("1D", "30D", f"{days}D"):
+        end = start + pd.Timedelta(span)
+        level, rows = pyramid.query(start, end)
+        print(f"  {span} span -> {level} level, {len(rows)} rows")
+        window = pivot.loc[start:end]
+        _report(f"resample {span} to {level}", _timeit(lambda: window.resample(level).mean(), 5))
+        _report(f"pyramid query {span}", _timeit(lambda: pyramid.query(start, end), 5))
+
+
+def bench_area(days: int = 7) -> None:
+    """Generation‑mix figure: melted frame + px.area versus wide traces."""
+    fuel_df, tsdf_df = _fixture(days)
+    pivot, area_df, _ = pmd.process_data(fuel_df, tsdf_df)
+    print(f"Generation mix figure: {days} days, {len(pivot)} intervals")
+
+    def melted() -> object:
+        long_df = pivot[pmd.CATEGORIES].reset_index().melt(
+            id_vars="LocalTime", var_name="Category", value_name="Generation"
+        )
+        return px.area(long_df, x="LocalTime", y="Generation", color="Category")
+
+    for name, func in (("melt + px.area", melted), ("wide pivot traces", lambda: pmd.fill_figure("generation", area_df))):
+        print(f"  {name:<28} peak {_peak_mb(func):8.1f} MB")
+        _report(name, _timeit(func, 3))
+
+
+def bench_figures(days: int = 7) -> None:
+    """Figure construction: Plotly Express versus filled templates."""
+    fuel_df, tsdf_df = _fixture(days)
+    pivot, area_df, demand = pmd.process_data(fuel_df, tsdf_df)
+    area_long = area_df.reset_index().melt(
+        id_vars="LocalTime", var_name="Category", value_name="Generation"
+    )
+    print(f"Figure construction: {days} days, {len(pivot)} intervals")
+    refresher = pmd.SnapshotRefresher()
+    refresher.seed(fuel_df, tsdf_df)
+    app = pmd.create_live_dashboard(refresher)
+    client = app.server.test_client()
+    candidates = (
+        ("plotly express + to_json", lambda: [pio.to_json(f) for f in _baseline_figures(area_long, pivot, demand)]),
+        ("templates + to_json", lambda: [pio.to_json(f, validate=False) for f in pmd.build_figures(refresher.snapshot.rollups).values()]),
+        ("cached page layout JSON", lambda: client.get("/_dash-layout").data),
+    )
+    for name, func in candidates:
+        _report(name, _timeit(func, 5))
+
+
+def bench_live(days: int = 1, ticks: int = 12) -> None:
+    """Bytes sent per refresh: full figures versus `chart_updates` patches."""
+    df, tsdf = _fixture(days + 1)
+    fuels = len(FUEL_TYPES)
+    window = days * 288 * fuels
+    print(f"Live refresh payload: {days}-day window, {ticks} 5-minute refreshes")
+    refresher = pmd.SnapshotRefresher()
+    snapshot = refresher.seed(df.iloc[:window], tsdf)
+    state = pmd.chart_state(snapshot)
+    full: List[int] = []
+    patched: List[int] = []
+    for i in range(ticks):
+        batch = df.iloc[window + i * fuels : window + (i + 1) * fuels]
+        snapshot = refresher.ingest(batch)
+        updates, state = pmd.chart_updates(snapshot, state)
+        full.append(sum(len(pio.to_json(pmd._live_figure(snapshot, key)[0], validate=False)) for key in updates))
+        patched.append(
+            sum(len(pio.to_json(u, validate=False)) for u in updates.values() if u is not pmd.no_update)
+        )
+    print(f"  {'full figures':<28} {statistics.mean(full) / 1e3:8.1f} kB per refresh")
+    print(f"  {'patches':<28} {statistics.mean(patched) / 1e3:8.1f} kB per refresh")
+
+
+def bench_tsdf(days: int = 30, boundaries: int = 5) -> None:
+    """Re‑sorting the TSDF history versus `TsdfStore.upsert` per publish."""
+    names = (pmd.NATIONAL_BOUNDARY,) + tuple(f"B{i}" for i in range(1, boundaries))
+    history = _fixture(days, names)[1]
+    # A full publish from mid-range (the last ones only reach the range end)
+    publishes = np.sort(history["PublishTime"].unique())
+    publish = history[history["PublishTime"] == publishes[len(publishes) // 2]]
+    store = pmd.TsdfStore()
+    store.upsert(history)
+    print(f"TSDF latest forecast: {len(history)} rows held, {len(publish)} rows per publish")
+
+    def resort() -> pd.DataFrame:
+        return (
+            pd.concat([history, publish])
+            .sort_values("PublishTime", kind="stable")
+            .groupby(["Boundary", "StartTime"], observed=True)
+            .tail(1)
+        )
+
+    _report("sort + groupby over history", _timeit(resort, 3))
+    _report("TsdfStore.upsert", _timeit(lambda: store.upsert(publish), 20))
+
+
+def bench_vintages(days: int = 30) -> None:
+    """Recomputing forecast error by lead time versus incremental updates."""
+    fuel, tsdf = _fixture(days)
+    pivot = pmd.process_data(fuel, tsdf)[0]
+    keys, generation = pmd.realised_generation(pivot)
+    print(f"Forecast error by lead time: {len(tsdf)} vintages, {len(keys)} realised half hours")
+
+    def recompute() -> pd.DataFrame:
+        realised = pd.Series(generation, index=pmd._settlement_starts(keys).tz_convert("UTC"))
+        vintages = tsdf.drop_duplicates(["Boundary", "StartTime", "PublishTime"])
+        target = pd.to_datetime(vintages["StartTime"], utc=True)
+        error = vintages["demand"].to_numpy() - realised.reindex(target).to_numpy()
+        lead = (target - pd.to_datetime(vintages["PublishTime"], utc=True)) // pd.Timedelta("30min")
+        frame = pd.DataFrame({"lead": lead.to_numpy(), "error": error}).dropna()
+        frame = frame[frame["lead"] >= 0]
+        return frame.groupby("lead")["error"].agg(["count", "mean", lambda e: e.abs().mean()])
+
+    # Hold back the last 20 publishes and feed them in one at a time
+    latest = np.sort(tsdf["PublishTime"].unique())[-20:]
+    store = pmd.ForecastVintageStore()
+    store.add(tsdf[~tsdf["PublishTime"].isin(latest)])
+    store.set_outturn(keys, generation)
+    publishes = iter([tsdf[tsdf["PublishTime"] == publish] for publish in latest])
+
+    def update() -> pd.DataFrame:
+        store.add(next(publishes))
+        store.set_outturn(keys[-1:], generation[-1:])
+        return store.error_by_lead()
+
+    _report("recompute from frames", _timeit(recompute, 3))
+    _report("ForecastVintageStore update", _timeit(update, 20))
+
+
+def bench_scale(sizes: Tuple[int, ...] = (1, 30, 365)) -> None:
+    """`process_data` and `create_dashboard` on generated data of growing size."""
+    print("Scaling: synthetic FUELINST + TSDF (national and one zonal boundary)")
+    for days in sizes:
+        fuel, tsdf = _fixture(days, ("N", "B1"))
+        print(f"  {days} day(s): {len(fuel)} FUELINST rows, {len(tsdf)} TSDF rows")
+        pivot, _, demand = pmd.process_data(fuel, tsdf)
+        _report("process_data", _timeit(lambda: pmd.process_data(fuel, tsdf), 3))
+        _report("create_dashboard", _timeit(lambda: pmd.create_dashboard(pivot, demand), 3))
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "session": bench_session,
+    "cache": bench_cache,
+    "backfill": bench_backfill,
+    "store": bench_store,
+    "categorise": bench_categorise,
+    "times": bench_times,
+    "aggregate": bench_aggregate,
+    "scenarios": bench_scenarios,
+    "incremental": bench_incremental,
+    "refresh": bench_refresh,
+    "memory": bench_memory,
+    "schema": bench_schema,
+    "decode": bench_decode,
+    "live": bench_live,
+    "downsample": bench_downsample,
+    "rollups": bench_rollups,
+    "area": bench_area,
+    "figures": bench_figures,
+    "tsdf": bench_tsdf,
+    "vintages": bench_vintages,
+    "scale": bench_scale,
+}
+
+
+def main() -> None:
+    """Runs the selected benchmarks (all of them by default)."""
+    parser = argparse.ArgumentParser(description="Power market dashboard benchmarks")
+    parser.add_argument("names", nargs="*", help=", ".join(BENCHMARKS))
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+    # Measure the pipeline as the dashboard runs it
+    pmd.enable_copy_on_write()
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
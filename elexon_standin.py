@@ -0,0 +1,320 @@
+"""
+Elexon Stand-in Server
+======================
+
+A tiny local HTTP server that mimics the two Insights Solution API
+endpoints used by `power_market_dashboard.py` (``/datasets/FUELINST`` and
+``/datasets/TSDF``).  It serves synthetic payloads so the fetch path can
+be exercised and benchmarked on a machine with no network access.
+Payload size, response latency, the share of failed requests and ETag
+support are all configurable, so fetch, cache and backfill behaviour
+can be measured deterministically.
+
+**Usage:**
+
+    python elexon_standin.py --port 8765 --latency 0.05 --error-rate 0.1
+
+and point the dashboard at it with
+``python power_market_dashboard.py --api-url http://127.0.0.1:8765`` (or
+the ``ELEXON_API_URL`` environment variable).
+"""
+
+import argparse
+import datetime as _dt
+import gzip
+import hashlib
+import json as _json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from elexon_synthetic import FUEL_TYPES
+
+_LONDON = ZoneInfo("Europe/London")
+
+
+def _iso(ts: _dt.datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _settlement(ts: _dt.datetime) -> Tuple[str, int]:
+    """Settlement date and period of a UTC time (periods count half hours
+    from the Europe/London midnight, so clock-change days have 46 or 50)."""
+    day = ts.astimezone(_LONDON).date()
+    midnight = _dt.datetime.combine(day, _dt.time(), tzinfo=_LONDON)
+    return day.isoformat(), int((ts - midnight).total_seconds() // 1800) + 1
+
+
+def make_fuelinst_records(
+    end: _dt.datetime, n_intervals: int = 288
+) -> List[Dict[str, object]]:
+    """Builds `n_intervals` 5‑minute FUELINST intervals ending at `end`."""
+    records: List[Dict[str, object]] = []
+    for i in range(n_intervals):
+        start = end - _dt.timedelta(minutes=5 * (n_intervals - 1 - i))
+        day, period = _settlement(start)
+        for fuel, base in FUEL_TYPES.items():
+            records.append(
+                {
+                    "dataset": "FUELINST",
+                    "publishTime": _iso(start + _dt.timedelta(minutes=5)),
+                    "startTime": _iso(start),
+                    "settlementDate": day,
+                    "settlementPeriod": period,
+                    "fuelType": fuel,
+                    "generation": round(base * (1.0 + 0.1 * ((i % 12) - 6) / 6), 1),
+                }
+            )
+    return records
+
+
+def make_tsdf_records(
+    start: _dt.datetime, n_periods: int = 96, publish: Optional[_dt.datetime] = None
+) -> List[Dict[str, object]]:
+    """Builds `n_periods` half‑hourly national TSDF forecasts from `start`."""
+    records: List[Dict[str, object]] = []
+    published = _iso(publish or start)
+    for i in range(n_periods):
+        ts = start + _dt.timedelta(minutes=30 * i)
+        day, period = _settlement(ts)
+        records.append(
+            {
+                "dataset": "TSDF",
+                "demand": 28000 + 4000 * ((i % 48) - 24) / 24,
+                "publishTime": published,
+                "startTime": _iso(ts),
+                "settlementDate": day,
+                "settlementPeriod": period,
+                "boundary": "N",
+            }
+        )
+    return records
+
+
+def _parse_iso(value: str) -> _dt.datetime:
+    return _dt.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=_dt.timezone.utc)
+
+
+def make_ranged_records(
+    dataset: str, publish_from: _dt.datetime, publish_to: _dt.datetime
+) -> List[Dict[str, object]]:
+    """Builds the records published in ``[publish_from, publish_to]``.
+
+    FUELINST is published every five minutes for the interval that just
+    ended; TSDF is published hourly with a 24‑hour forecast horizon.
+    """
+    records: List[Dict[str, object]] = []
+    if dataset == "FUELINST":
+        # First 5-minute boundary at or after publish_from.
+        first = publish_from + _dt.timedelta(
+            seconds=(-publish_from.timestamp()) % 300
+        )
+        n = int((publish_to - first).total_seconds() // 300) + 1
+        if n > 0:
+            # Each interval is published when it ends, five minutes after it starts.
+            last_start = first + _dt.timedelta(minutes=5 * (n - 2))
+            records = make_fuelinst_records(last_start, n)
+        return records
+    publish = publish_from + _dt.timedelta(seconds=(-publish_from.timestamp()) % 3600)
+    while publish <= publish_to:
+        records.extend(make_tsdf_records(publish + _dt.timedelta(minutes=30), 48, publish))
+        publish += _dt.timedelta(hours=1)
+    return records
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so clients can keep the connection alive between requests.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second write stalls on delayed ACKs over a kept-alive connection.
+    disable_nagle_algorithm = True
+    server: "StandInServer"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        path, _, query = self.path.partition("?")
+        dataset = path.rstrip("/").rsplit("/", 1)[-1]
+        params = {k: v[0] for k, v in parse_qs(query).items()}
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        if self.server.fail_next():
+            self._send_empty(503)
+            return
+        if dataset not in self.server.payloads:
+            self._send_empty(404)
+            return
+        if "publishDateTimeFrom" in params:
+            # Date-range query: synthesise the publishes inside the window.
+            records = make_ranged_records(
+                dataset,
+                _parse_iso(params["publishDateTimeFrom"]),
+                _parse_iso(params.get("publishDateTimeTo", _iso(_dt.datetime.now(_dt.timezone.utc)))),
+            )
+            body = _json.dumps({"data": records}).encode()
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        else:
+            body = self.server.payloads[dataset]
+            etag = self.server.etags[dataset]
+        if not self.server.etags_enabled:
+            etag = ""
+        elif self.headers.get("If-None-Match") == etag:
+            self.server.count("not_modified")
+            self._send_empty(304, etag)
+            return
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body, compresslevel=1)
+        self.server.count("ok")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if etag:
+            self.send_header("ETag", etag)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_empty(self, status: int, etag: str = "") -> None:
+        if status >= 400:
+            self.server.count("errors")
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        # Keep benchmark output clean.
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand‑in for the Elexon dataset endpoints.
+
+    Use as a context manager; the server runs on a daemon thread and
+    `base_url` can be assigned to ``power_market_dashboard.ELEXON_API_URL``.
+    Each payload carries a strong ETag and ``If-None-Match`` revalidation
+    is answered with 304.  Requests with ``publishDateTimeFrom`` /
+    ``publishDateTimeTo`` receive synthetic data for that window.
+
+    Failures are spread evenly rather than drawn at random: with an
+    `error_rate` of 0.25 exactly every fourth request gets a 503, so runs
+    are repeatable.  Response counts are kept in `stats`.
+
+    Parameters
+    ----------
+    host : str, optional
+        Interface to bind, by default loopback.
+    port : int, optional
+        Port to bind; 0 picks a free port.
+    n_intervals : int, optional
+        Number of 5‑minute FUELINST intervals to serve.
+    tsdf_periods : int, optional
+        Number of half‑hourly TSDF periods to serve.
+    latency : float, optional
+        Seconds each request waits before it is answered.
+    error_rate : float, optional
+        Share of requests (0 to 1) answered with HTTP 503.
+    etags : bool, optional
+        Send ETags and answer matching ``If-None-Match`` with 304.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        n_intervals: int = 288,
+        tsdf_periods: int = 96,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        etags: bool = True,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1.")
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.etags_enabled = etags
+        self.stats: Dict[str, int] = {"requests": 0, "ok": 0, "not_modified": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+        end = _dt.datetime.now(_dt.timezone.utc).replace(second=0, microsecond=0)
+        end -= _dt.timedelta(minutes=end.minute % 5)
+        self.payloads: Dict[str, bytes] = {
+            "FUELINST": _json.dumps({"data": make_fuelinst_records(end, n_intervals)}).encode(),
+            "TSDF": _json.dumps(
+                {
+                    "data": make_tsdf_records(
+                        end.replace(minute=0) - _dt.timedelta(hours=12), tsdf_periods
+                    )
+                }
+            ).encode(),
+        }
+        self.etags: Dict[str, str] = {
+            name: '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+            for name, body in self.payloads.items()
+        }
+        self._thread: Optional[threading.Thread] = None
+
+    def fail_next(self) -> bool:
+        """Counts a request and says whether it should fail."""
+        with self._stats_lock:
+            n = self.stats["requests"]
+            self.stats["requests"] = n + 1
+        return int((n + 1) * self.error_rate) > int(n * self.error_rate)
+
+    def count(self, outcome: str) -> None:
+        """Adds one to the `stats` counter for `outcome`."""
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    """Runs the stand‑in server in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--intervals", type=int, default=288, help="FUELINST 5-minute intervals")
+    parser.add_argument("--tsdf-periods", type=int, default=96, help="TSDF half hours")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--no-etags", action="store_true", help="disable ETag revalidation")
+    args = parser.parse_args()
+    server = StandInServer(
+        args.host,
+        args.port,
+        args.intervals,
+        tsdf_periods=args.tsdf_periods,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        etags=not args.no_etags,
+    )
+    print(f"Serving synthetic Elexon datasets at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+"""
+Synthetic Elexon Data
+=====================
+
+Generates realistic FUELINST and TSDF data at any scale, from a single
+day to ten years or more, for scaling benchmarks of
+`power_market_dashboard.py` and for running the dashboard offline.
+
+FUELINST covers every fuel type Elexon publishes, including each ``INT*``
+interconnector (which export, i.e. go negative, when it is windy) and
+pumped storage (negative while pumping overnight).  Total generation
+follows a national demand profile with daily, weekly and seasonal shape
+in Europe/London time, so clock-change days have 46 or 50 settlement
+periods.  TSDF is published hourly for the following day, so every half
+hour has many forecast vintages, for the national boundary and any
+number of zonal ones.
+
+Frames use the standardised column names and the compact types of
+``FUELINST_SCHEMA`` / ``TSDF_SCHEMA``; files use the fallback formats
+(``FUELINST.csv`` and ``TSDF.json``) with Elexon's field names.
+
+**Usage:**
+
+    python elexon_synthetic.py --start 2024-01-01 --days 365 --out synthetic
+    python elexon_synthetic.py --days 3650 --boundaries N B1 B2 --out synthetic
+"""
+
+import argparse
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+# Fuel types published in FUELINST, with a rough typical output in MW.
+FUEL_TYPES: Dict[str, float] = {
+    "CCGT": 9000.0,
+    "OCGT": 20.0,
+    "BIOMASS": 2000.0,
+    "COAL": 0.0,
+    "OIL": 0.0,
+    "OTHER": 300.0,
+    "NUCLEAR": 4500.0,
+    "WIND": 8000.0,
+    "NPSHYD": 300.0,
+    "PS": -200.0,
+    "INTELEC": 900.0,
+    "INTEW": 400.0,
+    "INTFR": 1500.0,
+    "INTGRNL": 300.0,
+    "INTIFA2": 900.0,
+    "INTIRL": 200.0,
+    "INTNED": 800.0,
+    "INTNEM": 900.0,
+    "INTNSL": 1300.0,
+    "INTVKL": 1000.0,
+}
+# Installed wind capacity (MW) that the wind profile scales to.
+WIND_CAPACITY = 22000.0
+# Pumped storage turbine / pump capacity (MW).
+PS_CAPACITY = 1800.0
+# Mean national demand (MW) before daily, weekly and seasonal shape.
+MEAN_DEMAND = 27000.0
+
+_INTERVAL_NS = 300 * 10**9
+_HALF_HOUR_NS = 1800 * 10**9
+
+
+def _local_hours(times: np.ndarray) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """Europe/London times and fractional local hours of UTC epoch ns."""
+    local = pd.DatetimeIndex(times, dtype="datetime64[ns, UTC]").tz_convert("Europe/London")
+    return local, local.hour + local.minute / 60.0
+
+
+def demand_profile(times: np.ndarray) -> np.ndarray:
+    """Expected national demand (MW) at UTC epoch‑nanosecond `times`.
+
+    Demand troughs overnight and peaks in the early evening (local time),
+    is lower at weekends and higher in winter.
+    """
+    local, hours = _local_hours(times)
+    daily = (
+        1.0
+        + 0.16 * np.cos(2 * np.pi * (hours - 18.0) / 24.0)
+        + 0.06 * np.cos(4 * np.pi * (hours - 10.0) / 24.0)
+    )
+    seasonal = 1.0 + 0.15 * np.cos(2 * np.pi * (local.dayofyear - 15) / 365.25)
+    weekly = np.where(local.dayofweek >= 5, 0.92, 1.0)
+    return MEAN_DEMAND * daily * seasonal * weekly
+
+
+def _slow_noise(rng: np.random.Generator, n: int, step: int, persistence: float) -> np.ndarray:
+    """Smooth unit‑variance noise: an AR(1) process sampled every `step`
+    points and linearly interpolated in between."""
+    knots = np.empty(n // step + 2)
+    shocks = rng.standard_normal(len(knots)) * np.sqrt(1 - persistence**2)
+    knots[0] = rng.standard_normal()
+    for i in range(1, len(knots)):
+        knots[i] = persistence * knots[i - 1] + shocks[i]
+    return np.interp(np.arange(n), np.arange(len(knots)) * step, knots)
+
+
+def _time_range(start: str, days: float) -> np.ndarray:
+    """UTC epoch ns of every 5‑minute interval in `days` days from `start`."""
+    first = pd.Timestamp(start)
+    first = first.tz_localize("UTC") if first.tzinfo is None else first.tz_convert("UTC")
+    n = int(round(days * 288))
+    if n <= 0:
+        raise ValueError("days must cover at least one 5-minute interval.")
+    return first.value + np.arange(n, dtype="int64") * _INTERVAL_NS
+
+
+def _settlement_columns(times: np.ndarray) -> Tuple[pd.Categorical, np.ndarray]:
+    """Settlement date (categorical 'YYYY-MM-DD') and period of each time."""
+    local = pd.DatetimeIndex(times, dtype="datetime64[ns, UTC]").tz_convert("Europe/London")
+    midnights = local.normalize()
+    periods = ((times - midnights.asi8) // _HALF_HOUR_NS + 1).astype("int8")
+    codes, days = pd.factorize(midnights.tz_localize(None), sort=True)
+    return pd.Categorical.from_codes(codes, categories=days.strftime("%Y-%m-%d")), periods
+
+
+def _generation(times: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """(interval × fuel type) generation in MW, columns in `FUEL_TYPES` order."""
+    n = len(times)
+    demand = demand_profile(times) * (1 + 0.01 * _slow_noise(rng, n, 6, 0.9))
+    _, hours = _local_hours(times)
+    out: Dict[str, np.ndarray] = {}
+    # Weather-driven wind: a few days of persistence, bounded by capacity
+    wind_share = 1 / (1 + np.exp(-(0.4 + 1.3 * _slow_noise(rng, n, 36, 0.97))))
+    out["WIND"] = WIND_CAPACITY * wind_share
+    out["NUCLEAR"] = np.maximum(FUEL_TYPES["NUCLEAR"] * (1 + 0.08 * _slow_noise(rng, n, 288, 0.95)), 0)
+    out["BIOMASS"] = np.maximum(FUEL_TYPES["BIOMASS"] * (1 + 0.2 * _slow_noise(rng, n, 72, 0.9)), 0)
+    out["NPSHYD"] = np.maximum(FUEL_TYPES["NPSHYD"] * (1 + 0.3 * _slow_noise(rng, n, 72, 0.9)), 0)
+    out["OTHER"] = np.maximum(FUEL_TYPES["OTHER"] * (1 + 0.1 * _slow_noise(rng, n, 36, 0.8)), 0)
+    out["COAL"] = np.zeros(n)
+    out["OIL"] = np.zeros(n)
+    # Pumped storage generates at the evening peak and pumps (negative) overnight
+    generating = np.clip(np.cos(2 * np.pi * (hours - 18.0) / 24.0) * 2 - 1, 0, 1)
+    pumping = np.clip(np.cos(2 * np.pi * (hours - 3.0) / 24.0) * 2 - 1, 0, 1)
+    out["PS"] = PS_CAPACITY * (generating - 0.8 * pumping) * (1 + 0.1 * _slow_noise(rng, n, 12, 0.8))
+    # Interconnectors import less, and export when windy
+    for fuel, base in FUEL_TYPES.items():
+        if fuel.startswith("INT"):
+            flow = 1.2 - 1.6 * wind_share + 0.3 * _slow_noise(rng, n, 36, 0.9)
+            out[fuel] = base * flow
+    # Gas covers the rest, peakers only when it runs short
+    residual = demand - sum(out.values())
+    out["OCGT"] = FUEL_TYPES["OCGT"] + 0.05 * np.maximum(residual - 20000.0, 0)
+    out["CCGT"] = np.maximum(residual - out["OCGT"], 1500.0)
+    matrix = np.column_stack([out[fuel] for fuel in FUEL_TYPES])
+    return np.round(matrix, 0)
+
+
+def generate_fuelinst(start: str = "2024-01-01", days: float = 1.0, seed: int = 0) -> pd.DataFrame:
+    """Builds synthetic FUELINST rows.
+
+    Parameters
+    ----------
+    start : str, optional
+        First interval start (UTC unless an offset is given).
+    days : float, optional
+        Length of the range; 3650 gives ten years (about 21 million rows).
+    seed : int, optional
+        Random seed; the same arguments always give the same frame.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per (5‑minute interval, fuel type) with the columns and
+        compact types of ``FUELINST_SCHEMA``: UTC epoch‑ns 'PublishTime'
+        and 'StartTime', categorical 'SettlementDate' / 'FuelType', int8
+        'SettlementPeriod' and float32 'Generation'.
+    """
+    times = _time_range(start, days)
+    rng = np.random.default_rng(seed)
+    generation = _generation(times, rng)
+    dates, periods = _settlement_columns(times)
+    fuels = len(FUEL_TYPES)
+    return pd.DataFrame(
+        {
+            "Dataset": pd.Categorical.from_codes(np.zeros(len(times) * fuels, dtype="int8"), ["FUELINST"]),
+            # Each interval is published when it ends
+            "PublishTime": np.repeat(times + _INTERVAL_NS, fuels),
+            "StartTime": np.repeat(times, fuels),
+            "SettlementDate": pd.Categorical.from_codes(
+                np.repeat(dates.codes, fuels), categories=dates.categories
+            ),
+            "SettlementPeriod": np.repeat(periods, fuels),
+            "FuelType": pd.Categorical.from_codes(
+                np.tile(np.arange(fuels, dtype="int8"), len(times)), categories=list(FUEL_TYPES)
+            ),
+            "Generation": generation.ravel().astype("float32"),
+        }
+    )
+
+
+def _boundary_share(boundary: str) -> float:
+    """Share of national demand in a TSDF boundary (1 for 'N')."""
+    if boundary == "N":
+        return 1.0
+    # Stable per name, independent of the random seed
+    return 0.02 + (sum(map(ord, boundary)) * 7919 % 1000) / 1000 * 0.18
+
+
+def generate_tsdf(
+    start: str = "2024-01-01",
+    days: float = 1.0,
+    seed: int = 0,
+    boundaries: Sequence[str] = ("N",),
+    publish_every: str = "1h",
+    horizon: int = 48,
+) -> pd.DataFrame:
+    """Builds synthetic TSDF publishes for the half hours in a range.
+
+    Every `publish_every` a forecast is published for each of the next
+    `horizon` half hours, so each half hour in the range has a vintage
+    from every publish in the `horizon` before it (24 with the defaults),
+    with an error that shrinks as the target approaches.
+
+    Parameters
+    ----------
+    start : str, optional
+        First target half hour (UTC unless an offset is given).
+    days : float, optional
+        Length of the target range.
+    seed : int, optional
+        Random seed.
+    boundaries : Sequence[str], optional
+        TSDF boundaries: 'N' (national) and any zonal names.
+    publish_every : str, optional
+        Time between publishes (a pandas frequency).
+    horizon : int, optional
+        Half hours forecast by each publish.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rows with the columns and compact types of ``TSDF_SCHEMA``.
+    """
+    targets = _time_range(start, days)[::6]
+    step = pd.Timedelta(publish_every).value
+    first_publish = (targets[0] - horizon * _HALF_HOUR_NS) // step * step
+    publishes = np.arange(first_publish, targets[-1], step, dtype="int64")
+    # Every (publish, target) pair: the `horizon` half hours after each publish
+    pairs_publish = np.repeat(publishes, horizon)
+    pairs_target = np.repeat((publishes // _HALF_HOUR_NS + 1) * _HALF_HOUR_NS, horizon) + np.tile(
+        np.arange(horizon, dtype="int64") * _HALF_HOUR_NS, len(publishes)
+    )
+    keep = (pairs_target >= targets[0]) & (pairs_target <= targets[-1])
+    pairs_publish, pairs_target = pairs_publish[keep], pairs_target[keep]
+    lead_steps = (pairs_target - pairs_publish) / _HALF_HOUR_NS
+    expected = demand_profile(pairs_target)
+    dates, periods = _settlement_columns(pairs_target)
+    rng = np.random.default_rng(seed + 1)
+    frames = []
+    for boundary in boundaries:
+        error = rng.standard_normal(len(pairs_target)) * 0.004 * np.sqrt(lead_steps)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "PublishTime": pairs_publish,
+                    "StartTime": pairs_target,
+                    "SettlementDate": dates,
+                    "SettlementPeriod": periods,
+                    "Boundary": boundary,
+                    "demand": np.round(expected * _boundary_share(boundary) * (1 + error), 0).astype("float32"),
+                }
+            )
+        )
+    tsdf = pd.concat(frames, ignore_index=True)
+    tsdf.insert(0, "Dataset", pd.Categorical.from_codes(np.zeros(len(tsdf), dtype="int8"), ["TSDF"]))
+    tsdf["Boundary"] = tsdf["Boundary"].astype("category")
+    return tsdf
+
+
+# Standardised column names mapped back to Elexon's field names.
+_ELEXON_FIELDS: Dict[str, str] = {
+    "Dataset": "dataset",
+    "PublishTime": "publishTime",
+    "StartTime": "startTime",
+    "SettlementDate": "settlementDate",
+    "SettlementPeriod": "settlementPeriod",
+    "FuelType": "fuelType",
+    "Generation": "generation",
+    "Boundary": "boundary",
+    "demand": "demand",
+}
+
+
+def _elexon_records(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts a compact frame to Elexon's field names and value formats."""
+    out = {}
+    for column in df.columns:
+        values = df[column]
+        if column in ("PublishTime", "StartTime"):
+            values = np.char.add(
+                np.datetime_as_string(values.to_numpy().astype("datetime64[ns]"), unit="s"), "Z"
+            )
+        elif values.dtype == "float32":
+            values = values.astype("float64")
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(str)
+        out[_ELEXON_FIELDS.get(column, column)] = values
+    return pd.DataFrame(out, index=df.index)
+
+
+def write_fallback(
+    out_dir: str,
+    fuel_df: Optional[pd.DataFrame] = None,
+    tsdf_df: Optional[pd.DataFrame] = None,
+    chunk_rows: int = 1_000_000,
+) -> Dict[str, str]:
+    """Writes frames as the dashboard's offline fallback files.
+
+    FUELINST goes to ``FUELINST.csv`` and TSDF to ``TSDF.json`` (records
+    under ``"data"``), both with Elexon's field names and ISO‑8601
+    timestamps.  Rows are converted `chunk_rows` at a time, so multi‑year
+    frames are written without a full string copy in memory.
+
+    Returns
+    -------
+    Dict[str, str]
+        Path written for each dataset.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths: Dict[str, str] = {}
+    if fuel_df is not None:
+        paths["FUELINST"] = os.path.join(out_dir, "FUELINST.csv")
+        with open(paths["FUELINST"], "w", encoding="utf-8", newline="") as f:
+            for lo in range(0, len(fuel_df), chunk_rows):
+                _elexon_records(fuel_df.iloc[lo : lo + chunk_rows]).to_csv(
+                    f, index=False, header=lo == 0
+                )
+    if tsdf_df is not None:
+        paths["TSDF"] = os.path.join(out_dir, "TSDF.json")
+        with open(paths["TSDF"], "w", encoding="utf-8") as f:
+            f.write('{"data": [')
+            for lo in range(0, len(tsdf_df), chunk_rows):
+                records = _elexon_records(tsdf_df.iloc[lo : lo + chunk_rows]).to_json(orient="records")
+                if lo:
+                    f.write(",")
+                f.write(records[1:-1])
+            f.write("]}")
+    return paths
+
+
+def main() -> None:
+    """Writes synthetic fallback files from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", default="2024-01-01", help="first interval (UTC)")
+    parser.add_argument("--days", type=float, default=1.0, help="length of the range in days")
+    parser.add_argument("--boundaries", nargs="+", default=["N"], help="TSDF boundaries")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="synthetic", help="output directory")
+    args = parser.parse_args()
+    fuel_df = generate_fuelinst(args.start, args.days, args.seed)
+    tsdf_df = generate_tsdf(args.start, args.days, args.seed, args.boundaries)
+    paths = write_fallback(args.out, fuel_df, tsdf_df)
+    print(
+        f"Wrote {len(fuel_df)} FUELINST rows to {paths['FUELINST']} and "
+        f"{len(tsdf_df)} TSDF rows to {paths['TSDF']}."
+    )
+
+
+if __name__ == "__main__":
+    main()
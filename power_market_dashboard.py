@@ -7,42 +7,530 @@ using open data published by Elexon (BMRS).  It downloads recent
 generation out‑turn by fuel type (`FUELINST`) and total system demand
 forecast (`TSDF`) from the Insights Solution API, cleans and aggregates
 the data, estimates carbon intensity based on typical emissions factors,
-and serves a simple Dash application with two interactive charts.
+and serves a Dash application with three interactive charts: generation
+mix, carbon intensity and supply minus forecast demand.
 
 **Usage:**
 
-    python power_market_dashboard.py
+    python power_market_dashboard.py [--refresh SECONDS] [--boundary B]
+    python power_market_dashboard.py --store DIR --start 2024-01-01 --end 2024-02-01
+    python power_market_dashboard.py --store DIR backfill --start 2024-01-01 --end 2024-02-01
 
 Then open the provided local URL (e.g. http://127.0.0.1:8050) in your
 browser to explore the dashboard.  The script does not require an
-Elexon API key but relies on public dataset endpoints.
+Elexon API key but relies on public dataset endpoints; ``--api-url``
+points it at another server, such as the offline stand‑in in
+``elexon_standin.py``.
 
 **Key features:**
 * Fetches instantaneous generation out‑turn and demand forecast data
-  directly from Elexon's API.
+  directly from Elexon's API over a pooled session, revalidating
+  against an on‑disk cache and decoding replies into compact typed
+  columns as they stream in.
 * Categorises generation into Gas, Biomass, Nuclear, Wind, Hydro,
   Imports and Coal/Oil/Other.
 * Estimates carbon intensity using emissions factors taken from
-  National Grid’s methodology【294358803913953†L240-L246】.
-* Presents an interactive stacked area chart for generation mix and a
-  line chart for carbon intensity using Plotly.
+  National Grid’s methodology【294358803913953†L240-L246】, for any number
+  of factor scenarios at once.
+* Keeps data in in‑memory stores (`FuelinstStore`, `TsdfStore` and
+  `ForecastVintageStore`, which tracks forecast error by lead time) and
+  updates results one batch at a time with `IncrementalProcessor`.
+* Refreshes data in the background; open pages receive only the new
+  points as patches, and zooming re‑queries a rollup at the resolution
+  of the visible range.
+* ``backfill`` downloads a historical date range in parallel, resumably
+  and within a request rate limit; ``--store`` keeps data in a Parquet
+  store partitioned by settlement date and serves stored windows.
 
-Note: Running this script requires `dash`, `pandas`, `plotly` and
-`requests`.  Install missing packages with `pip install dash pandas plotly
-requests`.
+Note: Running this script requires `dash`, `pandas`, `numpy`, `plotly`
+and `requests`.  Install missing packages with `pip install dash pandas
+numpy plotly requests`.  Two optional packages are used when present:
+`pyarrow` for the columnar store (``--store``) and `orjson` for faster
+decoding of dataset payloads.
 """
 
+import argparse
+import bisect
+import contextlib
 import datetime as _dt
-from typing import Tuple, Dict
+import hashlib
+import operator
+import threading
+import time
+import tracemalloc
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Tuple, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import requests  # type: ignore
 import json as _json  # used for fallback parsing
 import os  # used to locate fallback files
+from requests.adapters import HTTPAdapter  # type: ignore
 
 # Plotly and Dash imports
-import plotly.express as px  # type: ignore
-from dash import Dash, dcc, html  # type: ignore
+import flask  # type: ignore
+import plotly.graph_objects as go  # type: ignore
+from plotly.io.json import to_json_plotly  # type: ignore
+from dash import Dash, Input, Output, Patch, State, ctx, dcc, html, no_update  # type: ignore
+from dash.exceptions import PreventUpdate  # type: ignore
+
+try:  # optional: faster decoding of dataset payloads
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: only needed for the columnar store
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    pa = pq = None
+
+
+# Root of the Insights Solution API; every dataset lives under /datasets/.
+# Override with the ELEXON_API_URL environment variable or --api-url, e.g.
+# to point at the local stand-in server in elexon_standin.py.
+ELEXON_API_URL = os.environ.get("ELEXON_API_URL", "https://data.elexon.co.uk/bmrs/api/v1").rstrip("/")
+# (connect, read) timeouts in seconds for every Elexon request.
+REQUEST_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+# Keep-alive connections held open per host by the shared session.
+POOL_MAXSIZE = 8
+
+# On-disk cache of dataset bodies and their ETag/Last-Modified validators.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".elexon_cache")
+HTTP_CACHE_ENABLED = True
+# Status of a conditional request answered from the cache; nothing changed.
+NOT_MODIFIED = "HTTP 304"
+
+# Elexon camelCase field names mapped to the column names used here.
+FUELINST_COLUMNS: Dict[str, str] = {
+    "dataset": "Dataset",
+    "publishTime": "PublishTime",
+    "startTime": "StartTime",
+    "settlementDate": "SettlementDate",
+    "settlementPeriod": "SettlementPeriod",
+    "fuelType": "FuelType",
+    "generation": "Generation",
+}
+TSDF_COLUMNS: Dict[str, str] = {
+    "dataset": "Dataset",
+    "publishTime": "PublishTime",
+    "startTime": "StartTime",
+    "settlementDate": "SettlementDate",
+    "settlementPeriod": "SettlementPeriod",
+    "boundary": "Boundary",
+}
+
+# Compact column types applied at ingestion.  'epoch_ns' stores UTC
+# timestamps as int64 nanoseconds since the epoch.
+FUELINST_SCHEMA: Dict[str, str] = {
+    "Dataset": "category",
+    "PublishTime": "epoch_ns",
+    "StartTime": "epoch_ns",
+    "SettlementDate": "category",
+    "SettlementPeriod": "int8",
+    "FuelType": "category",
+    "Generation": "float32",
+}
+TSDF_SCHEMA: Dict[str, str] = {
+    "Dataset": "category",
+    "PublishTime": "epoch_ns",
+    "StartTime": "epoch_ns",
+    "SettlementDate": "category",
+    "SettlementPeriod": "int8",
+    "Boundary": "category",
+    "demand": "float32",
+}
+
+# Column renames and schema applied while decoding each dataset.
+_DATASET_FORMATS: Dict[str, Tuple[Dict[str, str], Dict[str, str]]] = {
+    "FUELINST": (FUELINST_COLUMNS, FUELINST_SCHEMA),
+    "TSDF": (TSDF_COLUMNS, TSDF_SCHEMA),
+}
+
+# TSDF boundary of the national demand forecast; the others are zonal.
+NATIONAL_BOUNDARY = "N"
+
+# Columns that identify one observation; later publishes replace earlier ones.
+DATASET_KEYS: Dict[str, List[str]] = {
+    "FUELINST": ["StartTime", "FuelType"],
+    "TSDF": ["StartTime", "Boundary", "PublishTime"],
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# Conditional-request counters; a hit is a 304 that reused the cached frame.
+_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "bytes_saved": 0}
+_cache_lock = threading.Lock()
+# Parsed frames for cached bodies, keyed like the on-disk entries.
+_frame_cache: Dict[str, pd.DataFrame] = {}
+
+
+def get_session() -> requests.Session:
+    """Returns the module‑wide HTTP session used by all dataset fetchers.
+
+    The session is created lazily on first use.  It keeps a pool of
+    keep‑alive connections so repeated refreshes reuse the same TLS
+    connection, and advertises gzip support so Elexon can compress the
+    (highly repetitive) JSON payloads.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "User-Agent": "Mozilla/5.0 (compatible; PowerMarketDashboard/1.0)",
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                }
+            )
+            _session = session
+        return _session
+
+
+def _request_dataset(
+    dataset: str,
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+) -> Tuple[Optional[requests.Response], str]:
+    """Requests a dataset through the shared session.
+
+    Network errors and timeouts are not raised; instead the response is
+    ``None`` and the second element describes what went wrong so callers
+    can fall back to local files with a useful message.
+
+    Parameters
+    ----------
+    dataset : str
+        Dataset name, e.g. 'FUELINST' or 'TSDF'.
+    params : Dict[str, str] | None, optional
+        Query string parameters to send with the request.
+    headers : Dict[str, str] | None, optional
+        Extra request headers (e.g. conditional‑request validators).
+    stream : bool, optional
+        Defer downloading the body so it can be consumed incrementally.
+
+    Returns
+    -------
+    Tuple[requests.Response | None, str]
+        The response (if any) and a short status description.
+    """
+    url = f"{ELEXON_API_URL}/datasets/{dataset}"
+    try:
+        response = get_session().get(
+            url, params=params, headers=headers, timeout=REQUEST_TIMEOUT, stream=stream
+        )
+    except requests.RequestException as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+    return response, f"HTTP {response.status_code}"
+
+
+def cache_stats() -> Dict[str, int]:
+    """Returns a snapshot of the conditional‑request cache counters.
+
+    ``hits`` counts 304 replies served from the cache, ``misses`` counts
+    full 200 downloads and ``bytes_saved`` totals the body sizes that did
+    not need to be transferred or decoded again.
+    """
+    with _cache_lock:
+        return dict(_cache_stats)
+
+
+def _cache_paths(dataset: str, params: Optional[Dict[str, str]]) -> Tuple[str, str]:
+    """Returns the (metadata, body) cache file paths for a request."""
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    key = hashlib.sha1(f"{ELEXON_API_URL}/{dataset}?{query}".encode()).hexdigest()[:16]
+    base = os.path.join(CACHE_DIR, f"{dataset}-{key}")
+    return base + ".meta.json", base + ".body.json"
+
+
+# Rows decoded into Python lists before being packed into typed arrays.
+STREAM_CHUNK_ROWS = 50_000
+# Bytes requested per read while streaming a response body.
+STREAM_READ_BYTES = 1 << 16
+
+
+class _ColumnBuffers:
+    """Accumulates decoded records column by column in typed arrays.
+
+    Records are buffered as per‑column Python lists for at most
+    `STREAM_CHUNK_ROWS` rows; each full buffer is packed into NumPy arrays
+    following `schema` (categoricals as integer codes against a running
+    category table), so memory stays close to the final typed frame.
+    Each decoded batch is split into columns with one pass per field and
+    each buffer is packed with vectorised pandas calls; on a 34 MB
+    FUELINST payload this decodes in about 0.5 s at 25 MB peak, against
+    0.85 s and 176 MB for ``response.json()`` plus a DataFrame.
+    """
+
+    def __init__(self, columns: Dict[str, str], schema: Dict[str, str]) -> None:
+        self.columns = columns
+        self.schema = schema
+        self._pending: Dict[str, list] = {}
+        self._parts: Dict[str, List[np.ndarray]] = {}
+        self._categories: Dict[str, Dict[object, int]] = {}
+        self._rows = 0
+        self._pending_rows = 0
+
+    def extend(self, records: List[dict]) -> None:
+        if not records:
+            return
+        columns = None
+        keys = dict.fromkeys(records[0])
+        if set(map(len, records)) == {len(keys)}:
+            # Records of equal size that all hold the first record's keys
+            # share its fields exactly, so each column is one C‑level pass.
+            try:
+                columns = {k: list(map(operator.itemgetter(k), records)) for k in keys}
+            except KeyError:
+                pass
+        if columns is None:
+            for record in records:
+                keys.update(dict.fromkeys(record))
+            columns = {k: [record.get(k) for record in records] for k in keys}
+        for key, values in self._pending.items():
+            values.extend(columns.pop(key, None) or [None] * len(records))
+        for key, values in columns.items():
+            # Field first seen now: earlier rows of this chunk lack it.
+            self._pending[key] = [None] * self._pending_rows + values
+            self._parts.setdefault(key, [])
+        self._pending_rows += len(records)
+        if self._pending_rows >= STREAM_CHUNK_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        for key, values in self._pending.items():
+            missing = self._rows - sum(len(part) for part in self._parts[key])
+            if missing:
+                self._parts[key].append(self._pack(key, [None] * missing))
+            self._parts[key].append(self._pack(key, values))
+            values.clear()
+        self._rows += self._pending_rows
+        self._pending_rows = 0
+
+    def _pack(self, key: str, values: list) -> np.ndarray:
+        dtype = self.schema.get(self.columns.get(key, key))
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        if dtype == "epoch_ns":
+            return _epoch_ns(pd.Series(column))
+        if dtype == "category":
+            table = self._categories.setdefault(key, {})
+            codes, uniques = pd.factorize(column)
+            # Map this chunk's few distinct labels onto the running table.
+            lookup = np.array(
+                [table.setdefault(v, len(table)) for v in uniques] + [-1],
+                dtype=np.int32,
+            )
+            return lookup[codes]
+        if dtype is not None:
+            return pd.to_numeric(column).astype(dtype)
+        return column
+
+    def frame(self) -> pd.DataFrame:
+        """Returns the decoded rows with renamed, schema‑typed columns."""
+        self._flush()
+        data: Dict[str, object] = {}
+        for key, parts in self._parts.items():
+            values = np.concatenate(parts) if parts else np.array([], dtype=object)
+            if key in self._categories:
+                values = pd.Categorical.from_codes(
+                    values, categories=pd.Index(list(self._categories[key]), dtype=object)
+                )
+            data[self.columns.get(key, key)] = values
+        return pd.DataFrame(data)
+
+
+def _iter_record_batches(chunks: Iterator[bytes]) -> Iterator[List[dict]]:
+    """Decodes the ``data`` array of a dataset payload incrementally.
+
+    Complete records are cut from the byte stream at ``},`` boundaries
+    and decoded a batch at a time (with orjson when it is installed); a
+    cut that lands inside a string simply fails to parse and is retried
+    once more bytes arrive.  The final batch is decoded with the stdlib
+    decoder so that trailing keys after the array are ignored.
+    """
+    loads = orjson.loads if orjson is not None else _json.loads
+    buf = b""
+    start = -1
+    for chunk in chunks:
+        buf += chunk
+        if start < 0:
+            head = buf.lstrip()
+            if head.startswith(b"["):
+                start = len(buf) - len(head) + 1
+            else:
+                key = buf.find(b'"data"')
+                bracket = buf.find(b"[", key) if key >= 0 else -1
+                if bracket < 0:
+                    continue
+                start = bracket + 1
+        cut = buf.rfind(b"},", start)
+        if cut < 0:
+            continue
+        try:
+            records = loads(b"[" + buf[start : cut + 1] + b"]")
+        except ValueError:
+            continue
+        yield records
+        buf, start = buf[cut + 2 :], 0
+    if start < 0:
+        # No array found: the whole body is a single JSON document.
+        payload = _json.loads(buf.decode("utf-8")) if buf.strip() else []
+        yield payload.get("data", []) if isinstance(payload, dict) else payload
+        return
+    tail, _ = _json.JSONDecoder().raw_decode("[" + buf[start:].decode("utf-8"))
+    yield tail
+
+
+def _stream_frame(chunks: Iterator[bytes], dataset: str) -> pd.DataFrame:
+    """Decodes a dataset payload from byte chunks into a typed frame.
+
+    Columns are renamed and typed as the fetchers do (see
+    `FUELINST_COLUMNS` / `FUELINST_SCHEMA` and their TSDF counterparts);
+    other datasets keep Elexon's names and inferred types.
+    """
+    columns, schema = _DATASET_FORMATS.get(dataset, ({}, {}))
+    buffers = _ColumnBuffers(columns, schema)
+    for records in _iter_record_batches(chunks):
+        buffers.extend(records)
+    return buffers.frame()
+
+
+def _file_chunks(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(STREAM_READ_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _tee_chunks(chunks: Iterator[bytes], sink: "object") -> Iterator[bytes]:
+    """Yields `chunks` unchanged while writing each one to `sink`."""
+    for chunk in chunks:
+        sink.write(chunk)
+        yield chunk
+
+
+def _fetch_dataset(
+    dataset: str, params: Optional[Dict[str, str]] = None, use_cache: bool = True
+) -> Tuple[Optional[pd.DataFrame], str]:
+    """Downloads a dataset, revalidating against the on‑disk cache.
+
+    When a cached body exists its ETag / Last‑Modified validators are sent
+    with the request.  A 304 reply skips both the JSON decode and the
+    DataFrame construction and returns a copy of the last parsed frame;
+    a 200 reply is decoded incrementally into typed columns as it streams
+    in (see `_stream_frame`) and, if it carries validators, written back
+    to the cache at the same time.
+
+    Parameters
+    ----------
+    dataset : str
+        Dataset name, e.g. 'FUELINST' or 'TSDF'.
+    params : Dict[str, str] | None, optional
+        Query string parameters to send with the request.
+    use_cache : bool, optional
+        Set to False for one‑off queries (e.g. moving time windows) that
+        would only fill the cache with entries never requested again.
+
+    Returns
+    -------
+    Tuple[pandas.DataFrame | None, str]
+        The records frame, renamed and typed by `_stream_frame`, or
+        ``None`` if the request failed, and a short status description.
+    """
+    use_cache = use_cache and HTTP_CACHE_ENABLED
+    meta_path, body_path = _cache_paths(dataset, params)
+    meta: Dict[str, object] = {}
+    headers: Dict[str, str] = {}
+    if use_cache and os.path.exists(meta_path) and os.path.exists(body_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = _json.load(f)
+        if meta.get("etag"):
+            headers["If-None-Match"] = str(meta["etag"])
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = str(meta["last_modified"])
+    response, status = _request_dataset(dataset, params, headers or None, stream=True)
+    if response is None:
+        return None, status
+    with response:
+        if response.status_code == 304 and meta:
+            with _cache_lock:
+                _cache_stats["hits"] += 1
+                _cache_stats["bytes_saved"] += int(meta.get("size", 0))
+                cached = _frame_cache.get(body_path)
+            if cached is None:
+                # First hit since start-up: decode the stored body once.
+                cached = _stream_frame(_file_chunks(body_path), dataset)
+                with _cache_lock:
+                    _frame_cache[body_path] = cached
+            return cached.copy(), status
+        if response.status_code != 200:
+            return None, status
+        chunks = response.iter_content(chunk_size=STREAM_READ_BYTES)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (use_cache and (etag or last_modified)):
+            df = _stream_frame(chunks, dataset)
+        else:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Stream the body to a temporary file while decoding it, then
+            # swap it in so a crash never leaves a torn entry.
+            with open(body_path + ".tmp", "wb") as f:
+                df = _stream_frame(_tee_chunks(chunks, f), dataset)
+                size = f.tell()
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+                _json.dump({"etag": etag, "last_modified": last_modified, "size": size}, f)
+            os.replace(body_path + ".tmp", body_path)
+            os.replace(meta_path + ".tmp", meta_path)
+            with _cache_lock:
+                _frame_cache[body_path] = df.copy()
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+    return df, status
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """Returns `df` with the compact column types of `schema` applied.
+
+    Columns missing from `df` are ignored and columns not named in the
+    schema are passed through unchanged.  Timestamps (strings or
+    datetimes) become int64 UTC epoch nanoseconds.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame with standardised column names.
+    schema : Dict[str, str]
+        Column to dtype mapping, e.g. `FUELINST_SCHEMA`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A new frame; `df` itself is not modified.
+    """
+    columns: Dict[str, object] = {}
+    for col in df.columns:
+        dtype = schema.get(col)
+        values = df[col]
+        if dtype is None or values.dtype == dtype:
+            columns[col] = values
+        elif dtype == "epoch_ns":
+            columns[col] = pd.Series(_epoch_ns(values), index=values.index)
+        elif dtype == "category":
+            columns[col] = values.astype("category")
+        else:
+            columns[col] = pd.to_numeric(values).astype(dtype)
+    return pd.DataFrame(columns, index=df.index)
 
 
 def fetch_fuelinst_data() -> pd.DataFrame:
@@ -50,25 +538,23 @@ def fetch_fuelinst_data() -> pd.DataFrame:
     from Elexon's Insights Solution API.
 
     The endpoint returns data for the most recently published 5‑minute
-    intervals.  If the request fails, a ValueError is raised.
+    intervals.  The request goes through the shared session returned by
+    `get_session()`, is bounded by `REQUEST_TIMEOUT` and is revalidated
+    against the on‑disk cache (see `_fetch_dataset`).  If the request
+    fails and no local fallback exists, a ValueError is raised.
 
     Returns
     -------
     pandas.DataFrame
-        A DataFrame with columns including 'dataset', 'publishTime',
-        'startTime', 'settlementDate', 'settlementPeriod', 'fuelType'
-        and 'generation'.
+        A DataFrame with columns including 'Dataset', 'PublishTime',
+        'StartTime', 'SettlementDate', 'SettlementPeriod', 'FuelType'
+        and 'Generation', typed according to `FUELINST_SCHEMA`.
     """
-    url = "https://data.elexon.co.uk/bmrs/api/v1/datasets/FUELINST"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; PowerMarketDashboard/1.0)"
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        data = response.json().get("data", [])
-        if not data:
+    fetched, status = _fetch_dataset("FUELINST")
+    if fetched is not None:
+        if fetched.empty:
             raise ValueError("No FUELINST data returned from API.")
-        df = pd.DataFrame(data)
+        df = fetched
     else:
         # Attempt to use local fallback file if API call fails
         fallback_path = os.path.join(os.path.dirname(__file__), "FUELINST.csv")
@@ -76,21 +562,12 @@ def fetch_fuelinst_data() -> pd.DataFrame:
             df = pd.read_csv(fallback_path)
         else:
             raise ValueError(
-                f"Failed to fetch FUELINST data (HTTP {response.status_code}) and no local fallback available."
+                f"Failed to fetch FUELINST data ({status}) and no local fallback available."
             )
     # Standardise column names
-    df.rename(
-        columns={
-            "dataset": "Dataset",
-            "publishTime": "PublishTime",
-            "startTime": "StartTime",
-            "settlementDate": "SettlementDate",
-            "settlementPeriod": "SettlementPeriod",
-            "fuelType": "FuelType",
-            "generation": "Generation",
-        },
-        inplace=True,
-    )
+    df = apply_schema(df.rename(columns=FUELINST_COLUMNS), FUELINST_SCHEMA)
+    if DATA_STORE is not None and fetched is not None and status != NOT_MODIFIED:
+        DATA_STORE.write("FUELINST", df)
     return df
 
 
@@ -99,25 +576,23 @@ def fetch_tsdf_data() -> pd.DataFrame:
     Insights Solution API.
 
     The endpoint returns half‑hourly demand forecasts for the upcoming
-    periods.  If the request fails, a ValueError is raised.
+    periods.  The request goes through the shared session returned by
+    `get_session()`, is bounded by `REQUEST_TIMEOUT` and is revalidated
+    against the on‑disk cache (see `_fetch_dataset`).  If the request
+    fails and no local fallback exists, a ValueError is raised.
 
     Returns
     -------
     pandas.DataFrame
-        A DataFrame with columns including 'dataset', 'demand',
-        'publishTime', 'startTime', 'settlementDate', 'settlementPeriod'
-        and 'boundary'.
+        A DataFrame with columns including 'Dataset', 'demand',
+        'PublishTime', 'StartTime', 'SettlementDate', 'SettlementPeriod'
+        and 'Boundary', typed according to `TSDF_SCHEMA`.
     """
-    url = "https://data.elexon.co.uk/bmrs/api/v1/datasets/TSDF"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; PowerMarketDashboard/1.0)"
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        data = response.json().get("data", [])
-        if not data:
+    fetched, status = _fetch_dataset("TSDF")
+    if fetched is not None:
+        if fetched.empty:
             raise ValueError("No TSDF data returned from API.")
-        df = pd.DataFrame(data)
+        df = fetched
     else:
         fallback_path = os.path.join(os.path.dirname(__file__), "TSDF.json")
         if os.path.exists(fallback_path):
@@ -130,55 +605,726 @@ def fetch_tsdf_data() -> pd.DataFrame:
             df = pd.DataFrame(fallback_data)
         else:
             raise ValueError(
-                f"Failed to fetch TSDF data (HTTP {response.status_code}) and no local fallback available."
+                f"Failed to fetch TSDF data ({status}) and no local fallback available."
             )
     # Standardise column names
-    df.rename(
-        columns={
-            "dataset": "Dataset",
-            "publishTime": "PublishTime",
-            "startTime": "StartTime",
-            "settlementDate": "SettlementDate",
-            "settlementPeriod": "SettlementPeriod",
-            "boundary": "Boundary",
-        },
-        inplace=True,
-    )
+    df = apply_schema(df.rename(columns=TSDF_COLUMNS), TSDF_SCHEMA)
+    if DATA_STORE is not None and fetched is not None and status != NOT_MODIFIED:
+        DATA_STORE.write("TSDF", df)
     return df
 
 
-def _categorise_fuel_types(fuel_type: str) -> str:
-    """Maps raw fuel type identifiers into broader categories.
+def fetch_all_data() -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, float]]:
+    """Fetches the FUELINST and TSDF datasets concurrently.
+
+    Both requests are issued from a small thread pool so that start‑up
+    waits for the slower of the two round trips rather than their sum.
+    Any exception raised by either fetcher is propagated to the caller.
+
+    Returns
+    -------
+    Tuple[pandas.DataFrame, pandas.DataFrame, Dict[str, float]]
+        The FUELINST frame, the TSDF frame and a mapping of dataset name
+        to wall‑clock fetch time in seconds.
+    """
+    fetchers = {
+        "FUELINST": fetch_fuelinst_data,
+        "TSDF": fetch_tsdf_data,
+    }
+    timings: Dict[str, float] = {}
+
+    def _timed(name: str) -> pd.DataFrame:
+        start = time.perf_counter()
+        try:
+            return fetchers[name]()
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+        futures = {name: pool.submit(_timed, name) for name in fetchers}
+        frames = {name: future.result() for name, future in futures.items()}
+    return frames["FUELINST"], frames["TSDF"], timings
+
+
+def _epoch_ns(values: pd.Series) -> np.ndarray:
+    """Converts timestamps to UTC epoch nanoseconds (NaT becomes the int64
+    minimum, as in `DatetimeIndex.asi8`)."""
+    codes, utc = _time_codes(values)
+    return np.append(utc.asi8, np.iinfo(np.int64).min)[codes]
+
+
+def _utc_timestamp(value: object) -> pd.Timestamp:
+    """Parses `value` as a timestamp, treating naive values as UTC."""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _iso_utc(ts: pd.Timestamp) -> str:
+    """Formats a timestamp the way Elexon's query parameters expect."""
+    return ts.tz_convert("UTC").strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FuelinstStore:
+    """In‑memory FUELINST store deduplicated on (StartTime, FuelType).
+
+    Rows are held in a dictionary keyed on the interval start (as epoch
+    nanoseconds) and fuel type, so an upsert costs time proportional to
+    the size of the incoming batch rather than the rows already held.
+    The interval starts held are also kept sorted, so `trim` finds the
+    rows to drop by bisection instead of scanning every key.
+    When the same key is published more than once, the row with the
+    latest `PublishTime` wins.
+
+    Attributes
+    ----------
+    last_publish_time : pandas.Timestamp | None
+        Newest `PublishTime` ingested so far.
+    last_start_time : pandas.Timestamp | None
+        Newest `StartTime` ingested so far.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[Tuple[int, str], Tuple[int, tuple]] = {}
+        # Sorted interval starts held, and the fuel types held for each.
+        self._starts: List[int] = []
+        self._fuels: Dict[int, List[str]] = {}
+        self._columns: List[str] = []
+        self._lock = threading.Lock()
+        self.last_publish_time: Optional[pd.Timestamp] = None
+        self.last_start_time: Optional[pd.Timestamp] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def upsert(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Inserts new rows and replaces rows superseded by a later publish.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            FUELINST rows with standardised column names.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The subset of `df` that was new or revised; re‑published rows
+            that are already held unchanged are dropped.
+        """
+        if df.empty:
+            return df
+        publish = _epoch_ns(df["PublishTime"])
+        start = _epoch_ns(df["StartTime"])
+        fuels = df["FuelType"].tolist()
+        with self._lock:
+            if not self._columns:
+                self._columns = list(df.columns)
+            records = list(
+                df.reindex(columns=self._columns).itertuples(index=False, name=None)
+            )
+            changed: List[int] = []
+            for i, key in enumerate(zip(start.tolist(), fuels)):
+                current = self._rows.get(key)
+                if current is None or publish[i] > current[0]:
+                    if current is None:
+                        self._add_key(*key)
+                    self._rows[key] = (int(publish[i]), records[i])
+                    changed.append(i)
+            newest_publish = pd.Timestamp(publish.max(), tz="UTC")
+            newest_start = pd.Timestamp(start.max(), tz="UTC")
+            if self.last_publish_time is None or newest_publish > self.last_publish_time:
+                self.last_publish_time = newest_publish
+            if self.last_start_time is None or newest_start > self.last_start_time:
+                self.last_start_time = newest_start
+        return df.iloc[changed]
+
+    def trim(self, before: pd.Timestamp) -> int:
+        """Drops rows whose `StartTime` is earlier than `before`.
+
+        Returns
+        -------
+        int
+            Number of rows removed.
+        """
+        cutoff = _utc_timestamp(before).value
+        removed = 0
+        with self._lock:
+            stale = bisect.bisect_left(self._starts, cutoff)
+            for start in self._starts[:stale]:
+                for fuel in self._fuels.pop(start):
+                    del self._rows[(start, fuel)]
+                    removed += 1
+            del self._starts[:stale]
+        return removed
+
+    def _add_key(self, start: int, fuel: str) -> None:
+        fuels = self._fuels.get(start)
+        if fuels is None:
+            fuels = self._fuels[start] = []
+            # New intervals normally arrive last, where insort is cheap.
+            bisect.insort(self._starts, start)
+        fuels.append(fuel)
+
+    def frame(self) -> pd.DataFrame:
+        """Returns the stored rows as a FUELINST frame ordered by key."""
+        with self._lock:
+            keys = sorted(self._rows)
+            records = [self._rows[key][1] for key in keys]
+            columns = list(self._columns)
+        return apply_schema(
+            pd.DataFrame.from_records(records, columns=columns), FUELINST_SCHEMA
+        )
+
+
+# Process-wide store fed by `fetch_fuelinst_incremental`.
+FUELINST_STORE = FuelinstStore()
+
+
+def fetch_fuelinst_incremental(store: Optional[FuelinstStore] = None) -> pd.DataFrame:
+    """Fetches only FUELINST rows published since the last ingest.
+
+    On the first call (empty store) the full recent window is fetched via
+    `fetch_fuelinst_data`.  Afterwards the request is restricted with
+    ``publishDateTimeFrom``/``publishDateTimeTo`` to publishes at or after
+    the store's `last_publish_time`, and the reply is upserted into the
+    store so poll cost scales with the number of new rows.  New and
+    revised rows are also written through to `DATA_STORE`, if configured.
 
     Parameters
     ----------
-    fuel_type : str
-        Raw fuel type name from FUELINST (e.g. 'CCGT', 'INTELEC').
+    store : FuelinstStore | None, optional
+        Store to update; defaults to the module‑wide `FUELINST_STORE`.
 
     Returns
     -------
-    str
-        High‑level category name.
+    pandas.DataFrame
+        Rows that were new or revised by this poll (possibly empty).
     """
-    category_map: Dict[str, str] = {
-        # Gas generation (combined and open cycle)
-        "CCGT": "Gas",
-        "OCGT": "Gas",
-        # Biomass
-        "BIOMASS": "Biomass",
-        # Fossil/other
-        "COAL": "Coal/Oil/Other",
-        "OIL": "Coal/Oil/Other",
-        "OTHER": "Coal/Oil/Other",
-        # Nuclear
-        "NUCLEAR": "Nuclear",
-        # Wind
-        "WIND": "Wind",
-        # Hydro and pumped storage
-        "NPSHYD": "Hydro",
-        "PS": "Hydro",
+    store = FUELINST_STORE if store is None else store
+    if store.last_publish_time is None:
+        return store.upsert(fetch_fuelinst_data())
+    params = {
+        "publishDateTimeFrom": _iso_utc(store.last_publish_time),
+        "publishDateTimeTo": _iso_utc(pd.Timestamp.now(tz="UTC")),
     }
-    interconnectors = {
+    fetched, status = _fetch_dataset("FUELINST", params, use_cache=False)
+    if fetched is None:
+        raise ValueError(f"Failed to fetch incremental FUELINST data ({status}).")
+    changed = store.upsert(fetched)
+    if DATA_STORE is not None:
+        DATA_STORE.write("FUELINST", changed)
+    return changed
+
+
+class TsdfStore:
+    """Latest TSDF demand forecast per (Boundary, settlement period).
+
+    Forecasts are held in one dictionary per boundary, keyed on the packed
+    settlement key (see `_settlement_keys`) and holding the publish time
+    and demand of the newest forecast.  An upsert first keeps only the
+    newest publish of each key within the batch, then costs one lookup
+    per remaining key, so ingesting every publish never re‑sorts the
+    history already held.  National and zonal forecasts never collide.
+
+    Attributes
+    ----------
+    last_publish_time : pandas.Timestamp | None
+        Newest `PublishTime` ingested so far.
+    """
+
+    def __init__(self) -> None:
+        self._latest: Dict[str, Dict[int, Tuple[int, float]]] = {}
+        self._lock = threading.Lock()
+        self.last_publish_time: Optional[pd.Timestamp] = None
+
+    def __len__(self) -> int:
+        return sum(len(held) for held in self._latest.values())
+
+    def boundaries(self) -> List[str]:
+        """Returns the boundaries held, in sorted order."""
+        return sorted(self._latest)
+
+    def upsert(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keeps each forecast that is newer than the one held for its key.
+
+        Frames without a `Boundary` column are taken to be national
+        (`NATIONAL_BOUNDARY`).
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            TSDF rows with standardised column names.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The rows of `df` that replaced or added a forecast.
+        """
+        if df.empty:
+            return df
+        keys = _settlement_keys(df)
+        publish = _epoch_ns(df["PublishTime"])
+        if "Boundary" in df:
+            boundary_codes, boundaries = pd.factorize(df["Boundary"])
+        else:
+            boundary_codes = np.zeros(len(df), dtype=np.intp)
+            boundaries = pd.Index([NATIONAL_BOUNDARY])
+        rows = _latest_rows(keys, publish, boundary_codes)
+        demand = df["demand"].to_numpy(dtype="float64", na_value=np.nan)
+        changed: List[int] = []
+        with self._lock:
+            for i, code, key, pub, value in zip(
+                rows.tolist(), boundary_codes[rows].tolist(), keys[rows].tolist(),
+                publish[rows].tolist(), demand[rows].tolist(),
+            ):
+                held = self._latest.setdefault(str(boundaries[code]), {})
+                current = held.get(key)
+                if current is None or (pub >= current[0] and (pub, value) != current):
+                    held[key] = (pub, value)
+                    changed.append(i)
+            newest = pd.Timestamp(publish.max(), tz="UTC")
+            if self.last_publish_time is None or newest > self.last_publish_time:
+                self.last_publish_time = newest
+        return df.iloc[sorted(changed)]
+
+    def forecasts(self, boundary: str = NATIONAL_BOUNDARY) -> Mapping[int, Tuple[int, float]]:
+        """Read‑only view of one boundary's (publish ns, demand) by settlement key."""
+        return MappingProxyType(self._latest.get(boundary, {}))
+
+    def trim(self, before: pd.Timestamp) -> int:
+        """Drops forecasts for settlement periods starting before `before`.
+
+        Returns
+        -------
+        int
+            Number of forecasts removed.
+        """
+        cutoff = _utc_timestamp(before).value
+        removed = 0
+        with self._lock:
+            for held in self._latest.values():
+                for key in _keys_before(held, cutoff):
+                    del held[key]
+                    removed += 1
+        return removed
+
+    def frame(self, boundary: Optional[str] = None) -> pd.DataFrame:
+        """Returns the latest forecasts, for one boundary or all of them.
+
+        Returns
+        -------
+        pandas.DataFrame
+            'Boundary', 'SettlementDate', 'SettlementPeriod',
+            'LocalHalfHour', 'PublishTime' (epoch ns) and 'DemandForecast',
+            ordered by boundary and settlement period.
+        """
+        with self._lock:
+            names = [boundary] if boundary is not None else sorted(self._latest) or [NATIONAL_BOUNDARY]
+            parts = [(name, sorted(self._latest.get(name, {}).items())) for name in names]
+        frames = []
+        for name, items in parts:
+            keys = np.array([key for key, _ in items], dtype="int64")
+            days, periods = np.divmod(keys, _SETTLEMENT_STRIDE)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "Boundary": name,
+                        "SettlementDate": pd.DatetimeIndex(days * _DAY_NS).date,
+                        "SettlementPeriod": periods.astype("int8"),
+                        "LocalHalfHour": _settlement_starts(keys).rename(None),
+                        "PublishTime": np.array([pub for _, (pub, _) in items], dtype="int64"),
+                        "DemandForecast": np.array([value for _, (_, value) in items], dtype="float64"),
+                    }
+                )
+            )
+        return pd.concat(frames, ignore_index=True)
+
+
+class ColumnarStore:
+    """Parquet store for FUELINST and TSDF partitioned by settlement date.
+
+    Each dataset lives under ``<root>/<DATASET>/SettlementDate=YYYY-MM-DD/``
+    with one ``part.parquet`` file per partition.  Columns are written
+    with explicit types (UTC timestamps, integer periods, float values and
+    dictionary‑encoded strings) so reads skip all string parsing, and a
+    windowed read only opens the partitions that can overlap the window.
+
+    Requires the optional `pyarrow` dependency.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding the store; created on first write.
+    """
+
+    def __init__(self, root: str) -> None:
+        if pq is None:
+            raise ImportError(
+                "The columnar store requires pyarrow; install it with `pip install pyarrow`."
+            )
+        self.root = root
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _typed(df: pd.DataFrame) -> pd.DataFrame:
+        """Returns a copy of `df` with the store's column types applied."""
+        out = df.copy()
+        for col in ("StartTime", "PublishTime"):
+            if col in out:
+                out[col] = pd.to_datetime(out[col], utc=True)
+        if "SettlementDate" in out:
+            out["SettlementDate"] = pd.to_datetime(out["SettlementDate"]).dt.date
+        if "SettlementPeriod" in out:
+            out["SettlementPeriod"] = pd.to_numeric(out["SettlementPeriod"]).astype("int8")
+        for col in ("Generation", "demand"):
+            if col in out:
+                out[col] = pd.to_numeric(out[col]).astype("float32")
+        for col in ("Dataset", "FuelType", "Boundary"):
+            if col in out:
+                out[col] = out[col].astype("category")
+        return out
+
+    def _partition_path(self, dataset: str, day: _dt.date) -> str:
+        return os.path.join(
+            self.root, dataset, f"SettlementDate={day.isoformat()}", "part.parquet"
+        )
+
+    def partitions(self, dataset: str) -> List[_dt.date]:
+        """Returns the settlement dates stored for `dataset`, ascending."""
+        base = os.path.join(self.root, dataset)
+        if not os.path.isdir(base):
+            return []
+        return sorted(
+            _dt.date.fromisoformat(name.split("=", 1)[1])
+            for name in os.listdir(base)
+            if name.startswith("SettlementDate=")
+        )
+
+    def write(self, dataset: str, df: pd.DataFrame) -> int:
+        """Upserts rows into their settlement‑date partitions.
+
+        Rows already stored under the same key (see `DATASET_KEYS`) are
+        replaced by the incoming row with the latest `PublishTime`.
+
+        Returns
+        -------
+        int
+            Number of partitions rewritten.
+        """
+        if df.empty:
+            return 0
+        typed = self._typed(df)
+        keys = DATASET_KEYS[dataset]
+        written = 0
+        with self._lock:
+            for day, part in typed.groupby("SettlementDate", sort=True, observed=True):
+                path = self._partition_path(dataset, day)
+                if os.path.exists(path):
+                    existing = pq.read_table(path).to_pandas()
+                    part = pd.concat([existing, part], ignore_index=True)
+                part = (
+                    part.sort_values("PublishTime", kind="stable")
+                    .drop_duplicates(keys, keep="last")
+                    .sort_values(keys)
+                )
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                table = pa.Table.from_pandas(self._typed(part), preserve_index=False)
+                pq.write_table(table, path + ".tmp")
+                os.replace(path + ".tmp", path)
+                written += 1
+        return written
+
+    def read(
+        self,
+        dataset: str,
+        start: Optional[object] = None,
+        end: Optional[object] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Reads the rows whose `StartTime` falls in ``[start, end)``.
+
+        Only partitions whose settlement date is within a day of the
+        window are opened; settlement dates are local (Europe/London) so
+        the window is widened by one day before filtering on `StartTime`.
+
+        Parameters
+        ----------
+        dataset : str
+            'FUELINST' or 'TSDF'.
+        start, end : optional
+            Window bounds (UTC when naive); either may be omitted.
+        columns : List[str] | None, optional
+            Subset of columns to load.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Typed rows ordered by partition; empty if nothing matches.
+        """
+        lo = _utc_timestamp(start) if start is not None else None
+        hi = _utc_timestamp(end) if end is not None else None
+        days = [
+            day
+            for day in self.partitions(dataset)
+            if (lo is None or day >= (lo - pd.Timedelta(days=1)).date())
+            and (hi is None or day <= (hi + pd.Timedelta(days=1)).date())
+        ]
+        if columns is not None and "StartTime" not in columns:
+            columns = list(columns) + ["StartTime"]
+        frames = [
+            pq.read_table(self._partition_path(dataset, day), columns=columns).to_pandas()
+            for day in days
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        df = pd.concat(frames, ignore_index=True)
+        mask = pd.Series(True, index=df.index)
+        if lo is not None:
+            mask &= df["StartTime"] >= lo
+        if hi is not None:
+            mask &= df["StartTime"] < hi
+        return df[mask].reset_index(drop=True)
+
+    def load_window(
+        self, start: Optional[object] = None, end: Optional[object] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Returns the (FUELINST, TSDF) frames for a window in the ingestion
+        schema, ready for `process_data`."""
+        return (
+            apply_schema(self.read("FUELINST", start, end), FUELINST_SCHEMA),
+            apply_schema(self.read("TSDF", start, end), TSDF_SCHEMA),
+        )
+
+
+# Store that `fetch_*` and `backfill` write through to, if configured.
+DATA_STORE: Optional[ColumnarStore] = None
+
+
+class TokenBucket:
+    """Thread‑safe token bucket limiting the rate of outgoing requests.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second (sustained requests per second).
+    capacity : int, optional
+        Maximum burst size; defaults to one second's worth of tokens.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and consumes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _date_chunks(
+    start: pd.Timestamp, end: pd.Timestamp, chunk: pd.Timedelta
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Splits ``[start, end)`` into consecutive half‑open chunks."""
+    bounds = list(pd.date_range(start, end, freq=chunk))
+    if not bounds or bounds[-1] < end:
+        bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _chunk_key(dataset: str, lo: pd.Timestamp, hi: pd.Timestamp) -> str:
+    """Checkpoint entry of one fetched chunk: ``DATASET:start/end``."""
+    return f"{dataset}:{_iso_utc(lo)}/{_iso_utc(hi)}"
+
+
+def _completed_ranges(done: set, dataset: str) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Merges the checkpointed chunks of `dataset` into disjoint ranges.
+
+    Entries without an end (written before chunk ends were recorded) are
+    ignored, so their chunks are fetched again.
+    """
+    spans = sorted(
+        (_utc_timestamp(lo), _utc_timestamp(hi))
+        for name, _, span in (key.partition(":") for key in done)
+        if name == dataset and "/" in span
+        for lo, hi in [span.split("/", 1)]
+    )
+    merged: List[Tuple[pd.Timestamp, pd.Timestamp]] = []
+    for lo, hi in spans:
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def backfill(
+    start: str,
+    end: str,
+    out_dir: str,
+    datasets: Sequence[str] = ("FUELINST", "TSDF"),
+    chunk_days: float = 1.0,
+    max_workers: int = 4,
+    rate: float = 4.0,
+) -> Dict[str, int]:
+    """Downloads a historical date range in parallel, resumable chunks.
+
+    The range is split into chunks of `chunk_days`; each (dataset, chunk)
+    pair is fetched on a bounded thread pool, with every request gated by
+    a shared `TokenBucket`.  Completed chunks are written to `out_dir` and
+    their start and end recorded in ``checkpoint.json`` there, so
+    re‑running after an interruption, even with another `chunk_days`,
+    only fetches chunks not already covered by completed ones.
+    When `DATA_STORE` is set, chunks are written to it instead of to
+    CSV/JSON files.
+
+    Parameters
+    ----------
+    start, end : str
+        Range to backfill (UTC, anything `pandas.Timestamp` accepts).
+        `end` is exclusive.
+    out_dir : str
+        Directory for chunk files and the checkpoint.
+    datasets : Sequence[str], optional
+        Datasets to fetch, by default FUELINST and TSDF.
+    chunk_days : float, optional
+        Length of each chunk in days.
+    max_workers : int, optional
+        Maximum number of requests in flight.
+    rate : float, optional
+        Maximum sustained requests per second.
+
+    Returns
+    -------
+    Dict[str, int]
+        Counts of chunks ``fetched``, ``skipped`` (already checkpointed)
+        and ``failed``.
+    """
+    start_ts, end_ts = _utc_timestamp(start), _utc_timestamp(end)
+    if end_ts <= start_ts:
+        raise ValueError("Backfill end must be after start.")
+    os.makedirs(out_dir, exist_ok=True)
+    checkpoint_path = os.path.join(out_dir, "checkpoint.json")
+    done: set = set()
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            done = set(_json.load(f).get("completed", []))
+    chunks = _date_chunks(start_ts, end_ts, pd.Timedelta(days=chunk_days))
+    tasks = []
+    for dataset in datasets:
+        completed = _completed_ranges(done, dataset)
+        tasks += [
+            (dataset, lo, hi)
+            for lo, hi in chunks
+            if not any(a <= lo and hi <= b for a, b in completed)
+        ]
+    summary = {"fetched": 0, "skipped": len(datasets) * len(chunks) - len(tasks), "failed": 0}
+    bucket = TokenBucket(rate)
+    lock = threading.Lock()
+
+    def _run(dataset: str, lo: pd.Timestamp, hi: pd.Timestamp) -> None:
+        bucket.acquire()
+        params = {
+            "publishDateTimeFrom": _iso_utc(lo),
+            # The API treats both bounds as inclusive; stop just short of
+            # the next chunk so neighbouring chunks never overlap.
+            "publishDateTimeTo": _iso_utc(hi - pd.Timedelta(seconds=1)),
+        }
+        fetched, status = _fetch_dataset(dataset, params, use_cache=False)
+        if fetched is None:
+            raise ValueError(f"{dataset} {_iso_utc(lo)}: {status}")
+        _write_chunk(fetched, out_dir, dataset, lo)
+        with lock:
+            done.add(_chunk_key(dataset, lo, hi))
+            with open(checkpoint_path + ".tmp", "w", encoding="utf-8") as f:
+                _json.dump({"completed": sorted(done)}, f)
+            os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_run, *task) for task in tasks]
+        for future in futures:
+            try:
+                future.result()
+                summary["fetched"] += 1
+            except Exception as exc:  # keep going; the chunk stays pending
+                summary["failed"] += 1
+                print(f"Backfill chunk failed: {exc}")
+    return summary
+
+
+def _fallback_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Undoes the compact ingestion types for the CSV/JSON fallback files.
+
+    Epoch‑nanosecond timestamps become ISO‑8601 UTC strings and float32
+    values are widened through their shortest decimal form, so a file
+    holds ``24166.666`` rather than ``24166.666015625``.
+    """
+    schema = {**FUELINST_SCHEMA, **TSDF_SCHEMA}
+    columns: Dict[str, object] = {}
+    for col in df.columns:
+        values = df[col]
+        if schema.get(col) == "epoch_ns" and pd.api.types.is_integer_dtype(values.dtype):
+            values = pd.to_datetime(values, unit="ns", utc=True).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        elif values.dtype == "float32":
+            values = values.astype(str).astype("float64")
+        columns[col] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _write_chunk(df: pd.DataFrame, out_dir: str, dataset: str, lo: pd.Timestamp) -> None:
+    """Writes one backfilled chunk to `DATA_STORE`, or in the fallback
+    file format when no store is configured."""
+    if DATA_STORE is not None:
+        DATA_STORE.write(dataset, df)
+        return
+    df = _fallback_values(df)
+    stem = os.path.join(out_dir, f"{dataset}_{lo.strftime('%Y%m%dT%H%MZ')}")
+    if dataset == "FUELINST":
+        df.to_csv(stem + ".csv.tmp", index=False)
+        os.replace(stem + ".csv.tmp", stem + ".csv")
+    else:
+        with open(stem + ".json.tmp", "w", encoding="utf-8") as f:
+            _json.dump({"data": df.to_dict(orient="records")}, f)
+        os.replace(stem + ".json.tmp", stem + ".json")
+
+
+# High-level generation categories, in plotting order.
+CATEGORIES: List[str] = [
+    "Gas", "Biomass", "Nuclear", "Wind", "Hydro", "Imports", "Coal/Oil/Other",
+]
+FUEL_CATEGORY_MAP: Dict[str, str] = {
+    # Gas generation (combined and open cycle)
+    "CCGT": "Gas",
+    "OCGT": "Gas",
+    # Biomass
+    "BIOMASS": "Biomass",
+    # Fossil/other
+    "COAL": "Coal/Oil/Other",
+    "OIL": "Coal/Oil/Other",
+    "OTHER": "Coal/Oil/Other",
+    # Nuclear
+    "NUCLEAR": "Nuclear",
+    # Wind
+    "WIND": "Wind",
+    # Hydro and pumped storage
+    "NPSHYD": "Hydro",
+    "PS": "Hydro",
+}
+INTERCONNECTORS = frozenset(
+    {
         "INTELEC",
         "INTEW",
         "INTFR",
@@ -190,194 +1336,2139 @@ def _categorise_fuel_types(fuel_type: str) -> str:
         "INTNSL",
         "INTVKL",
     }
-    if fuel_type in category_map:
-        return category_map[fuel_type]
-    if fuel_type in interconnectors:
+)
+# Fuel types seen in the data that are in neither table above.
+UNSEEN_FUEL_TYPES: set = set()
+
+# Emission factors (g/kWh) by category
+EMISSION_FACTORS: Dict[str, float] = {
+    "Gas": 329.4,        # 0.3294 t/MWh -> 329.4 g/kWh【294358803913953†L240-L246】
+    "Biomass": 120.0,    # 0.12 t/MWh -> 120 g/kWh【294358803913953†L240-L246】
+    "Coal/Oil/Other": 675.0,  # approximate using oil factor【294358803913953†L240-L246】
+    "Nuclear": 0.0,
+    "Wind": 0.0,
+    "Hydro": 0.0,
+    "Imports": 329.4,   # assume gas‑like mix for imports
+}
+# Approximate average intensity (g/kWh) of the grid at the far end of each
+# interconnector; illustrative only.
+INTERCONNECTOR_FACTORS: Dict[str, float] = {
+    "INTFR": 56.0,      # France
+    "INTIFA2": 56.0,    # France
+    "INTELEC": 56.0,    # France (ElecLink)
+    "INTNED": 474.0,    # Netherlands
+    "INTNEM": 179.0,    # Belgium
+    "INTIRL": 458.0,    # Northern Ireland / Ireland
+    "INTEW": 458.0,     # Ireland
+    "INTGRNL": 458.0,   # Ireland
+    "INTNSL": 24.0,     # Norway
+    "INTVKL": 180.0,    # Denmark
+}
+DEFAULT_SCENARIO = "NationalGrid"
+# Emission factor sets evaluated together by `carbon_intensity`.  Keys may
+# be categories or raw fuel types; a fuel type entry overrides its category.
+EMISSION_SCENARIOS: Dict[str, Dict[str, float]] = {
+    DEFAULT_SCENARIO: EMISSION_FACTORS,
+    "InterconnectorImports": {**EMISSION_FACTORS, **INTERCONNECTOR_FACTORS},
+    "Lower": {cat: ef * 0.9 for cat, ef in EMISSION_FACTORS.items()},
+    "Upper": {cat: ef * 1.1 for cat, ef in EMISSION_FACTORS.items()},
+}
+
+
+def _categorise_fuel_types(fuel_type: str) -> str:
+    """Maps raw fuel type identifiers into broader categories.
+
+    Parameters
+    ----------
+    fuel_type : str
+        Raw fuel type name from FUELINST (e.g. 'CCGT', 'INTELEC').
+
+    Returns
+    -------
+    str
+        High‑level category name.
+    """
+    if fuel_type in FUEL_CATEGORY_MAP:
+        return FUEL_CATEGORY_MAP[fuel_type]
+    if fuel_type in INTERCONNECTORS:
+        return "Imports"
+    # Elexon names every interconnector INT*, so treat new ones as imports
+    if isinstance(fuel_type, str) and fuel_type.startswith("INT"):
         return "Imports"
     # Fallback: lump any unknown category into 'Other'
     return "Coal/Oil/Other"
 
 
-def process_data(
-    fuel_df: pd.DataFrame, tsdf_df: pd.DataFrame
-) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Cleans and aggregates the downloaded datasets.
-
-    The processing pipeline performs the following steps:
+def categorise_fuel_types(fuel_types: pd.Series) -> pd.Series:
+    """Vectorised version of `_categorise_fuel_types` for a whole column.
 
-    * Convert timestamps to timezone‑aware datetimes (Europe/London).
-    * Clip negative generation values (e.g. pumped storage consumption) to zero.
-    * Categorise fuel types into broader groups.
-    * Aggregate instantaneous generation into a pivot table for plotting.
-    * Estimate carbon intensity (gCO₂/kWh) at each timestamp using
-      default emissions factors【294358803913953†L240-L246】.
-    * Aggregate half‑hourly total generation and merge with demand forecasts
-      for potential supply‑vs‑demand analysis.
+    The column is factorised so the category lookup runs once per
+    distinct fuel code (about twenty) rather than once per row, and the
+    result is broadcast back as a categorical with `CATEGORIES` as its
+    categories.  Codes missing from `FUEL_CATEGORY_MAP` and
+    `INTERCONNECTORS` are reported with a warning the first time they
+    are seen and recorded in `UNSEEN_FUEL_TYPES`.
 
     Parameters
     ----------
-    fuel_df : pandas.DataFrame
-        Raw FUELINST data returned by `fetch_fuelinst_data()`.
-    tsdf_df : pandas.DataFrame
-        Raw TSDF data returned by `fetch_tsdf_data()`.
+    fuel_types : pandas.Series
+        Raw `FuelType` column.
 
     Returns
     -------
-    Tuple[pandas.DataFrame, pandas.DataFrame, pandas.DataFrame]
-        1. A pivoted DataFrame indexed by local time with columns for
-           each fuel category and additional 'TotalGeneration' and
-           'CarbonIntensity'.
-        2. A long‑format DataFrame for the stacked area chart.
-        3. A merged DataFrame containing half‑hourly total generation and
-           demand values (may be empty if periods do not overlap).
-    """
-    # Convert StartTime to datetime
-    fuel_df["StartTime"] = pd.to_datetime(fuel_df["StartTime"], utc=True)
-    # Create local time column
-    fuel_df["LocalTime"] = fuel_df["StartTime"].dt.tz_convert("Europe/London")
-    # Clip negative generation
-    fuel_df["Generation_clipped"] = fuel_df["Generation"].clip(lower=0)
-    # Categorise fuel types
-    fuel_df["Category"] = fuel_df["FuelType"].apply(_categorise_fuel_types)
-    # Pivot table by 5‑minute intervals
-    pivot = fuel_df.pivot_table(
-        index="LocalTime",
-        columns="Category",
-        values="Generation_clipped",
-        aggfunc="sum",
-    ).fillna(0)
-    # Ensure all expected columns exist
-    for col in ["Gas", "Biomass", "Nuclear", "Wind", "Hydro", "Imports", "Coal/Oil/Other"]:
-        if col not in pivot.columns:
-            pivot[col] = 0.0
-    # Total generation
-    pivot["TotalGeneration"] = pivot[[
-        "Gas", "Biomass", "Nuclear", "Wind", "Hydro", "Imports", "Coal/Oil/Other",
-    ]].sum(axis=1)
-    # Emission factors (g/kWh)
-    emission_factors: Dict[str, float] = {
-        "Gas": 329.4,        # 0.3294 t/MWh -> 329.4 g/kWh【294358803913953†L240-L246】
-        "Biomass": 120.0,    # 0.12 t/MWh -> 120 g/kWh【294358803913953†L240-L246】
-        "Coal/Oil/Other": 675.0,  # approximate using oil factor【294358803913953†L240-L246】
-        "Nuclear": 0.0,
-        "Wind": 0.0,
-        "Hydro": 0.0,
-        "Imports": 329.4,   # assume gas‑like mix for imports
-    }
-    # Calculate carbon intensity
-    ci_numerator = pd.Series(0.0, index=pivot.index)
-    for cat, ef in emission_factors.items():
-        ci_numerator += pivot[cat] * ef
-    pivot["CarbonIntensity"] = ci_numerator / pivot["TotalGeneration"].replace(0, pd.NA)
-    # Long format for stacked area
-    area_df = pivot[
-        ["Gas", "Biomass", "Nuclear", "Wind", "Hydro", "Imports", "Coal/Oil/Other"]
-    ].reset_index().melt(id_vars="LocalTime", var_name="Category", value_name="Generation")
-    # Prepare demand merge (half‑hour resolution)
-    fuel_df["LocalHalfHour"] = fuel_df["LocalTime"].dt.floor("30min")
-    half_hour_gen = (
-        fuel_df.groupby("LocalHalfHour")["Generation_clipped"].sum().reset_index()
-    )
-    # TSDF local time
-    tsdf_df["StartTime"] = pd.to_datetime(tsdf_df["StartTime"], utc=True)
-    tsdf_df["LocalTime"] = tsdf_df["StartTime"].dt.tz_convert("Europe/London")
-    tsdf_df["LocalHalfHour"] = tsdf_df["LocalTime"].dt.floor("30min")
-    # Use latest demand per half‑hour window (greatest publish time)
-    latest_tsdf = (
-        tsdf_df.sort_values("PublishTime").groupby("LocalHalfHour").tail(1)
-    )
-    demand_merge = pd.merge(
-        latest_tsdf[["LocalHalfHour", "demand"]],
-        half_hour_gen,
-        on="LocalHalfHour",
-        how="inner",
+    pandas.Series
+        Categorical series named 'Category', aligned with `fuel_types`.
+    """
+    codes, uniques = pd.factorize(fuel_types)
+    # One extra slot so missing values (code -1) land in Coal/Oil/Other.
+    lookup = np.full(len(uniques) + 1, CATEGORIES.index("Coal/Oil/Other"), dtype=np.int8)
+    for i, fuel in enumerate(uniques):
+        lookup[i] = CATEGORIES.index(_categorise_fuel_types(fuel))
+        if fuel not in FUEL_CATEGORY_MAP and fuel not in INTERCONNECTORS:
+            if fuel not in UNSEEN_FUEL_TYPES:
+                UNSEEN_FUEL_TYPES.add(fuel)
+                warnings.warn(
+                    f"Unrecognised fuel type {fuel!r} categorised as "
+                    f"{_categorise_fuel_types(fuel)!r}.",
+                    stacklevel=2,
+                )
+    return pd.Series(
+        pd.Categorical.from_codes(lookup[codes], categories=CATEGORIES),
+        index=fuel_types.index,
+        name="Category",
     )
-    demand_merge.rename(
-        columns={
-            "Generation_clipped": "TotalGeneration",
-            "demand": "DemandForecast",
-        },
-        inplace=True,
+
+
+def _time_codes(values: pd.Series) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """Factorises a timestamp column into codes and sorted UTC uniques.
+
+    FUELINST repeats each 5‑minute `StartTime` for every fuel type, so only
+    the distinct values are parsed (with an explicit ISO‑8601 format).
+    Codes are renumbered so that they follow chronological order; missing
+    values get code -1.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        ISO‑8601 strings, datetimes or int64 epoch nanoseconds.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, pandas.DatetimeIndex]
+        Per‑row codes and the sorted unique UTC timestamps they index.
+    """
+    codes, uniques = pd.factorize(values)
+    if isinstance(uniques, pd.DatetimeIndex):
+        utc = uniques.tz_localize("UTC") if uniques.tz is None else uniques.tz_convert("UTC")
+    elif pd.api.types.is_integer_dtype(uniques.dtype):
+        # int64 epoch nanoseconds, as produced by `apply_schema`
+        utc = pd.DatetimeIndex(pd.to_datetime(uniques, unit="ns", utc=True))
+    else:
+        utc = pd.DatetimeIndex(pd.to_datetime(uniques, format="ISO8601", utc=True))
+    order = np.argsort(utc.asi8, kind="stable")
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    codes = np.where(codes >= 0, rank[codes], -1)
+    return codes, utc[order]
+
+
+# Settlement periods are half hours counted from 1 at each Europe/London
+# midnight, so a settlement day has 46, 48 or 50 of them.  A (date, period)
+# pair is packed into one int64 as days since the epoch times
+# `_SETTLEMENT_STRIDE` plus the period, which sorts chronologically.
+_SETTLEMENT_STRIDE = 64
+_DAY_NS = 86_400 * 10**9
+_HALF_HOUR_NS = 1_800 * 10**9
+
+
+def settlement_periods(times: pd.DatetimeIndex) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """Returns the settlement date and period of each time.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Timezone‑aware times (naive values are taken as UTC).
+
+    Returns
+    -------
+    Tuple[pandas.DatetimeIndex, numpy.ndarray]
+        Naive settlement dates (at midnight) and int8 periods, so that
+        the clock‑change days run to 46 and 50 periods.
+    """
+    utc = times.tz_localize("UTC") if times.tz is None else times.tz_convert("UTC")
+    midnights = utc.tz_convert("Europe/London").normalize()
+    periods = (utc.asi8 - midnights.asi8) // _HALF_HOUR_NS + 1
+    return midnights.tz_localize(None), periods.astype("int8")
+
+
+def _settlement_keys(df: pd.DataFrame, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """Packs each row's (`SettlementDate`, `SettlementPeriod`) into an int64.
+
+    Only the distinct dates are parsed, and only the positions in `rows`
+    if given.  Frames without the two columns have them derived from
+    `StartTime`.  Rows with a missing date get -1.
+    """
+
+    def _column(name: str) -> pd.Series:
+        return df[name] if rows is None else df[name].iloc[rows]
+
+    if "SettlementDate" not in df or "SettlementPeriod" not in df:
+        codes, utc = _time_codes(_column("StartTime"))
+        dates, periods = settlement_periods(utc)
+        keys = dates.asi8 // _DAY_NS * _SETTLEMENT_STRIDE + periods
+        return np.append(keys, -1)[codes]
+    dates = _column("SettlementDate")
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        codes, uniques = dates.cat.codes.to_numpy(), dates.cat.categories
+    else:
+        codes, uniques = pd.factorize(dates)
+    days = pd.to_datetime(pd.Index(uniques).astype(str), format="ISO8601").asi8 // _DAY_NS
+    keys = np.append(days, 0)[codes] * _SETTLEMENT_STRIDE + _column("SettlementPeriod").to_numpy(
+        dtype="int64", na_value=0
     )
-    demand_merge["SupplyMinusDemand"] = (
-        demand_merge["TotalGeneration"] - demand_merge["DemandForecast"]
+    keys[codes < 0] = -1
+    return keys
+
+
+def _latest_rows(
+    keys: np.ndarray, publish: np.ndarray, groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Positions of the newest publish of each (group, key), in key order.
+
+    Rows with a negative key are skipped.
+    """
+    columns = (publish, keys) if groups is None else (publish, keys, groups)
+    order = np.lexsort(columns)
+    # The last row of each run of equal (group, key) has the newest publish
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = False
+    for column in columns[1:]:
+        ordered = column[order]
+        last[:-1] |= ordered[1:] != ordered[:-1]
+    return order[last & (keys[order] >= 0)]
+
+
+def _settlement_starts(keys: np.ndarray) -> pd.DatetimeIndex:
+    """Returns the local start time of each packed settlement key."""
+    days, periods = np.divmod(np.asarray(keys, dtype="int64"), _SETTLEMENT_STRIDE)
+    unique_days, day_codes = np.unique(days, return_inverse=True)
+    # GB clocks never change at midnight, so local midnights are unambiguous.
+    midnights = pd.DatetimeIndex(unique_days * _DAY_NS).tz_localize("Europe/London").asi8
+    return pd.DatetimeIndex(
+        midnights[day_codes] + (periods - 1) * _HALF_HOUR_NS, dtype="datetime64[ns, UTC]"
+    ).tz_convert("Europe/London")
+
+
+def _last_key_before(cutoff: int) -> int:
+    """Packed key of the last settlement period starting before `cutoff` (UTC ns).
+
+    Keys increase with time, so the periods starting before `cutoff` are
+    exactly the keys up to this one.
+    """
+    dates, periods = settlement_periods(pd.to_datetime([cutoff - 1], utc=True))
+    return int(dates.asi8[0] // _DAY_NS * _SETTLEMENT_STRIDE + periods[0])
+
+
+def _keys_before(held: Mapping[int, object], cutoff: int) -> List[int]:
+    """Settlement keys in `held` whose periods start before `cutoff` (UTC ns)."""
+    keys = np.fromiter(held, dtype="int64", count=len(held))
+    return keys[keys <= _last_key_before(cutoff)].tolist()
+
+
+def _supply_demand_frame(
+    keys: np.ndarray, demand: np.ndarray, generation: np.ndarray
+) -> pd.DataFrame:
+    """Builds the supply‑vs‑demand frame for sorted settlement keys.
+
+    Local half‑hour start times are attached here, for display only.
+    """
+    keys = np.asarray(keys, dtype="int64")
+    days, periods = np.divmod(keys, _SETTLEMENT_STRIDE)
+    unique_days, day_codes = np.unique(days, return_inverse=True)
+    return pd.DataFrame(
+        {
+            "SettlementDate": pd.DatetimeIndex(unique_days * _DAY_NS).date[day_codes],
+            "SettlementPeriod": periods.astype("int8"),
+            "LocalHalfHour": _settlement_starts(keys).rename(None),
+            "DemandForecast": demand,
+            "TotalGeneration": generation,
+            "SupplyMinusDemand": generation - demand,
+        }
     )
-    return pivot, area_df, demand_merge
 
 
-def create_dashboard(
-    area_df: pd.DataFrame,
-    pivot_df: pd.DataFrame,
-    demand_df: pd.DataFrame | None = None,
-) -> Dash:
-    """Creates a Dash application with interactive charts.
+def _dense_sum(
+    row_codes: np.ndarray, n_rows: int, col_codes: np.ndarray, n_cols: int, values: np.ndarray
+) -> np.ndarray:
+    """Sums `values` into an (n_rows × n_cols) matrix with one bincount.
+
+    Entries with a negative code or a NaN value are skipped.
+    """
+    valid = (row_codes >= 0) & (col_codes >= 0) & ~np.isnan(values)
+    flat = row_codes[valid].astype(np.int64) * n_cols + col_codes[valid]
+    return np.bincount(flat, weights=values[valid], minlength=n_rows * n_cols).reshape(
+        n_rows, n_cols
+    )
+
+
+def aggregate_generation(
+    time_codes: np.ndarray, times: pd.Index, groups: pd.Series, generation: np.ndarray
+) -> pd.DataFrame:
+    """Sums generation into a dense (timestamp × group) matrix.
+
+    This is the `process_data` pivot expressed as a single `np.bincount`
+    over flattened integer codes: the row codes index `times` and groups
+    are factorised in sorted order.  Rows with a missing time or value
+    are skipped, so the result matches ``pivot_table(aggfunc="sum")
+    .fillna(0)``.
 
     Parameters
     ----------
-    area_df : pandas.DataFrame
-        Long‑format data frame with generation values by category and
-        timestamp.
-    pivot_df : pandas.DataFrame
-        Pivot table containing carbon intensity and total generation.
-    demand_df : pandas.DataFrame | None, optional
-        Data frame with half‑hourly total generation, demand forecast and
-        supply minus demand.  If provided and non‑empty, an additional
-        line chart will be included showing the supply‑demand balance.
+    time_codes : numpy.ndarray
+        Position of each row's timestamp in `times` (-1 if missing), as
+        returned by `_time_codes`.
+    times : pandas.Index
+        Row labels of the result, e.g. local 5‑minute starts.
+    groups : pandas.Series
+        Column label of each row, e.g. `FuelType`.
+    generation : numpy.ndarray
+        Values to sum.
 
     Returns
     -------
-    dash.Dash
-        A Dash app ready to be served.
+    pandas.DataFrame
+        Frame indexed by `times`, with one float column per group.
     """
-    app = Dash(__name__)
-    # Stacked area chart (generation mix)
-    area_fig = px.area(
-        area_df,
-        x="LocalTime",
-        y="Generation",
-        color="Category",
-        title="Generation Mix by Fuel Category",
-        labels={
-            "LocalTime": "Time (Europe/London)",
-            "Generation": "Generation (MW)",
-        },
+    group_codes, labels = pd.factorize(groups, sort=True)
+    return pd.DataFrame(
+        _dense_sum(time_codes, len(times), group_codes, len(labels), generation),
+        index=times,
+        columns=pd.Index(labels, name=groups.name),
     )
-    area_fig.update_layout(legend_title_text="Category")
-    # Carbon intensity line chart
-    ci_fig = px.line(
-        pivot_df.reset_index(),
-        x="LocalTime",
-        y="CarbonIntensity",
-        title="Estimated Carbon Intensity",
-        labels={
-            "LocalTime": "Time (Europe/London)",
-            "CarbonIntensity": "Carbon Intensity (g/kWh)",
+
+
+def category_matrix(fuel_matrix: pd.DataFrame) -> pd.DataFrame:
+    """Collapses a (timestamp × fuel type) matrix into `CATEGORIES`.
+
+    The fuel type columns are categorised once and the collapse is a
+    product with the (fuel type × category) membership matrix.
+    """
+    codes = categorise_fuel_types(pd.Series(fuel_matrix.columns)).cat.codes.to_numpy()
+    membership = np.zeros((len(codes), len(CATEGORIES)))
+    membership[np.arange(len(codes)), codes] = 1.0
+    return pd.DataFrame(
+        fuel_matrix.to_numpy() @ membership,
+        index=fuel_matrix.index,
+        columns=pd.Index(CATEGORIES, name="Category"),
+    )
+
+
+def emission_factor_matrix(
+    fuel_types: Sequence[str], scenarios: Optional[Dict[str, Dict[str, float]]] = None
+) -> pd.DataFrame:
+    """Builds the (fuel type × scenario) emission factor matrix.
+
+    Each scenario maps categories and/or raw fuel types to factors in
+    g/kWh; a fuel type's own entry takes precedence over its category's,
+    and anything unmapped counts as zero.
+
+    Parameters
+    ----------
+    fuel_types : Sequence[str]
+        Row labels, usually the columns of a fuel type matrix.
+    scenarios : Dict[str, Dict[str, float]] | None, optional
+        Named factor sets; defaults to `EMISSION_SCENARIOS`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Factors indexed by fuel type with one column per scenario.
+    """
+    scenarios = EMISSION_SCENARIOS if scenarios is None else scenarios
+    categories = [_categorise_fuel_types(fuel) for fuel in fuel_types]
+    return pd.DataFrame(
+        {
+            name: [
+                factors.get(fuel, factors.get(cat, 0.0))
+                for fuel, cat in zip(fuel_types, categories)
+            ]
+            for name, factors in scenarios.items()
         },
+        index=pd.Index(fuel_types, name="FuelType"),
+        dtype="float64",
     )
-    # set y-axis range to add headroom
-    ci_max = pivot_df["CarbonIntensity"].max()
-    if pd.notna(ci_max) and ci_max > 0:
-        ci_fig.update_layout(yaxis_range=[0, ci_max * 1.1])
-    # Optionally create supply‑demand chart
-    charts = [dcc.Graph(figure=area_fig), dcc.Graph(figure=ci_fig)]
-    if demand_df is not None and not demand_df.empty:
-        sd_fig = px.line(
-            demand_df,
-            x="LocalHalfHour",
-            y="SupplyMinusDemand",
-            title="Supply Minus Demand (Half‑hourly)",
-            labels={
-                "LocalHalfHour": "Time (Europe/London)",
-                "SupplyMinusDemand": "Supply − Demand (MW)",
+
+
+def carbon_intensity(
+    fuel_matrix: pd.DataFrame, scenarios: Optional[Dict[str, Dict[str, float]]] = None
+) -> pd.DataFrame:
+    """Estimates carbon intensity for many emission factor sets at once.
+
+    Emissions for every timestamp and scenario come from one matrix
+    product of the (timestamp × fuel type) generation matrix with the
+    (fuel type × scenario) factor matrix, then are divided by total
+    generation.  Timestamps with zero generation get NaN.
+
+    Parameters
+    ----------
+    fuel_matrix : pandas.DataFrame
+        Generation by fuel type, as built by `aggregate_generation`.
+    scenarios : Dict[str, Dict[str, float]] | None, optional
+        Named factor sets; defaults to `EMISSION_SCENARIOS`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Carbon intensity (g/kWh) with one column per scenario.
+    """
+    factors = emission_factor_matrix(list(fuel_matrix.columns), scenarios)
+    generation = fuel_matrix.to_numpy()
+    total = generation.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ci = (generation @ factors.to_numpy()) / total[:, None]
+    ci[total == 0] = np.nan
+    return pd.DataFrame(ci, index=fuel_matrix.index, columns=factors.columns)
+
+
+class _StageProfiler:
+    """Records the peak `tracemalloc` memory of named processing stages.
+
+    Calling the profiler with a stage name returns a context manager.
+    When constructed with ``None`` it does nothing, so it can stay in the
+    processing code at no cost.
+    """
+
+    def __init__(self, results: Optional[Dict[str, float]]) -> None:
+        self.results = results
+
+    @contextlib.contextmanager
+    def __call__(self, name: str) -> Iterator[None]:
+        if self.results is None:
+            yield
+            return
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            self.results[name] = (tracemalloc.get_traced_memory()[1] - base) / 1e6
+            if started:
+                tracemalloc.stop()
+
+
+def enable_copy_on_write() -> None:
+    """Turns on pandas copy‑on‑write (always on from pandas 3.0).
+
+    Derived frames then share column buffers with their inputs instead of
+    copying them.  It changes pandas semantics process‑wide, so only the
+    entry points call it; importing this module leaves options untouched.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def _area_frame(pivot: pd.DataFrame) -> pd.DataFrame:
+    """Selects the category columns of a pivot, one stacked‑area trace each.
+
+    With copy‑on‑write (see `enable_copy_on_write`) the selection shares
+    the pivot's column buffers.
+    """
+    return pivot[CATEGORIES]
+
+
+def process_data(
+    fuel_df: pd.DataFrame,
+    tsdf_df: pd.DataFrame,
+    scenarios: Optional[Dict[str, Dict[str, float]]] = None,
+    profile: Optional[Dict[str, float]] = None,
+    boundary: str = NATIONAL_BOUNDARY,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Cleans and aggregates the downloaded datasets.
+
+    The input frames are never modified or widened; all derived values
+    are held in separate arrays, so calling the function twice on the
+    same frames is safe.  The processing pipeline performs the following
+    steps:
+
+    * Convert timestamps to timezone‑aware datetimes (Europe/London).
+    * Clip negative generation values (e.g. pumped storage consumption) to zero.
+    * Categorise fuel types into broader groups.
+    * Aggregate instantaneous generation into a pivot table for plotting.
+    * Estimate carbon intensity (gCO₂/kWh) at each timestamp using
+      default emissions factors【294358803913953†L240-L246】, plus any extra
+      emission factor scenarios, as one matrix product.
+    * Aggregate half‑hourly total generation and merge with demand forecasts
+      for potential supply‑vs‑demand analysis.  Both are keyed on
+      (`SettlementDate`, `SettlementPeriod`), so the 46‑ and 50‑period
+      clock‑change days need no local‑time flooring.
+
+    Parameters
+    ----------
+    fuel_df : pandas.DataFrame
+        Raw FUELINST data returned by `fetch_fuelinst_data()`.
+    tsdf_df : pandas.DataFrame
+        Raw TSDF data returned by `fetch_tsdf_data()`.
+    scenarios : Dict[str, Dict[str, float]] | None, optional
+        Extra emission factor sets (see `EMISSION_SCENARIOS`); each adds
+        a ``CarbonIntensity[<name>]`` column to the pivot.
+    profile : Dict[str, float] | None, optional
+        If given, filled with the peak traced memory (MB) of each stage
+        ('parse', 'aggregate', 'carbon_intensity', 'area', 'demand').
+    boundary : str, optional
+        TSDF `Boundary` whose forecasts are compared with generation;
+        national by default.  Frames without the column are taken to
+        hold that boundary only.
+
+    Returns
+    -------
+    Tuple[pandas.DataFrame, pandas.DataFrame, pandas.DataFrame]
+        1. A pivoted DataFrame indexed by local time with columns for
+           each fuel category and additional 'TotalGeneration' and
+           'CarbonIntensity' (plus one 'CarbonIntensity[<name>]' column
+           per extra scenario).
+        2. A wide DataFrame for the stacked area chart: generation by
+           category indexed by local time, one column per trace.
+        3. A merged DataFrame containing half‑hourly total generation and
+           demand values per settlement period, with its local start time
+           in 'LocalHalfHour' (may be empty if periods do not overlap).
+    """
+    stage = _StageProfiler(profile)
+    # Inputs are only read: derived columns live in local Series/arrays
+    with stage("parse"):
+        # Interval codes; only the unique StartTimes are parsed
+        time_codes, utc_times = _time_codes(fuel_df["StartTime"])
+        local_times = utc_times.tz_convert("Europe/London").rename("LocalTime")
+        # Clip negative generation
+        generation = np.clip(
+            fuel_df["Generation"].to_numpy(dtype="float64", na_value=np.nan), 0, None
+        )
+    with stage("aggregate"):
+        # Dense (5‑minute interval × fuel type) sums, collapsed to categories
+        fuel_matrix = aggregate_generation(time_codes, local_times, fuel_df["FuelType"], generation)
+        pivot = category_matrix(fuel_matrix)
+        # Total generation
+        pivot["TotalGeneration"] = pivot[CATEGORIES].sum(axis=1)
+    with stage("carbon_intensity"):
+        # Carbon intensity for the default factors plus any extra scenarios
+        ci = carbon_intensity(
+            fuel_matrix, {DEFAULT_SCENARIO: EMISSION_SCENARIOS[DEFAULT_SCENARIO], **(scenarios or {})}
+        )
+        pivot["CarbonIntensity"] = ci[DEFAULT_SCENARIO]
+        for name in scenarios or {}:
+            pivot[f"CarbonIntensity[{name}]"] = ci[name]
+    with stage("area"):
+        # Category columns for the stacked area
+        area_df = _area_frame(pivot)
+    with stage("demand"):
+        # Settlement period of each interval, read from one of its rows
+        rows = np.empty(len(utc_times), dtype=np.intp)
+        valid = time_codes >= 0
+        rows[time_codes[valid]] = np.flatnonzero(valid)
+        interval_keys = _settlement_keys(fuel_df, rows)
+        # Half‑hourly generation totals from the per‑interval totals
+        # (intervals are in time order, so each settlement period is one run)
+        keyed = interval_keys >= 0
+        run_keys = interval_keys[keyed]
+        starts = np.append(True, run_keys[1:] != run_keys[:-1])
+        hh_keys, hh_codes = run_keys[starts], np.cumsum(starts) - 1
+        half_hour_gen = np.bincount(
+            hh_codes,
+            weights=pivot["TotalGeneration"].to_numpy()[keyed],
+            minlength=len(hh_keys),
+        )
+        # Latest demand forecast per settlement period (greatest publish
+        # time) for the chosen boundary
+        tsdf_keys = _settlement_keys(tsdf_df)
+        if "Boundary" in tsdf_df:
+            tsdf_keys[(tsdf_df["Boundary"] != boundary).to_numpy()] = -1
+        latest = _latest_rows(tsdf_keys, _epoch_ns(tsdf_df["PublishTime"]))
+        latest_keys = tsdf_keys[latest]
+        latest_demand = tsdf_df["demand"].to_numpy(dtype="float64", na_value=np.nan)[latest]
+        # Join on the settlement key; local time is attached for display
+        keys, gen_pos, demand_pos = np.intersect1d(
+            hh_keys, latest_keys, assume_unique=True, return_indices=True
+        )
+        demand_merge = _supply_demand_frame(
+            keys, latest_demand[demand_pos], half_hour_gen[gen_pos]
+        )
+    return pivot, area_df, demand_merge
+
+
+# FUELINST intervals in a complete settlement period.
+INTERVALS_PER_HALF_HOUR = 6
+
+
+def realised_generation(pivot_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean total generation (MW) of each complete settlement period.
+
+    Parameters
+    ----------
+    pivot_df : pandas.DataFrame
+        Pivot from `process_data`, indexed by 5‑minute interval start.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        Packed settlement keys (see `_settlement_keys`) of the periods
+        with all `INTERVALS_PER_HALF_HOUR` intervals present, and their
+        mean 'TotalGeneration'.
+    """
+    dates, periods = settlement_periods(pd.DatetimeIndex(pivot_df.index))
+    keys = dates.asi8 // _DAY_NS * _SETTLEMENT_STRIDE + periods
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    starts = np.append(True, ordered[1:] != ordered[:-1])
+    codes = np.cumsum(starts) - 1
+    counts = np.bincount(codes)
+    sums = np.bincount(codes, weights=pivot_df["TotalGeneration"].to_numpy()[order])
+    complete = counts == INTERVALS_PER_HALF_HOUR
+    return ordered[starts][complete], sums[complete] / INTERVALS_PER_HALF_HOUR
+
+
+class ForecastVintageStore:
+    """Every TSDF publish kept, with forecast error statistics by lead time.
+
+    Each vintage — one (boundary, target settlement period, publish
+    time) — is packed into a single int64 and held in a sorted array
+    beside a float32 demand array, so a vintage costs 12 bytes, duplicate
+    publishes are found with one `searchsorted` and the vintages of a
+    period are contiguous.  Realised generation per settlement period is
+    held the same way.  Whenever a vintage or a realised value arrives,
+    the matching (forecast − realised) errors are added to running sums
+    per boundary and lead time (in half hours); a revised realised value
+    first takes back the errors it contributed before.  Statistics
+    therefore cost time proportional to the update, not to the history.
+
+    Attributes
+    ----------
+    last_publish_time : pandas.Timestamp | None
+        Newest `PublishTime` ingested so far.
+    """
+
+    # Bit layout of a packed vintage: boundary | settlement key | publish (s).
+    _KEY_SHIFT = 32
+    _BOUNDARY_SHIFT = 53
+    _MAX_BOUNDARIES = 1 << (63 - _BOUNDARY_SHIFT)
+    # Running-sum vector per (boundary, lead): count, error, |error|, error².
+    _WIDTH = 4
+
+    def __init__(self) -> None:
+        self._ids = np.empty(0, dtype="int64")
+        self._demand = np.empty(0, dtype="float32")
+        self._outturn_keys = np.empty(0, dtype="int64")
+        self._outturn = np.empty(0, dtype="float64")
+        self._boundaries: List[str] = []
+        self._sums = np.zeros((0, 0, self._WIDTH))
+        self._lock = threading.Lock()
+        self.last_publish_time: Optional[pd.Timestamp] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @classmethod
+    def _unpack(cls, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Splits packed vintages into boundary codes, settlement keys and
+        publish times (epoch seconds)."""
+        key_mask = (1 << (cls._BOUNDARY_SHIFT - cls._KEY_SHIFT)) - 1
+        publish_mask = (1 << cls._KEY_SHIFT) - 1
+        return ids >> cls._BOUNDARY_SHIFT, (ids >> cls._KEY_SHIFT) & key_mask, ids & publish_mask
+
+    def _boundary_codes(self, df: pd.DataFrame) -> np.ndarray:
+        if "Boundary" not in df:
+            names, codes = pd.Index([NATIONAL_BOUNDARY]), np.zeros(len(df), dtype=np.intp)
+        else:
+            codes, names = pd.factorize(df["Boundary"])
+        lookup = np.empty(len(names), dtype="int64")
+        for i, name in enumerate(map(str, names)):
+            if name not in self._boundaries:
+                if len(self._boundaries) == self._MAX_BOUNDARIES:
+                    raise ValueError(f"More than {self._MAX_BOUNDARIES} TSDF boundaries.")
+                self._boundaries.append(name)
+            lookup[i] = self._boundaries.index(name)
+        self._grow_sums()
+        return lookup[codes]
+
+    def _grow_sums(self, leads: int = 0) -> None:
+        """Widens the running sums to every registered boundary and to at
+        least `leads` lead times."""
+        shape = (len(self._boundaries), max(leads, self._sums.shape[1]))
+        if shape != self._sums.shape[:2]:
+            grown = np.zeros(shape + (self._WIDTH,))
+            grown[: self._sums.shape[0], : self._sums.shape[1]] = self._sums
+            self._sums = grown
+
+    def add(self, tsdf_df: pd.DataFrame) -> int:
+        """Stores the vintages of `tsdf_df` not already held.
+
+        Returns
+        -------
+        int
+            Number of new vintages.
+        """
+        if tsdf_df.empty:
+            return 0
+        keys = _settlement_keys(tsdf_df)
+        publish = _epoch_ns(tsdf_df["PublishTime"])
+        demand = tsdf_df["demand"].to_numpy(dtype="float32", na_value=np.nan)
+        with self._lock:
+            boundaries = self._boundary_codes(tsdf_df)
+            valid = (keys >= 0) & (publish >= 0)
+            ids = (
+                (boundaries << self._BOUNDARY_SHIFT)
+                | (keys << self._KEY_SHIFT)
+                | (publish // 10**9)
+            )[valid]
+            ids, first = np.unique(ids, return_index=True)
+            positions = np.searchsorted(self._ids, ids)
+            held = positions < len(self._ids)
+            held[held] = self._ids[positions[held]] == ids[held]
+            new_ids, new_demand = ids[~held], demand[valid][first][~held]
+            self._ids = np.insert(self._ids, positions[~held], new_ids)
+            self._demand = np.insert(self._demand, positions[~held], new_demand)
+            self._accumulate(new_ids, new_demand, 1.0)
+            if valid.any():
+                newest = pd.Timestamp(publish[valid].max(), tz="UTC")
+                if self.last_publish_time is None or newest > self.last_publish_time:
+                    self.last_publish_time = newest
+        return len(new_ids)
+
+    def set_outturn(self, keys: np.ndarray, generation: np.ndarray) -> None:
+        """Records realised generation (MW) for settlement periods.
+
+        Parameters
+        ----------
+        keys : numpy.ndarray
+            Packed settlement keys, e.g. from `realised_generation`.
+        generation : numpy.ndarray
+            Realised mean total generation of each period; a later call
+            for the same period replaces the earlier value.
+        """
+        keys = np.asarray(keys, dtype="int64")
+        generation = np.asarray(generation, dtype="float64")
+        if not len(keys):
+            return
+        # The last value given for a key wins
+        keys, last = np.unique(keys[::-1], return_index=True)
+        generation = generation[::-1][last]
+        with self._lock:
+            positions = np.searchsorted(self._outturn_keys, keys)
+            held = positions < len(self._outturn_keys)
+            held[held] = self._outturn_keys[positions[held]] == keys[held]
+            # Take back the errors against the previous realised values
+            rows = self._vintage_rows(keys[held])
+            self._accumulate(self._ids[rows], self._demand[rows], -1.0)
+            self._outturn[positions[held]] = generation[held]
+            self._outturn_keys = np.insert(self._outturn_keys, positions[~held], keys[~held])
+            self._outturn = np.insert(self._outturn, positions[~held], generation[~held])
+            rows = self._vintage_rows(keys)
+            self._accumulate(self._ids[rows], self._demand[rows], 1.0)
+
+    def _vintage_rows(self, keys: np.ndarray) -> np.ndarray:
+        """Positions of the vintages, for every boundary, targeting `keys`."""
+        boundaries = np.arange(len(self._boundaries), dtype="int64")[:, None]
+        base = boundaries << self._BOUNDARY_SHIFT
+        lo = np.searchsorted(self._ids, (base | (keys << self._KEY_SHIFT)).ravel())
+        hi = np.searchsorted(self._ids, (base | ((keys + 1) << self._KEY_SHIFT)).ravel())
+        lengths = hi - lo
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(lo, lengths) + offsets
+
+    def _accumulate(self, ids: np.ndarray, demand: np.ndarray, sign: float) -> None:
+        """Adds (or with ``sign=-1`` removes) the errors of vintages `ids`."""
+        boundaries, keys, publish = self._unpack(ids)
+        positions = np.searchsorted(self._outturn_keys, keys)
+        realised = positions < len(self._outturn_keys)
+        realised[realised] = self._outturn_keys[positions[realised]] == keys[realised]
+        leads = np.full(len(ids), -1, dtype="int64")
+        leads[realised] = (
+            _settlement_starts(keys[realised]).asi8 - publish[realised] * 10**9
+        ) // _HALF_HOUR_NS
+        # Vintages published after their period started carry no lead time
+        forward = leads >= 0
+        if not forward.any():
+            return
+        error = demand[forward] - self._outturn[positions[forward]]
+        boundaries, leads = boundaries[forward], leads[forward]
+        self._grow_sums(int(leads.max()) + 1)
+        shape = self._sums.shape[:2]
+        flat = boundaries * shape[1] + leads
+        values = sign * np.column_stack([np.ones(len(error)), error, np.abs(error), error**2])
+        for column in range(self._WIDTH):
+            self._sums[..., column] += np.bincount(
+                flat, weights=values[:, column], minlength=shape[0] * shape[1]
+            ).reshape(shape)
+
+    def error_by_lead(self, boundary: str = NATIONAL_BOUNDARY) -> pd.DataFrame:
+        """Forecast error statistics of one boundary by lead time.
+
+        Errors are forecast minus realised generation (MW), and the lead
+        time is from publish to the start of the target settlement period,
+        in whole half hours.
+
+        Returns
+        -------
+        pandas.DataFrame
+            'Count', 'MeanError', 'MeanAbsoluteError' and 'RMSE' indexed
+            by 'LeadTime'; lead times with no realised vintage are left out.
+        """
+        with self._lock:
+            if boundary in self._boundaries:
+                sums = self._sums[self._boundaries.index(boundary)].copy()
+            else:
+                sums = np.zeros((0, self._WIDTH))
+        # Removals can leave float noise behind in an emptied count
+        leads = np.flatnonzero(sums[:, 0] > 0.5)
+        count = sums[leads, 0]
+        return pd.DataFrame(
+            {
+                "Count": np.rint(count).astype("int64"),
+                "MeanError": sums[leads, 1] / count,
+                "MeanAbsoluteError": sums[leads, 2] / count,
+                "RMSE": np.sqrt(np.maximum(sums[leads, 3] / count, 0.0)),
             },
+            index=pd.TimedeltaIndex(leads * _HALF_HOUR_NS, name="LeadTime"),
         )
-        sd_fig.update_layout(
-            yaxis_title="Supply − Demand (MW)",
-            xaxis_title="Time (Europe/London)",
+
+    def trim(self, before: pd.Timestamp) -> int:
+        """Drops vintages and realised values for periods starting before
+        `before`; the error statistics keep their contributions.
+
+        Returns
+        -------
+        int
+            Number of vintages removed.
+        """
+        last = _last_key_before(_utc_timestamp(before).value)
+        with self._lock:
+            keep = self._unpack(self._ids)[1] > last
+            self._ids, self._demand = self._ids[keep], self._demand[keep]
+            realised = self._outturn_keys > last
+            self._outturn_keys = self._outturn_keys[realised]
+            self._outturn = self._outturn[realised]
+        return int((~keep).sum())
+
+    def frame(self, boundary: Optional[str] = None) -> pd.DataFrame:
+        """Returns the held vintages, for one boundary or all of them.
+
+        Returns
+        -------
+        pandas.DataFrame
+            'Boundary', 'SettlementDate', 'SettlementPeriod',
+            'LocalHalfHour', 'PublishTime' (epoch ns) and 'DemandForecast',
+            ordered by boundary, settlement period and publish time.
+        """
+        with self._lock:
+            ids, demand, names = self._ids, self._demand, list(self._boundaries)
+        if boundary is not None:
+            code = names.index(boundary) if boundary in names else -1
+            selected = ids >> self._BOUNDARY_SHIFT == code
+            ids, demand = ids[selected], demand[selected]
+        codes, keys, publish = self._unpack(ids)
+        days, periods = np.divmod(keys, _SETTLEMENT_STRIDE)
+        return pd.DataFrame(
+            {
+                "Boundary": pd.Categorical.from_codes(codes, categories=names or [NATIONAL_BOUNDARY]),
+                "SettlementDate": pd.DatetimeIndex(days * _DAY_NS).date,
+                "SettlementPeriod": periods.astype("int8"),
+                "LocalHalfHour": _settlement_starts(keys).rename(None),
+                "PublishTime": publish * 10**9,
+                "DemandForecast": demand.astype("float64"),
+            }
         )
-        charts.append(dcc.Graph(figure=sd_fig))
+
+
+class IncrementalProcessor:
+    """Keeps `process_data` outputs up to date one batch at a time.
+
+    The processor holds the latest clipped generation per (interval,
+    fuel type), the per‑interval pivot rows, half‑hourly generation totals
+    and, in `tsdf`, the latest demand forecast per boundary and half hour.
+    Every forecast publish and the realised generation of each complete
+    half hour also go to `vintages` for forecast error statistics.
+    `update` accepts new or revised FUELINST / TSDF rows (for instance
+    the output of `FuelinstStore.upsert`), recomputes only the intervals
+    and half hours they touch and returns those rows as deltas, so
+    refresh cost depends on the batch size rather than on the retained
+    window.
+
+    Parameters
+    ----------
+    scenarios : Dict[str, Dict[str, float]] | None, optional
+        Extra emission factor sets, as for `process_data`.
+    boundary : str, optional
+        TSDF boundary compared with generation, as for `process_data`.
+    """
+
+    def __init__(
+        self,
+        scenarios: Optional[Dict[str, Dict[str, float]]] = None,
+        boundary: str = NATIONAL_BOUNDARY,
+    ) -> None:
+        self.scenarios = {DEFAULT_SCENARIO: EMISSION_SCENARIOS[DEFAULT_SCENARIO], **(scenarios or {})}
+        # interval (UTC ns) -> fuel type -> (publish ns, clipped generation)
+        self._generation: Dict[int, Dict[str, Tuple[int, float]]] = {}
+        # Sorted keys of `self._generation`, for trimming by bisection.
+        self._times: List[int] = []
+        # interval (UTC ns) -> pivot row values, in `self._columns` order
+        self._pivot: Dict[int, np.ndarray] = {}
+        self._columns: List[str] = []
+        # settlement period (packed key, see `_settlement_keys`) bookkeeping
+        self._half_hour_of: Dict[int, int] = {}
+        self._members: Dict[int, set] = {}
+        self._half_hour_gen: Dict[int, float] = {}
+        self.boundary = boundary
+        self.tsdf = TsdfStore()
+        self.vintages = ForecastVintageStore()
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        fuel_df: Optional[pd.DataFrame] = None,
+        tsdf_df: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Applies a batch of new or revised rows.
+
+        Rows carrying an older `PublishTime` than the value already held
+        for the same key are ignored.  The inputs are not modified.
+
+        Parameters
+        ----------
+        fuel_df : pandas.DataFrame | None, optional
+            FUELINST rows with standardised column names.
+        tsdf_df : pandas.DataFrame | None, optional
+            TSDF rows with standardised column names.
+
+        Returns
+        -------
+        Dict[str, pandas.DataFrame]
+            ``pivot``, ``area`` and ``demand`` frames holding only the
+            rows affected by this batch, in the `process_data` layouts.
+        """
+        with self._lock:
+            touched_times: set = set()
+            touched_half_hours: set = set()
+            if fuel_df is not None and not fuel_df.empty:
+                touched_times = self._apply_fuel(fuel_df)
+            pivot_delta = self._recompute_intervals(touched_times)
+            for t in touched_times:
+                touched_half_hours.add(self._half_hour_of[t])
+            for hh in touched_half_hours:
+                self._half_hour_gen[hh] = float(
+                    sum(self._pivot[t][len(CATEGORIES)] for t in self._members[hh])
+                )
+            complete = [
+                hh for hh in sorted(touched_half_hours)
+                if len(self._members[hh]) == INTERVALS_PER_HALF_HOUR
+            ]
+            self.vintages.set_outturn(
+                np.array(complete, dtype="int64"),
+                np.array([self._half_hour_gen[hh] for hh in complete]) / INTERVALS_PER_HALF_HOUR,
+            )
+            if tsdf_df is not None and not tsdf_df.empty:
+                touched_half_hours |= self._apply_tsdf(tsdf_df)
+            demand_delta = self._demand_frame(touched_half_hours)
+        return {
+            "pivot": pivot_delta,
+            "area": _area_frame(pivot_delta),
+            "demand": demand_delta,
+        }
+
+    def _apply_fuel(self, fuel_df: pd.DataFrame) -> set:
+        times = _epoch_ns(fuel_df["StartTime"])
+        half_hours = _settlement_keys(fuel_df)
+        publish = _epoch_ns(fuel_df["PublishTime"])
+        values = fuel_df["Generation"].clip(lower=0).to_numpy(dtype="float64", na_value=0.0)
+        touched: set = set()
+        for t, hh, fuel, pub, value in zip(
+            times.tolist(), half_hours.tolist(), fuel_df["FuelType"].tolist(),
+            publish.tolist(), values.tolist(),
+        ):
+            row = self._generation.get(t)
+            if row is None:
+                row = self._generation[t] = {}
+                bisect.insort(self._times, t)
+            current = row.get(fuel)
+            if current is not None and pub < current[0]:
+                continue
+            row[fuel] = (pub, value)
+            touched.add(t)
+            self._half_hour_of[t] = hh
+            self._members.setdefault(hh, set()).add(t)
+        return touched
+
+    def _recompute_intervals(self, times: set) -> pd.DataFrame:
+        ordered = sorted(times)
+        fuels = sorted({fuel for t in ordered for fuel in self._generation[t]})
+        fuel_matrix = pd.DataFrame(
+            [[self._generation[t].get(fuel, (0, 0.0))[1] for fuel in fuels] for t in ordered],
+            index=pd.Index(pd.to_datetime(ordered, utc=True).tz_convert("Europe/London"), name="LocalTime"),
+            columns=pd.Index(fuels, name="FuelType"),
+            dtype="float64",
+        )
+        pivot = category_matrix(fuel_matrix)
+        pivot["TotalGeneration"] = pivot[CATEGORIES].sum(axis=1)
+        ci = carbon_intensity(fuel_matrix, self.scenarios)
+        pivot["CarbonIntensity"] = ci[DEFAULT_SCENARIO]
+        for name in self.scenarios:
+            if name != DEFAULT_SCENARIO:
+                pivot[f"CarbonIntensity[{name}]"] = ci[name]
+        self._columns = list(pivot.columns)
+        for t, row in zip(ordered, pivot.to_numpy()):
+            self._pivot[t] = row
+        return pivot
+
+    def _apply_tsdf(self, tsdf_df: pd.DataFrame) -> set:
+        self.vintages.add(tsdf_df)
+        changed = self.tsdf.upsert(tsdf_df)
+        if "Boundary" in changed:
+            changed = changed[(changed["Boundary"] == self.boundary).to_numpy()]
+        return set(_settlement_keys(changed).tolist())
+
+    def _demand_frame(self, half_hours: set) -> pd.DataFrame:
+        return _held_demand_frame(half_hours, self.tsdf.forecasts(self.boundary), self._half_hour_gen)
+
+    def trim(self, before: pd.Timestamp) -> None:
+        """Forgets intervals and half hours starting before `before`."""
+        cutoff = _utc_timestamp(before).value
+        with self._lock:
+            stale = bisect.bisect_left(self._times, cutoff)
+            for t in self._times[:stale]:
+                del self._generation[t]
+                self._pivot.pop(t, None)
+                hh = self._half_hour_of.pop(t, None)
+                if hh in self._members:
+                    self._members[hh].discard(t)
+            del self._times[:stale]
+            for hh in _keys_before(self._members, cutoff):
+                # Intervals after the cutoff in a half hour that started
+                # before it are kept but no longer counted towards it.
+                for t in self._members.pop(hh):
+                    self._half_hour_of.pop(t, None)
+                self._half_hour_gen.pop(hh, None)
+            self.tsdf.trim(before)
+            self.vintages.trim(before)
+
+    def frames(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Materialises the full (pivot, area, demand) frames held."""
+        return self.deferred_frames()()
+
+    def deferred_frames(self) -> Callable[[], Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """Returns the frames held now, to be materialised on first use.
+
+        Only references to the held rows are copied (rows are replaced
+        on update, never modified), which is far cheaper than building
+        the frames; callers that never read them never pay for that.
+        """
+        with self._lock:
+            rows = dict(self._pivot)
+            columns = self._columns or CATEGORIES + ["TotalGeneration", "CarbonIntensity"]
+            generation = dict(self._half_hour_gen)
+            forecasts = dict(self.tsdf.forecasts(self.boundary))
+
+        def build() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+            times = sorted(rows)
+            pivot = pd.DataFrame(
+                [rows[t] for t in times],
+                index=pd.Index(
+                    pd.to_datetime(times, utc=True).tz_convert("Europe/London"), name="LocalTime"
+                ),
+                columns=columns,
+                dtype="float64",
+            )
+            demand = _held_demand_frame(set(generation), forecasts, generation)
+            return pivot, _area_frame(pivot), demand
+
+        return _DeferredFrames(build)
+
+
+def _held_demand_frame(
+    half_hours: set,
+    forecasts: Mapping[int, Tuple[int, float]],
+    generation: Mapping[int, float],
+) -> pd.DataFrame:
+    """Supply‑vs‑demand rows of the `half_hours` with forecast and outturn."""
+    keys = sorted(hh for hh in half_hours if hh in forecasts and hh in generation)
+    demand = np.array([forecasts[hh][1] for hh in keys], dtype="float64")
+    totals = np.array([generation[hh] for hh in keys], dtype="float64")
+    return _supply_demand_frame(np.array(keys, dtype="int64"), demand, totals)
+
+
+class _DeferredFrames:
+    """The (pivot, area, demand) frames of a snapshot, built on first use.
+
+    Calling the object runs `build` once, in whichever thread asks
+    first, and returns the cached frames afterwards.
+    """
+
+    def __init__(self, build: Callable[[], Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]) -> None:
+        self._build: Optional[Callable[[], Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]] = build
+        self._frames: Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]] = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        with self._lock:
+            if self._frames is None:
+                self._frames = self._build()  # type: ignore[misc]
+                # Release the copied rows once the frames exist.
+                self._build = None
+            return self._frames
+
+
+# Resolutions of the rollup pyramid, finest first (pandas frequencies;
+# days follow Europe/London midnights, so clock-change days are 23 or
+# 25 hours long).
+ROLLUP_LEVELS: List[str] = ["5min", "30min", "1h", "1D"]
+# Columns of each rollup level.
+ROLLUP_COLUMNS: List[str] = CATEGORIES + ["TotalGeneration", "CarbonIntensity", "SupplyMinusDemand"]
+
+
+def _bucket_starts(times: np.ndarray, level: str) -> np.ndarray:
+    """Floors epoch‑nanosecond times to the start of their `level` bucket."""
+    if level == "1D":
+        index = pd.to_datetime(times, utc=True).tz_convert("Europe/London").normalize()
+        return index.asi8
+    # GB offsets are whole hours, so sub-daily UTC buckets align locally too.
+    step = pd.Timedelta(level).value
+    return times // step * step
+
+
+class _RollupLevel:
+    """Running sums of one rollup level in growable, time‑ordered arrays.
+
+    Bucket starts, sums and the derived values are kept in arrays with
+    spare capacity: new buckets after the last one are appended in place
+    and existing buckets are updated row by row, so an update costs time
+    proportional to the buckets it touches.  `frame` wraps the live rows
+    without copying them; before a row already handed out in a frame is
+    rewritten, the values array is copied so published frames never
+    change.
+    """
+
+    def __init__(self, width: int) -> None:
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._sums = np.zeros((0, width))
+        self._values = np.zeros((0, len(ROLLUP_COLUMNS)))
+        self._head = 0
+        self._size = 0
+        self._frame: Optional[pd.DataFrame] = None
+        # Rows of the current arrays that published frames may still see.
+        self._shared = 0
+
+    def keys(self) -> np.ndarray:
+        return self._keys[self._head : self._size]
+
+    def add(self, buckets: np.ndarray, sums: np.ndarray) -> None:
+        """Adds `sums` to the sorted, unique `buckets`, creating new ones."""
+        keys = self.keys()
+        pos = np.searchsorted(keys, buckets) + self._head
+        found = pos < self._size
+        found[found] = self._keys[pos[found]] == buckets[found]
+        new = ~found
+        if new.any():
+            if len(keys) and buckets[new][0] <= keys[-1]:
+                # A bucket inside the held range: insert (a full copy).
+                self._insert(pos[new], buckets[new])
+                pos = np.searchsorted(self.keys(), buckets) + self._head
+            else:
+                pos[new] = self._append(buckets[new], sums.shape[1])
+        if (pos < self._shared).any():
+            self._values = self._values.copy()
+            self._shared = 0
+        self._sums[pos] += sums
+        self._values[pos] = RollupPyramid._means(self._sums[pos])
+        self._frame = None
+        self._drop_empty(pos)
+
+    def _append(self, buckets: np.ndarray, width: int) -> np.ndarray:
+        end = self._size + len(buckets)
+        if end > len(self._keys):
+            self._reserve(end, width)
+        self._keys[self._size : end] = buckets
+        self._sums[self._size : end] = 0.0
+        positions = np.arange(self._size, end)
+        self._size = end
+        return positions
+
+    def _reserve(self, end: int, width: int) -> None:
+        live = self._size - self._head
+        capacity = max(2 * (end - self._head), 64)
+        keys = np.zeros(capacity, dtype=np.int64)
+        sums = np.zeros((capacity, width))
+        values = np.zeros((capacity, len(ROLLUP_COLUMNS)))
+        keys[:live] = self.keys()
+        sums[:live] = self._sums[self._head : self._size]
+        values[:live] = self._values[self._head : self._size]
+        self._keys, self._sums, self._values = keys, sums, values
+        self._size -= self._head
+        self._head, self._shared = 0, 0
+
+    def _insert(self, positions: np.ndarray, buckets: np.ndarray) -> None:
+        positions = positions - self._head
+        self._keys = np.insert(self.keys(), positions, buckets)
+        self._sums = np.insert(self._sums[self._head : self._size], positions, 0.0, axis=0)
+        self._values = np.insert(self._values[self._head : self._size], positions, np.nan, axis=0)
+        self._head, self._size, self._shared = 0, len(self._keys), 0
+
+    def _drop_empty(self, positions: np.ndarray) -> None:
+        sums = self._sums[positions]
+        empty = positions[
+            (sums[:, RollupPyramid._INTERVALS] <= 0) & (sums[:, RollupPyramid._HALF_HOURS] <= 0)
+        ]
+        if not len(empty):
+            return
+        empty = np.sort(empty)
+        # Trimming removes the oldest buckets: just move the head.
+        leading = int(np.sum(empty == np.arange(self._head, self._head + len(empty))))
+        self._head += leading
+        rest = empty[leading:] - self._head
+        if len(rest):
+            self._keys = np.delete(self.keys(), rest)
+            self._sums = np.delete(self._sums[self._head : self._size], rest, axis=0)
+            self._values = np.delete(self._values[self._head : self._size], rest, axis=0)
+            self._head, self._size, self._shared = 0, len(self._keys), 0
+
+    def frame(self) -> pd.DataFrame:
+        """The live rows as a frame indexed by local bucket start."""
+        if self._frame is None:
+            index = pd.DatetimeIndex(self.keys(), dtype="datetime64[ns, UTC]", name="LocalTime")
+            self._frame = pd.DataFrame(
+                self._values[self._head : self._size],
+                index=index.tz_convert("Europe/London"),
+                columns=pd.Index(ROLLUP_COLUMNS, name="Category"),
+                copy=False,
+            )
+            self._shared = self._size
+        return self._frame
+
+
+class RollupPyramid:
+    """Pre‑aggregated generation, carbon intensity and balance by resolution.
+
+    For every level in `ROLLUP_LEVELS` the pyramid keeps running sums per
+    bucket: generation by category, total generation, emissions (carbon
+    intensity × total generation), the number of 5‑minute intervals, and
+    the supply‑minus‑demand sum and count of half hours.  `update`
+    applies only the difference between the new and the previously held
+    rows, so landing a new interval touches one bucket per level, and
+    `levels` turns the sums into mean generation (MW), generation‑weighted
+    carbon intensity and mean supply minus demand.  Range queries read
+    the coarsest level that still resolves the requested span.
+
+    Supply minus demand is half‑hourly: at 5‑minute resolution only the
+    interval starting each half hour carries it.
+    """
+
+    # Layout of each running-sum vector.
+    _TOTAL = len(CATEGORIES)
+    _EMISSIONS = _TOTAL + 1
+    _INTERVALS = _TOTAL + 2
+    _BALANCE = _TOTAL + 3
+    _HALF_HOURS = _TOTAL + 4
+    _WIDTH = _TOTAL + 5
+
+    def __init__(self) -> None:
+        # Latest contribution of each interval / half hour (UTC ns).
+        self._rows: Dict[int, np.ndarray] = {}
+        self._balance: Dict[int, np.ndarray] = {}
+        # Their keys in sorted order, for trimming by bisection.
+        self._row_times: List[int] = []
+        self._balance_times: List[int] = []
+        self._levels = {level: _RollupLevel(self._WIDTH) for level in ROLLUP_LEVELS}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frames(cls, pivot_df: pd.DataFrame, demand_df: Optional[pd.DataFrame] = None) -> "RollupPyramid":
+        """Builds a pyramid from `process_data` outputs."""
+        pyramid = cls()
+        pyramid.update(pivot_df, demand_df)
+        return pyramid
+
+    def update(
+        self, pivot_df: Optional[pd.DataFrame] = None, demand_df: Optional[pd.DataFrame] = None
+    ) -> None:
+        """Applies new or revised pivot rows and half‑hourly balance rows.
+
+        Parameters
+        ----------
+        pivot_df : pandas.DataFrame | None, optional
+            Rows in the `process_data` pivot layout, e.g. the ``pivot``
+            delta returned by `IncrementalProcessor.update`.
+        demand_df : pandas.DataFrame | None, optional
+            Rows in the `process_data` demand layout.
+        """
+        times: List[np.ndarray] = []
+        diffs: List[np.ndarray] = []
+        with self._lock:
+            if pivot_df is not None and not pivot_df.empty:
+                rows = np.zeros((len(pivot_df), self._WIDTH))
+                rows[:, : self._TOTAL] = pivot_df[CATEGORIES].to_numpy(dtype="float64")
+                rows[:, self._TOTAL] = pivot_df["TotalGeneration"].to_numpy(dtype="float64")
+                rows[:, self._EMISSIONS] = np.nan_to_num(
+                    pivot_df["CarbonIntensity"].to_numpy(dtype="float64") * rows[:, self._TOTAL]
+                )
+                rows[:, self._INTERVALS] = 1.0
+                keys = pd.DatetimeIndex(pivot_df.index).asi8
+                times.append(keys)
+                diffs.append(self._replace(self._rows, self._row_times, keys, rows))
+            if demand_df is not None and not demand_df.empty:
+                rows = np.zeros((len(demand_df), self._WIDTH))
+                rows[:, self._BALANCE] = demand_df["SupplyMinusDemand"].to_numpy(dtype="float64")
+                rows[:, self._HALF_HOURS] = 1.0
+                keys = pd.DatetimeIndex(demand_df["LocalHalfHour"]).asi8
+                times.append(keys)
+                diffs.append(self._replace(self._balance, self._balance_times, keys, rows))
+            if times:
+                self._accumulate(np.concatenate(times), np.vstack(diffs))
+
+    @staticmethod
+    def _replace(
+        held: Dict[int, np.ndarray], order: List[int], keys: np.ndarray, rows: np.ndarray
+    ) -> np.ndarray:
+        # Stores the new rows and returns what they add on top of the old ones.
+        diff = rows.copy()
+        for i, key in enumerate(keys.tolist()):
+            old = held.get(key)
+            if old is not None:
+                diff[i] -= old
+            else:
+                bisect.insort(order, key)
+            held[key] = rows[i]
+        return diff
+
+    def _accumulate(self, times: np.ndarray, diffs: np.ndarray) -> None:
+        for level in ROLLUP_LEVELS:
+            buckets, inverse = np.unique(_bucket_starts(times, level), return_inverse=True)
+            sums = np.zeros((len(buckets), self._WIDTH))
+            np.add.at(sums, inverse, diffs)
+            self._levels[level].add(buckets, sums)
+
+    @classmethod
+    def _means(cls, sums: np.ndarray) -> np.ndarray:
+        # Running sums -> `ROLLUP_COLUMNS` values.
+        with np.errstate(invalid="ignore", divide="ignore"):
+            intervals = np.where(sums[:, cls._INTERVALS] > 0, sums[:, cls._INTERVALS], np.nan)
+            half_hours = np.where(sums[:, cls._HALF_HOURS] > 0, sums[:, cls._HALF_HOURS], np.nan)
+            total = sums[:, cls._TOTAL]
+            return np.column_stack(
+                [
+                    sums[:, : cls._TOTAL + 1] / intervals[:, None],
+                    np.where(total > 0, sums[:, cls._EMISSIONS] / total, np.nan),
+                    sums[:, cls._BALANCE] / half_hours,
+                ]
+            )
+
+    def trim(self, before: pd.Timestamp) -> None:
+        """Removes intervals and half hours starting before `before`."""
+        cutoff = _utc_timestamp(before).value
+        with self._lock:
+            times: List[int] = []
+            diffs: List[np.ndarray] = []
+            for held, order in ((self._rows, self._row_times), (self._balance, self._balance_times)):
+                stale = bisect.bisect_left(order, cutoff)
+                for key in order[:stale]:
+                    times.append(key)
+                    diffs.append(-held.pop(key))
+                del order[:stale]
+            if times:
+                self._accumulate(np.array(times, dtype=np.int64), np.vstack(diffs))
+
+    def levels(self) -> Dict[str, pd.DataFrame]:
+        """Returns every level as a frame indexed by local bucket start.
+
+        Frames wrap the pyramid's arrays without copying; they are
+        rebuilt only for levels that changed and must not be modified by
+        callers.
+        """
+        with self._lock:
+            return {level: held.frame() for level, held in self._levels.items()}
+
+    def query(
+        self,
+        start: Optional[object] = None,
+        end: Optional[object] = None,
+        max_points: Optional[int] = None,
+    ) -> Tuple[str, pd.DataFrame]:
+        """Returns the rows of the best level for a time range.
+
+        Parameters
+        ----------
+        start, end : timestamp‑like | None, optional
+            Inclusive bounds; naive values are taken as UTC.
+        max_points : int | None, optional
+            Most rows wanted; defaults to two per pixel of `CHART_WIDTH`.
+
+        Returns
+        -------
+        Tuple[str, pandas.DataFrame]
+            The level used and its rows in the range.
+        """
+        rollups = self.levels()
+        bounds = (
+            None if start is None else _utc_timestamp(start).value,
+            None if end is None else _utc_timestamp(end).value,
+        )
+        level = choose_level(rollups, bounds[0], bounds[1], max_points)
+        frame = rollups[level]
+        lo, hi = _range_positions(frame.index.asi8, *bounds)
+        return level, frame.iloc[lo:hi]
+
+
+def _range_positions(times: np.ndarray, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+    """Positions of the sorted `times` inside the inclusive [start, end]."""
+    lo = 0 if start is None else int(np.searchsorted(times, start, "left"))
+    hi = len(times) if end is None else int(np.searchsorted(times, end, "right"))
+    return lo, hi
+
+
+def choose_level(
+    rollups: Dict[str, pd.DataFrame],
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    max_points: Optional[int] = None,
+    levels: Optional[List[str]] = None,
+) -> str:
+    """Picks the finest rollup level with at most `max_points` rows in range.
+
+    That is the coarsest level needed to fit the span; if none fits the
+    coarsest level is returned.  `start` and `end` are epoch nanoseconds
+    and `max_points` defaults to two per pixel of `CHART_WIDTH`.
+    """
+    max_points = 2 * CHART_WIDTH if max_points is None else max_points
+    levels = ROLLUP_LEVELS if levels is None else levels
+    for level in levels:
+        lo, hi = _range_positions(rollups[level].index.asi8, start, end)
+        if hi - lo <= max_points:
+            return level
+    return levels[-1]
+
+
+# Seconds between background refreshes of the live dashboard; FUELINST
+# is published every five minutes.
+REFRESH_INTERVAL = 300.0
+# Recent snapshot versions whose revisions each snapshot remembers, so
+# browsers up to this many refreshes behind can still be patched.
+REVISION_HISTORY = 12
+
+
+class Snapshot(NamedTuple):
+    """Immutable set of processed frames and figures served to clients.
+
+    A snapshot is fully built before it is published and nothing holds a
+    reference that could modify it afterwards, so a request handler that
+    picked one up always sees frames and figures from the same refresh.
+    `rollups` holds the `RollupPyramid` levels the charts are drawn from;
+    the full `pivot`, `area` and `demand` frames are only materialised by
+    `frames` when first read, since pages and zooms are served from the
+    rollups.  `revised` maps each recent version to the earliest time
+    (UTC ns) its refresh added or changed, or None if it changed
+    nothing; versions that also inserted chart rows between existing
+    ones are left out, so browsers holding them get full arrays.
+    """
+
+    rollups: Dict[str, pd.DataFrame]
+    figures: Dict[str, Dict[str, object]]
+    created: pd.Timestamp
+    version: int
+    frames: Callable[[], Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]
+    revised: Mapping[int, Optional[int]] = MappingProxyType({})
+
+    @property
+    def pivot(self) -> pd.DataFrame:
+        return self.frames()[0]
+
+    @property
+    def area(self) -> pd.DataFrame:
+        return self.frames()[1]
+
+    @property
+    def demand(self) -> pd.DataFrame:
+        return self.frames()[2]
+
+
+def build_snapshot(
+    pivot_df: pd.DataFrame,
+    area_df: pd.DataFrame,
+    demand_df: pd.DataFrame,
+    version: int = 0,
+    rollups: Optional[Dict[str, pd.DataFrame]] = None,
+) -> Snapshot:
+    """Builds the figures for processed frames and wraps them in a `Snapshot`.
+
+    `rollups` are built from the frames unless given (see `RollupPyramid`).
+    """
+    if rollups is None:
+        rollups = RollupPyramid.from_frames(pivot_df, demand_df).levels()
+    frames = (pivot_df, area_df, demand_df)
+    return Snapshot(
+        rollups=rollups,
+        figures=build_figures(rollups),
+        created=pd.Timestamp.now(tz="UTC"),
+        version=version,
+        frames=lambda: frames,
+    )
+
+
+class SnapshotRefresher:
+    """Re‑fetches and reprocesses data on a background thread.
+
+    Each refresh polls FUELINST incrementally into a private
+    `FuelinstStore`, revalidates TSDF through the HTTP cache, feeds the
+    changes to an `IncrementalProcessor` and its deltas to a
+    `RollupPyramid`, and builds a new `Snapshot` from the rollups off to
+    the side, leaving the full frames to be built only if read (see
+    `IncrementalProcessor.deferred_frames`), so a refresh costs time in
+    proportion to the new rows.  The finished snapshot is published with a single
+    reference assignment, so readers of `snapshot` never wait for a
+    refresh and never observe a partially updated one.  A failed refresh
+    is reported and the previous snapshot stays in service.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds between refreshes.
+    retention : pandas.Timedelta | None, optional
+        Length of the window kept.  By default the span of the data the
+        refresher was seeded with, so the window slides forward rather
+        than growing.
+    scenarios : Dict[str, Dict[str, float]] | None, optional
+        Extra emission factor sets, as for `process_data`.
+    boundary : str, optional
+        TSDF boundary compared with generation, as for `process_data`.
+    """
+
+    def __init__(
+        self,
+        interval: float = REFRESH_INTERVAL,
+        retention: Optional[pd.Timedelta] = None,
+        scenarios: Optional[Dict[str, Dict[str, float]]] = None,
+        boundary: str = NATIONAL_BOUNDARY,
+    ) -> None:
+        self.interval = interval
+        self.retention = retention
+        self.store = FuelinstStore()
+        self.processor = IncrementalProcessor(scenarios, boundary)
+        self.rollups = RollupPyramid()
+        self._snapshot: Optional[Snapshot] = None
+        # Earliest time (UTC ns) changed since the last publish.
+        self._revised: Optional[int] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """The most recently published snapshot."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise ValueError("No snapshot has been built yet.")
+        return snapshot
+
+    def seed(self, fuel_df: pd.DataFrame, tsdf_df: pd.DataFrame) -> Snapshot:
+        """Loads an initial full fetch and publishes the first snapshot."""
+        if self.retention is None and not fuel_df.empty:
+            starts = _epoch_ns(fuel_df["StartTime"])
+            starts = starts[starts != np.iinfo(np.int64).min]
+            if len(starts):
+                self.retention = pd.Timedelta(int(starts.max() - starts.min()))
+        with self._refresh_lock:
+            self._apply(self.store.upsert(fuel_df), tsdf_df)
+            return self._publish()
+
+    def refresh(self) -> Snapshot:
+        """Fetches new data, rebuilds the snapshot and publishes it."""
+        with self._refresh_lock:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                fuel_future = pool.submit(fetch_fuelinst_incremental, self.store)
+                tsdf_future = pool.submit(fetch_tsdf_data)
+                new_fuel, tsdf_df = fuel_future.result(), tsdf_future.result()
+            return self._ingest(new_fuel, tsdf_df)
+
+    def ingest(self, fuel_df: pd.DataFrame, tsdf_df: Optional[pd.DataFrame] = None) -> Snapshot:
+        """Applies already fetched rows, slides the window and publishes."""
+        with self._refresh_lock:
+            return self._ingest(self.store.upsert(fuel_df), tsdf_df)
+
+    def _ingest(self, new_fuel: pd.DataFrame, tsdf_df: Optional[pd.DataFrame]) -> Snapshot:
+        self._apply(new_fuel, tsdf_df)
+        if self.retention is not None and self.store.last_start_time is not None:
+            cutoff = self.store.last_start_time - self.retention
+            self.store.trim(cutoff)
+            self.processor.trim(cutoff)
+            self.rollups.trim(cutoff)
+        return self._publish()
+
+    def _apply(self, fuel_df: pd.DataFrame, tsdf_df: Optional[pd.DataFrame]) -> None:
+        delta = self.processor.update(fuel_df, tsdf_df)
+        self.rollups.update(delta["pivot"], delta["demand"])
+        changed = np.concatenate(
+            [delta["pivot"].index.asi8, pd.DatetimeIndex(delta["demand"]["LocalHalfHour"]).asi8]
+        )
+        if len(changed):
+            earliest = int(changed.min())
+            self._revised = earliest if self._revised is None else min(self._revised, earliest)
+
+    def _publish(self) -> Snapshot:
+        version = 0 if self._snapshot is None else self._snapshot.version + 1
+        # Figures come from the incrementally updated rollups; the full
+        # frames are only built if something reads them.
+        rollups = self.rollups.levels()
+        revised: Dict[int, Optional[int]] = {}
+        previous = self._snapshot
+        if previous is not None:
+            revised = {v: t for v, t in previous.revised.items() if v > version - REVISION_HISTORY}
+            if all(
+                _rows_aligned(_finest_times(previous.rollups, key), _finest_times(rollups, key))
+                for key in LIVE_CHARTS
+            ):
+                revised[version] = self._revised
+        self._revised = None
+        snapshot = Snapshot(
+            rollups=rollups,
+            figures=build_figures(rollups),
+            created=pd.Timestamp.now(tz="UTC"),
+            version=version,
+            frames=self.processor.deferred_frames(),
+            revised=MappingProxyType(revised),
+        )
+        # A single reference assignment: readers see the old or the new
+        # snapshot, never a mixture.
+        self._snapshot = snapshot
+        return snapshot
+
+    def start(self) -> None:
+        """Starts refreshing every `interval` seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread after any refresh in progress."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                snapshot = self.refresh()
+            except Exception as exc:  # keep serving the previous snapshot
+                print(f"Warning: dashboard refresh failed ({exc}); keeping previous data.")
+                continue
+            print(
+                f"Refreshed dashboard data (snapshot {snapshot.version}, "
+                f"{len(snapshot.rollups[ROLLUP_LEVELS[0]])} intervals)."
+            )
+
+
+# Horizontal resolution assumed for each chart, in pixels.  Series are
+# downsampled to at most two points (bucket minimum and maximum) per
+# pixel, so the points sent are bounded by chart width.
+CHART_WIDTH = 1200
+
+
+def downsample_indices(
+    times: np.ndarray,
+    values: np.ndarray,
+    x_range: Optional[Tuple[int, int]] = None,
+    width: Optional[int] = None,
+) -> np.ndarray:
+    """Selects the rows to plot for a time range.
+
+    The rows inside `x_range`, plus one neighbour on each side so lines
+    reach the axis edges, are split into `width` equal time buckets and
+    each bucket keeps the rows holding its minimum and maximum of
+    `values`.  Peaks and troughs therefore survive at any zoom level
+    while at most ``2 * width`` rows are returned.  Ranges that already
+    fit are returned in full.
+
+    Parameters
+    ----------
+    times : numpy.ndarray
+        Sorted row times as epoch nanoseconds.
+    values : numpy.ndarray
+        Values whose extremes are preserved.
+    x_range : Tuple[int, int] | None, optional
+        Inclusive (start, end) in epoch nanoseconds; all rows by default.
+    width : int | None, optional
+        Number of buckets; defaults to `CHART_WIDTH`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted positions of the selected rows.
+    """
+    width = CHART_WIDTH if width is None else width
+    lo, hi = 0, len(times)
+    if x_range is not None:
+        lo = max(int(np.searchsorted(times, x_range[0], "left")) - 1, 0)
+        hi = min(int(np.searchsorted(times, x_range[1], "right")) + 1, len(times))
+    if hi - lo <= 2 * width:
+        return np.arange(lo, hi)
+    t = times[lo:hi]
+    span = float(t[-1] - t[0]) + 1.0
+    bucket = ((t - t[0]) / span * width).astype(np.int64)
+    # Sort by bucket, then value: each bucket's first and last rows are
+    # its minimum and maximum.
+    order = np.lexsort((values[lo:hi], bucket))
+    boundary = bucket[order][1:] != bucket[order][:-1]
+    first = order[np.r_[True, boundary]]
+    last = order[np.r_[boundary, True]]
+    return np.unique(np.concatenate([first, last])) + lo
+
+
+# Columns drawn by each chart, the column whose extremes downsampling
+# keeps, and the rollup levels the chart can be drawn from.
+CHART_COLUMNS: Dict[str, List[str]] = {
+    "generation": CATEGORIES,
+    "carbon_intensity": ["CarbonIntensity"],
+    "supply_demand": ["SupplyMinusDemand"],
+}
+CHART_EXTREMES: Dict[str, str] = {
+    "generation": "TotalGeneration",
+    "carbon_intensity": "CarbonIntensity",
+    "supply_demand": "SupplyMinusDemand",
+}
+CHART_LEVELS: Dict[str, List[str]] = {
+    "generation": ROLLUP_LEVELS,
+    "carbon_intensity": ROLLUP_LEVELS,
+    # Supply minus demand is half-hourly.
+    "supply_demand": ROLLUP_LEVELS[1:],
+}
+
+
+def chart_data(
+    rollups: Dict[str, pd.DataFrame],
+    key: str,
+    x_range: Optional[Tuple[int, int]] = None,
+) -> Tuple[str, pd.DataFrame, np.ndarray]:
+    """Selects the rollup level and rows to draw for one chart.
+
+    The level is the coarsest one needed to fit the range in the chart
+    width (see `choose_level`); rows are then downsampled with
+    `downsample_indices` in case even that level has too many.
+
+    Returns
+    -------
+    Tuple[str, pandas.DataFrame, numpy.ndarray]
+        The level, its frame and the positions of the rows to draw.
+    """
+    start, end = x_range if x_range is not None else (None, None)
+    level = choose_level(rollups, start, end, levels=CHART_LEVELS[key])
+    frame = rollups[level]
+    if key == "supply_demand":
+        frame = frame[frame["SupplyMinusDemand"].notna()]
+    keep = downsample_indices(frame.index.asi8, frame[CHART_EXTREMES[key]].to_numpy(), x_range)
+    return level, frame, keep
+
+
+# Chart skeletons built by `figure_templates`.
+_FIGURE_TEMPLATES: Dict[str, Dict[str, object]] = {}
+
+
+def figure_templates() -> Dict[str, Dict[str, object]]:
+    """Returns the chart skeletons: layouts and trace styles without data.
+
+    They are built once with `plotly.graph_objects`, so they are
+    validated and have the Plotly template resolved, and are kept as
+    plain dictionaries.  `fill_figure` copies them with new data arrays,
+    which skips validation and grouping on every refresh.
+    """
+    if not _FIGURE_TEMPLATES:
+        axis = "Time (Europe/London)"
+        generation = go.Figure(
+            [
+                go.Scatter(
+                    name=category,
+                    mode="lines",
+                    stackgroup="generation",
+                    hovertemplate=f"{category}<br>%{{x}}<br>%{{y:.0f}} MW<extra></extra>",
+                )
+                for category in CATEGORIES
+            ],
+            layout=dict(
+                title_text="Generation Mix by Fuel Category",
+                xaxis_title=axis,
+                yaxis_title="Generation (MW)",
+                legend_title_text="Category",
+            ),
+        )
+        intensity = go.Figure(
+            go.Scatter(
+                name="CarbonIntensity",
+                mode="lines",
+                showlegend=False,
+                hovertemplate="%{x}<br>%{y:.0f} g/kWh<extra></extra>",
+            ),
+            layout=dict(
+                title_text="Estimated Carbon Intensity",
+                xaxis_title=axis,
+                yaxis_title="Carbon Intensity (g/kWh)",
+            ),
+        )
+        balance = go.Figure(
+            go.Scatter(
+                name="SupplyMinusDemand",
+                mode="lines",
+                showlegend=False,
+                hovertemplate="%{x}<br>%{y:.0f} MW<extra></extra>",
+            ),
+            layout=dict(
+                title_text="Supply Minus Demand (Half‑hourly)",
+                xaxis_title=axis,
+                yaxis_title="Supply − Demand (MW)",
+            ),
+        )
+        _FIGURE_TEMPLATES.update(
+            {
+                "generation": generation.to_dict(),
+                "carbon_intensity": intensity.to_dict(),
+                "supply_demand": balance.to_dict(),
+            }
+        )
+    return _FIGURE_TEMPLATES
+
+
+def fill_figure(
+    key: str, frame: pd.DataFrame, keep: Optional[np.ndarray] = None
+) -> Dict[str, object]:
+    """Copies a chart template with data from `frame`.
+
+    Parameters
+    ----------
+    key : str
+        Chart name (see `CHART_COLUMNS`).
+    frame : pandas.DataFrame
+        Rows indexed by local time holding the chart's columns, e.g. a
+        rollup level or the pivot.
+    keep : numpy.ndarray | None, optional
+        Positions of the rows to draw; all rows by default.
+
+    Returns
+    -------
+    Dict[str, object]
+        A figure dictionary with plain‑list data, as accepted by
+        `dcc.Graph`.  The layout is shared with the template and must not
+        be modified in place.
+    """
+    template = figure_templates()[key]
+    shown = frame if keep is None else frame.iloc[keep]
+    x = _x_values(shown.index)
+    data = [
+        dict(trace, x=x, y=shown[column].tolist())
+        for trace, column in zip(template["data"], CHART_COLUMNS[key])  # type: ignore[call-overload]
+    ]
+    layout = template["layout"]
+    if key == "carbon_intensity":
+        # set y-axis range to add headroom
+        ci_max = frame["CarbonIntensity"].max()
+        if pd.notna(ci_max) and ci_max > 0:
+            layout = dict(layout, yaxis=dict(layout.get("yaxis", {}), range=[0, float(ci_max) * 1.1]))  # type: ignore[union-attr]
+    return {"data": data, "layout": layout}
+
+
+def build_figures(rollups: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, object]]:
+    """Builds the dashboard figures.
+
+    Parameters
+    ----------
+    rollups : Dict[str, pandas.DataFrame]
+        `RollupPyramid` levels.  Each chart is drawn from the level that
+        fits the whole window in the chart width (see `chart_data`).
+
+    Returns
+    -------
+    Dict[str, Dict[str, object]]
+        Figure dictionaries (see `fill_figure`) keyed ``generation``,
+        ``carbon_intensity`` and, when demand data is available,
+        ``supply_demand``.
+    """
+    figures: Dict[str, Dict[str, object]] = {}
+    for key in CHART_COLUMNS:
+        _, frame, keep = chart_data(rollups, key)
+        # The supply-demand chart is omitted when nothing overlaps
+        if key == "supply_demand" and not len(keep):
+            continue
+        figures[key] = fill_figure(key, frame, keep)
+    return figures
+
+
+# Charts the live dashboard updates in place, in page order.
+LIVE_CHARTS: List[str] = ["generation", "carbon_intensity", "supply_demand"]
+# Upper bound on seconds between browser polls for a newer snapshot.
+POLL_INTERVAL = 30.0
+
+
+def _chart_view(
+    snapshot: Snapshot, key: str, x_range: Optional[Tuple[int, int]] = None
+) -> Tuple[pd.DatetimeIndex, List[np.ndarray], np.ndarray, bool]:
+    """Returns a chart's x values, per‑trace y values and rows to draw.
+
+    The last item tells whether the values come from the chart's finest
+    level.
+    """
+    level, frame, keep = chart_data(snapshot.rollups, key, x_range)
+    columns = [frame[c].to_numpy() for c in CHART_COLUMNS[key]]
+    return frame.index, columns, keep, level == CHART_LEVELS[key][0]
+
+
+def _finest_times(rollups: Dict[str, pd.DataFrame], key: str) -> np.ndarray:
+    """Bucket starts (UTC ns) of the rows a chart draws at its finest level."""
+    frame = rollups[CHART_LEVELS[key][0]]
+    if key == "supply_demand":
+        frame = frame[frame["SupplyMinusDemand"].notna()]
+    return frame.index.asi8
+
+
+def _rows_aligned(old: np.ndarray, new: np.ndarray) -> bool:
+    """Whether sorted `new` is `old` with rows only dropped from the start
+    and added at the end."""
+    if not len(old) or not len(new):
+        return True
+    dropped = int(np.searchsorted(old, new[0]))
+    appended = len(new) - int(np.searchsorted(new, old[-1], "right"))
+    return len(old) - dropped + appended == len(new)
+
+
+def _revised_since(snapshot: Snapshot, version: Optional[int]) -> Tuple[bool, Optional[int]]:
+    """Earliest time (UTC ns) revised after `version`, and whether it is known."""
+    if version is None:
+        return False, None
+    times: List[int] = []
+    for v in range(int(version) + 1, snapshot.version + 1):
+        if v not in snapshot.revised:
+            return False, None
+        if snapshot.revised[v] is not None:
+            times.append(snapshot.revised[v])  # type: ignore[arg-type]
+    return True, min(times) if times else None
+
+
+def _x_values(times: pd.DatetimeIndex) -> List[str]:
+    # Charts show local wall-clock time, as Plotly does for tz-aware data.
+    wall = times.tz_localize(None) if times.tz is not None else times
+    return np.datetime_as_string(wall.to_numpy(), unit="s").tolist()
+
+
+def _view_state(
+    x: pd.DatetimeIndex,
+    keep: np.ndarray,
+    x_range: Optional[Tuple[int, int]],
+    finest: bool,
+) -> Dict[str, object]:
+    """Describes the points of one chart a browser holds."""
+    return {
+        "last": int(x.asi8[keep[-1]]) if len(keep) else None,
+        "count": len(keep),
+        "range": list(x_range) if x_range is not None else None,
+        # Every finest-level point of the window: new points can be appended.
+        "raw": x_range is None and finest and len(keep) == len(x),
+    }
+
+
+def _live_figure(
+    snapshot: Snapshot, key: str, x_range: Optional[Tuple[int, int]] = None
+) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """Returns one snapshot figure redrawn for `x_range`, and its state.
+
+    The data are plain lists, which `Patch` can extend in the browser.
+    """
+    level, frame, keep = chart_data(snapshot.rollups, key, x_range)
+    fig = fill_figure(key, frame, keep)
+    # Keep the user's zoom when the data underneath is replaced.
+    fig["layout"] = dict(fig["layout"], uirevision=key)  # type: ignore[arg-type]
+    return fig, _view_state(frame.index, keep, x_range, level == CHART_LEVELS[key][0])
+
+
+def _relayout_range(relayout: Optional[Dict[str, object]]) -> Tuple[bool, Optional[Tuple[int, int]]]:
+    """Reads an x‑axis zoom from a Plotly ``relayoutData`` event.
+
+    Returns whether the event changed the x range, and the new range in
+    epoch nanoseconds (None when the axis was reset to autorange).
+    """
+    relayout = relayout or {}
+    if relayout.get("xaxis.autorange"):
+        return True, None
+    if "xaxis.range[0]" in relayout and "xaxis.range[1]" in relayout:
+        bounds = [relayout["xaxis.range[0]"], relayout["xaxis.range[1]"]]
+    elif "xaxis.range" in relayout:
+        bounds = list(relayout["xaxis.range"])  # type: ignore[arg-type]
+    else:
+        return False, None
+    start, end = (
+        pd.Timestamp(bound).tz_localize("Europe/London", ambiguous=True, nonexistent="shift_forward").value
+        for bound in bounds
+    )
+    return True, (min(start, end), max(start, end))
+
+
+def chart_state(snapshot: Snapshot) -> Dict[str, object]:
+    """Describes what a browser showing `snapshot` holds, for `chart_updates`."""
+    state: Dict[str, object] = {"version": snapshot.version}
+    for key in LIVE_CHARTS:
+        state[key] = _live_figure(snapshot, key)[1]
+    return state
+
+
+def chart_updates(
+    snapshot: Snapshot,
+    state: Dict[str, object],
+    zoom: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """Computes the updates that bring a browser's charts up to `snapshot`.
+
+    A chart held at full resolution over the whole window is patched:
+    every point the browser holds from the earliest time revised since
+    its version (see `Snapshot.revised`) on is re‑assigned, always
+    including its newest point, newer points are appended and points
+    that slid out of the window are removed from the left, so the
+    payload grows with the number of new and revised points rather than
+    with the window.  Any other chart gets its data arrays replaced by a
+    downsampled view of its visible range (see `downsample_indices`),
+    bounded by the chart width; a zoomed view that ends before the
+    earliest revision is left alone.
+
+    Parameters
+    ----------
+    snapshot : Snapshot
+        Snapshot to bring the browser up to.
+    state : Dict[str, object]
+        The browser's state, as returned by `chart_state`.
+    zoom : Dict[str, Tuple[int, int] | None] | None, optional
+        New x ranges (epoch nanoseconds, None for the whole window) for
+        charts the user has just zoomed or reset.
+
+    Returns
+    -------
+    Tuple[Dict[str, object], Dict[str, object]]
+        Per chart a `dash.Patch`, a full figure or `dash.no_update`, and
+        the browser's new state.
+    """
+    zoom = zoom or {}
+    updates: Dict[str, object] = {}
+    new_state: Dict[str, object] = {"version": snapshot.version}
+    for key in LIVE_CHARTS:
+        client = state.get(key) or {}
+        last, count = client.get("last"), client.get("count", 0)
+        x_range = zoom[key] if key in zoom else client.get("range")
+        if x_range is not None:
+            x_range = (int(x_range[0]), int(x_range[1]))
+        if key not in zoom and state.get("version") == snapshot.version:
+            updates[key] = no_update
+            new_state[key] = client
+            continue
+        if key not in zoom and client.get("raw"):
+            x, columns, keep, finest = _chart_view(snapshot, key)
+            patch = None
+            if finest and len(keep) == len(x):
+                patch = _append_patch(snapshot, key, x, columns, last, count, state.get("version"))
+            if patch is not None:
+                updates[key] = patch
+                new_state[key] = _view_state(x, keep, None, finest)
+                continue
+        if key not in zoom and x_range is not None:
+            known, earliest = _revised_since(snapshot, state.get("version"))  # type: ignore[arg-type]
+            if known and (earliest is None or earliest > x_range[1]):
+                # Zoomed into the past: nothing in view has changed.
+                updates[key] = no_update
+                new_state[key] = client
+                continue
+        fig, new_state[key] = _live_figure(snapshot, key, x_range)
+        if not count:
+            updates[key] = fig if new_state[key]["count"] else no_update  # type: ignore[index]
+            continue
+        # Replace only the data arrays; layout and zoom stay as they are.
+        patch = Patch()
+        for i, trace in enumerate(fig["data"]):  # type: ignore[arg-type]
+            patch["data"][i]["x"] = trace["x"]
+            patch["data"][i]["y"] = trace["y"]
+        updates[key] = patch
+    return updates, new_state
+
+
+def _append_patch(
+    snapshot: Snapshot,
+    key: str,
+    x: pd.DatetimeIndex,
+    columns: List[np.ndarray],
+    last: Optional[int],
+    count: int,
+    version: Optional[int] = None,
+) -> Optional[Patch]:
+    """Builds the patch that brings a full‑resolution chart up to date.
+
+    The browser's points from the bucket of the earliest revision since
+    `version` to its newest one are re‑assigned, newer points appended
+    and points older than the window removed.  Returns None when the
+    browser's points cannot be patched consistently (empty, entirely
+    older than the window, revised before its first point, revisions
+    unknown, or far behind).
+    """
+    times = x.asi8
+    pos = int(np.searchsorted(times, last)) if last is not None else 0
+    appended = len(times) - pos - 1
+    dropped = count + appended - len(times)
+    known, earliest = _revised_since(snapshot, version)
+    start = pos
+    if earliest is not None:
+        start = min(pos, max(int(np.searchsorted(times, earliest, "right")) - 1, 0))
+    # Position in the browser's arrays of the point at `start`.
+    first = count - 1 - (pos - start)
+    if (
+        not known
+        or not count
+        or pos == len(times)
+        or times[pos] != last
+        or dropped < 0
+        or first < 0
+        # Large catch-ups (e.g. a tab left asleep) are cheaper in full.
+        or (pos - start) + appended + dropped > count // 4
+    ):
+        return None
+    patch = Patch()
+    new_x = _x_values(x[pos + 1 :])
+    for i, values in enumerate(columns):
+        trace = patch["data"][i]
+        for j in range(start, pos + 1):
+            trace["y"][first + j - start] = float(values[j])
+        if appended:
+            trace["x"].extend(new_x)
+            trace["y"].extend(values[pos + 1 :].tolist())
+        for _ in range(dropped):
+            del trace["x"][0]
+            del trace["y"][0]
+    if key == "carbon_intensity":
+        # The same headroom `fill_figure` gives the chart's level.
+        ci_max = snapshot.rollups[CHART_LEVELS[key][0]]["CarbonIntensity"].max()
+        if pd.notna(ci_max) and ci_max > 0:
+            patch["layout"]["yaxis"]["range"] = [0, float(ci_max) * 1.1]
+    return patch
+
+
+def _layout(snapshot: Snapshot, poll: Optional[float] = None) -> html.Div:
+    """Builds the page layout for one snapshot.
+
+    With `poll` (seconds) the page also carries the timer and chart state
+    used by the live dashboard, and every live chart is present even
+    before it has data.
+    """
+    if poll is None:
+        charts = [dcc.Graph(figure=fig) for fig in snapshot.figures.values()]
+    else:
+        charts = [
+            dcc.Graph(id=f"chart-{key}", figure=_live_figure(snapshot, key)[0])
+            for key in LIVE_CHARTS
+        ]
+        charts += [
+            dcc.Interval(id="refresh-interval", interval=poll * 1000),
+            dcc.Store(id="chart-state", data=chart_state(snapshot)),
+        ]
     # Build layout
-    app.layout = html.Div(
+    return html.Div(
         [
             html.H1("UK Power Market Dashboard"),
             html.P(
@@ -387,20 +3478,173 @@ def create_dashboard(
         ]
         + charts
     )
+
+
+def create_dashboard(
+    pivot_df: pd.DataFrame,
+    demand_df: pd.DataFrame | None = None,
+) -> Dash:
+    """Creates a Dash application with interactive charts.
+
+    Every chart is drawn from the rollups of `pivot_df` and `demand_df`
+    (see `RollupPyramid`).
+
+    Parameters
+    ----------
+    pivot_df : pandas.DataFrame
+        Pivot table containing generation by category, carbon intensity
+        and total generation.
+    demand_df : pandas.DataFrame | None, optional
+        Data frame with half‑hourly total generation, demand forecast and
+        supply minus demand.  If provided and non‑empty, an additional
+        line chart will be included showing the supply‑demand balance.
+
+    Returns
+    -------
+    dash.Dash
+        A Dash app ready to be served.
+    """
+    app = Dash(__name__)
+    if demand_df is None:
+        demand_df = pd.DataFrame()
+    app.layout = _layout(build_snapshot(pivot_df, _area_frame(pivot_df), demand_df))
     return app
 
 
-def main() -> None:
-    """Entry point when running this script as a module."""
-    print("Fetching data from Elexon…")
-    fuel_df = fetch_fuelinst_data()
-    tsdf_df = fetch_tsdf_data()
-    print(
-        f"Retrieved {len(fuel_df)} rows of FUELINST data and "
-        f"{len(tsdf_df)} rows of TSDF data."
+class _SnapshotLayout:
+    """Page layout built and serialised once per snapshot.
+
+    Dash calls the object for the layout (at start-up, to validate the
+    callbacks); `serve` is registered as a Flask ``before_request`` hook
+    that answers Dash's layout request with the JSON cached for the
+    current snapshot, so page loads between two refreshes neither
+    rebuild the figures nor re‑encode them.  The app adds no extra
+    layout components (pages, background callbacks) that Dash would
+    otherwise wrap around it.
+    """
+
+    def __init__(self, refresher: SnapshotRefresher, poll: float, path: str) -> None:
+        self.refresher = refresher
+        self.poll = poll
+        self.path = path
+        self._built: Tuple[int, Optional[html.Div], str] = (-1, None, "")
+
+    def _current(self) -> Tuple[html.Div, str]:
+        snapshot = self.refresher.snapshot
+        version, layout, body = self._built
+        if layout is None or version != snapshot.version:
+            layout = _layout(snapshot, self.poll)
+            body = to_json_plotly(layout)
+            # A tuple swap, so concurrent requests never see a torn pair.
+            self._built = (snapshot.version, layout, body)
+        return layout, body
+
+    def __call__(self) -> html.Div:
+        return self._current()[0]
+
+    def serve(self) -> Optional[flask.Response]:
+        """Returns the cached layout JSON for Dash's layout request."""
+        if flask.request.path != self.path:
+            return None
+        return flask.Response(self._current()[1], mimetype="application/json")
+
+
+def create_live_dashboard(refresher: SnapshotRefresher) -> Dash:
+    """Creates a Dash application that serves `refresher`'s latest snapshot.
+
+    The layout is a function, so each page load renders whichever
+    snapshot is current without waiting on a refresh in progress.  Open
+    pages poll for newer snapshots and receive only the changes (see
+    `chart_updates`) rather than re‑downloading every figure; zooming a
+    chart re‑queries its data at the resolution of the new range.  The
+    layout JSON is built once per snapshot (see `_SnapshotLayout`).
+    """
+    poll = min(POLL_INTERVAL, refresher.interval)
+    app = Dash(__name__)
+    layout = _SnapshotLayout(refresher, poll, app.config.routes_pathname_prefix + "_dash-layout")
+    app.layout = layout
+    app.server.before_request(layout.serve)
+
+    @app.callback(
+        [Output(f"chart-{key}", "figure") for key in LIVE_CHARTS]
+        + [Output("chart-state", "data")],
+        [Input("refresh-interval", "n_intervals")]
+        + [Input(f"chart-{key}", "relayoutData") for key in LIVE_CHARTS],
+        State("chart-state", "data"),
+        prevent_initial_call=True,
     )
+    def _update_charts(*args: object) -> list:
+        state: Dict[str, object] = args[-1] or {}  # type: ignore[assignment]
+        snapshot = refresher.snapshot
+        zoom: Dict[str, Optional[Tuple[int, int]]] = {}
+        trigger = ctx.triggered_id
+        if isinstance(trigger, str) and trigger.startswith("chart-"):
+            # Zoom or reset: re-query that chart at the new resolution.
+            key = trigger[len("chart-") :]
+            changed, x_range = _relayout_range(args[1 + LIVE_CHARTS.index(key)])  # type: ignore[arg-type]
+            if not changed:
+                raise PreventUpdate
+            zoom[key] = x_range
+        elif state.get("version") == snapshot.version:
+            raise PreventUpdate
+        updates, new_state = chart_updates(snapshot, state, zoom)
+        return [updates[key] for key in LIVE_CHARTS] + [new_state]
+
+    return app
+
+
+def run_dashboard(
+    window: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    refresh: float = REFRESH_INTERVAL,
+    boundary: str = NATIONAL_BOUNDARY,
+) -> None:
+    """Loads data, processes it and serves the dashboard.
+
+    Parameters
+    ----------
+    window : Tuple[str | None, str | None] | None, optional
+        If given, the (start, end) window is read from `DATA_STORE`
+        instead of fetching the latest data from Elexon.
+    refresh : float, optional
+        Seconds between background refreshes of live data; 0 serves the
+        initial fetch unchanged.  Ignored for stored windows.
+    boundary : str, optional
+        TSDF boundary whose demand forecast is compared with generation.
+    """
+    if window is not None and DATA_STORE is not None:
+        print(f"Loading {window[0] or 'start'} – {window[1] or 'end'} from {DATA_STORE.root}…")
+        start = time.perf_counter()
+        fuel_df, tsdf_df = DATA_STORE.load_window(*window)
+        print(
+            f"Loaded {len(fuel_df)} rows of FUELINST data and {len(tsdf_df)} rows "
+            f"of TSDF data in {time.perf_counter() - start:.2f}s."
+        )
+        if fuel_df.empty:
+            raise ValueError("No stored FUELINST data in the requested window.")
+    else:
+        print("Fetching data from Elexon…")
+        start = time.perf_counter()
+        fuel_df, tsdf_df, timings = fetch_all_data()
+        elapsed = time.perf_counter() - start
+        print(
+            f"Retrieved {len(fuel_df)} rows of FUELINST data "
+            f"({timings['FUELINST']:.2f}s) and {len(tsdf_df)} rows of TSDF data "
+            f"({timings['TSDF']:.2f}s) in {elapsed:.2f}s."
+        )
+        stats = cache_stats()
+        if stats["hits"]:
+            print(
+                f"HTTP cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+                f"{stats['bytes_saved'] / 1e6:.1f} MB not re-downloaded."
+            )
     print("Processing data…")
-    pivot_df, area_df, demand_merge = process_data(fuel_df, tsdf_df)
+    refresher: Optional[SnapshotRefresher] = None
+    if window is None and refresh > 0:
+        refresher = SnapshotRefresher(refresh, boundary=boundary)
+        snapshot = refresher.seed(fuel_df, tsdf_df)
+        pivot_df, demand_merge = snapshot.pivot, snapshot.demand
+    else:
+        pivot_df, _, demand_merge = process_data(fuel_df, tsdf_df, boundary=boundary)
     if demand_merge.empty:
         print(
             "Warning: no overlapping half‑hour periods between generation and "
@@ -411,12 +3655,83 @@ def main() -> None:
         print(
             f"Average supply minus forecast demand (MW) for overlap: {avg_diff:.1f}"
         )
-    # Pass demand_merge to dashboard for supply/demand chart
-    app = create_dashboard(area_df, pivot_df, demand_merge if not demand_merge.empty else None)
+    if refresher is not None:
+        app = create_live_dashboard(refresher)
+        refresher.start()
+        print(f"Refreshing data every {refresh:g}s in the background.")
+    else:
+        # Pass demand_merge to dashboard for supply/demand chart
+        app = create_dashboard(pivot_df, demand_merge if not demand_merge.empty else None)
     # Run the Dash server
     print("Starting dashboard… Navigate to http://127.0.0.1:8050 in your browser.")
     app.run_server(debug=False)
 
 
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Entry point when running this script as a module.
+
+    Without arguments the dashboard is served and its data refreshed in
+    the background every ``--refresh`` seconds.  ``backfill`` downloads a
+    historical date range instead (see `backfill`).  ``--store`` enables
+    the columnar store; with ``--start``/``--end`` the dashboard is served
+    from stored data for that window.  ``--api-url`` fetches from another
+    server, such as the offline stand‑in in ``elexon_standin.py``.
+    """
+    global DATA_STORE, ELEXON_API_URL
+    parser = argparse.ArgumentParser(description="UK power market dashboard")
+    parser.add_argument(
+        "--api-url",
+        default=ELEXON_API_URL,
+        help="Elexon API base URL, e.g. a local elexon_standin.py server",
+    )
+    parser.add_argument("--store", help="columnar store directory (requires pyarrow)")
+    parser.add_argument("--start", help="serve stored data from this time (UTC)")
+    parser.add_argument("--end", help="serve stored data up to this time (UTC)")
+    parser.add_argument(
+        "--refresh",
+        type=float,
+        default=REFRESH_INTERVAL,
+        help="seconds between background data refreshes (0 disables)",
+    )
+    parser.add_argument(
+        "--boundary",
+        default=NATIONAL_BOUNDARY,
+        help="TSDF boundary compared with generation (default: national)",
+    )
+    commands = parser.add_subparsers(dest="command")
+    bf = commands.add_parser("backfill", help="download a historical date range")
+    bf.add_argument("--start", required=True, help="first day (UTC), e.g. 2024-01-01")
+    bf.add_argument("--end", required=True, help="end of range (UTC, exclusive)")
+    bf.add_argument("--out", default="backfill", help="output directory")
+    bf.add_argument("--datasets", nargs="+", default=["FUELINST", "TSDF"])
+    bf.add_argument("--chunk-days", type=float, default=1.0)
+    bf.add_argument("--workers", type=int, default=4)
+    bf.add_argument("--rate", type=float, default=4.0, help="requests per second")
+    args = parser.parse_args(argv)
+    enable_copy_on_write()
+    ELEXON_API_URL = args.api_url.rstrip("/")
+    if args.store:
+        DATA_STORE = ColumnarStore(args.store)
+    if args.command == "backfill":
+        summary = backfill(
+            args.start,
+            args.end,
+            args.out,
+            datasets=args.datasets,
+            chunk_days=args.chunk_days,
+            max_workers=args.workers,
+            rate=args.rate,
+        )
+        print(
+            f"Backfill complete: {summary['fetched']} chunk(s) fetched, "
+            f"{summary['skipped']} already done, {summary['failed']} failed."
+        )
+        return
+    window = (args.start, args.end) if args.start or args.end else None
+    if window is not None and DATA_STORE is None:
+        parser.error("--start/--end require --store")
+    run_dashboard(window, args.refresh, args.boundary)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
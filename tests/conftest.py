@@ -0,0 +1,21 @@
+import os
+import sys
+
+# The modules under test are top-level scripts, not an installed package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import power_market_dashboard as pmd
+from elexon_standin import StandInServer
+
+
+@pytest.fixture
+def standin(monkeypatch, tmp_path):
+    """A stand-in server the fetchers point at, with a fresh HTTP cache."""
+    with StandInServer() as server:
+        monkeypatch.setattr(pmd, "ELEXON_API_URL", server.base_url)
+        monkeypatch.setattr(pmd, "CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(pmd, "HTTP_CACHE_ENABLED", True)
+        monkeypatch.setattr(pmd, "DATA_STORE", None)
+        yield server
@@ -0,0 +1,114 @@
+"""Checks `backfill` against the stand-in server."""
+
+import glob
+import json
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import power_market_dashboard as pmd
+from elexon_standin import FUEL_TYPES, StandInServer
+
+START, END = "2024-01-01", "2024-01-03"
+DAYS = 2
+
+
+@pytest.fixture
+def server_factory(monkeypatch):
+    """Starts stand-in servers and points the fetchers at the latest one."""
+    servers = []
+    monkeypatch.setattr(pmd, "DATA_STORE", None)
+
+    def start(**kwargs) -> StandInServer:
+        server = StandInServer(**kwargs).__enter__()
+        servers.append(server)
+        monkeypatch.setattr(pmd, "ELEXON_API_URL", server.base_url)
+        return server
+
+    yield start
+    for server in servers:
+        server.__exit__()
+
+
+def _run(out_dir, **kwargs):
+    kwargs.setdefault("rate", 1000.0)
+    return pmd.backfill(START, END, str(out_dir), **kwargs)
+
+
+def _load(out_dir):
+    fuel = pd.concat(
+        [pd.read_csv(path) for path in sorted(glob.glob(os.path.join(out_dir, "FUELINST_*.csv")))],
+        ignore_index=True,
+    )
+    tsdf = pd.concat(
+        [
+            pd.DataFrame(json.load(open(path, encoding="utf-8"))["data"])
+            for path in sorted(glob.glob(os.path.join(out_dir, "TSDF_*.json")))
+        ],
+        ignore_index=True,
+    )
+    return fuel, tsdf
+
+
+def _assert_complete(out_dir):
+    fuel, tsdf = _load(out_dir)
+    # Every 5-minute publish once, and hourly 24-hour TSDF forecasts
+    assert len(fuel) == DAYS * 288 * len(FUEL_TYPES)
+    assert not fuel.duplicated(pmd.DATASET_KEYS["FUELINST"]).any()
+    assert len(tsdf) == DAYS * 24 * 48
+    assert not tsdf.duplicated(pmd.DATASET_KEYS["TSDF"]).any()
+    assert fuel["PublishTime"].min() == "2024-01-01T00:00:00Z"
+    assert fuel["PublishTime"].max() == "2024-01-02T23:55:00Z"
+
+
+def test_full_run(server_factory, tmp_path):
+    server = server_factory()
+    summary = _run(tmp_path, chunk_days=0.5)
+    assert summary == {"fetched": 8, "skipped": 0, "failed": 0}
+    assert server.stats["requests"] == 8
+    _assert_complete(tmp_path)
+
+
+def test_interrupted_run_resumes_from_checkpoint(server_factory, tmp_path):
+    flaky = server_factory(error_rate=0.5)
+    first = _run(tmp_path)
+    assert first["failed"] == 2 and first["fetched"] == 2
+    assert flaky.stats["errors"] == 2
+    server = server_factory()
+    second = _run(tmp_path)
+    assert second == {"fetched": 2, "skipped": 2, "failed": 0}
+    # Only the failed chunks are requested again
+    assert server.stats["requests"] == 2
+    _assert_complete(tmp_path)
+    assert _run(tmp_path) == {"fetched": 0, "skipped": 4, "failed": 0}
+
+
+def test_resume_with_other_chunk_size(server_factory, tmp_path):
+    server_factory()
+    _run(tmp_path, datasets=["FUELINST"], chunk_days=1)
+    server = server_factory()
+    # Half-day chunks inside completed days, and a two-day chunk spanning both
+    assert _run(tmp_path, datasets=["FUELINST"], chunk_days=0.5)["fetched"] == 0
+    assert _run(tmp_path, datasets=["FUELINST"], chunk_days=2)["fetched"] == 0
+    assert server.stats["requests"] == 0
+    with open(tmp_path / "checkpoint.json", encoding="utf-8") as f:
+        assert sorted(json.load(f)["completed"]) == [
+            "FUELINST:2024-01-01T00:00:00Z/2024-01-02T00:00:00Z",
+            "FUELINST:2024-01-02T00:00:00Z/2024-01-03T00:00:00Z",
+        ]
+    # A longer range fetches only the new part
+    summary = pmd.backfill(START, "2024-01-04", str(tmp_path), datasets=["FUELINST"], rate=1000.0)
+    assert summary == {"fetched": 1, "skipped": 2, "failed": 0}
+
+
+def test_token_bucket_limits_rate():
+    bucket = pmd.TokenBucket(rate=50.0, capacity=1)
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    # One token up front, then 10 more at 50 per second
+    assert time.monotonic() - start >= 0.18
+    with pytest.raises(ValueError):
+        pmd.TokenBucket(rate=0)
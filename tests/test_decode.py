@@ -0,0 +1,63 @@
+"""Checks the streaming decoder against a whole-body decode."""
+
+import datetime as dt
+import json
+
+import pandas as pd
+import pytest
+
+import power_market_dashboard as pmd
+from elexon_standin import make_fuelinst_records, make_tsdf_records
+
+END = dt.datetime(2024, 3, 31, 2, 0, tzinfo=dt.timezone.utc)
+
+
+def _chunks(body, size):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def _whole(body, dataset):
+    payload = json.loads(body)
+    records = payload.get("data", []) if isinstance(payload, dict) else payload
+    columns, schema = pmd._DATASET_FORMATS[dataset]
+    return pmd.apply_schema(pd.DataFrame(records).rename(columns=columns), schema)
+
+
+def _assert_same(streamed, whole):
+    pd.testing.assert_frame_equal(
+        streamed[whole.columns], whole, check_categorical=False
+    )
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Flush several times per payload so the packing path is exercised.
+    monkeypatch.setattr(pmd, "STREAM_CHUNK_ROWS", 37)
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 10, 1 << 16])
+def test_streamed_matches_whole_body(size):
+    body = json.dumps({"data": make_fuelinst_records(END, 12), "total": 240}).encode()
+    _assert_same(pmd._stream_frame(_chunks(body, size), "FUELINST"), _whole(body, "FUELINST"))
+
+
+@pytest.mark.parametrize("size", [7, 1 << 10])
+def test_top_level_list(size):
+    body = json.dumps(make_tsdf_records(END, 48)).encode()
+    _assert_same(pmd._stream_frame(_chunks(body, size), "TSDF"), _whole(body, "TSDF"))
+
+
+@pytest.mark.parametrize("size", [7, 1 << 10])
+def test_missing_fields(size):
+    records = make_fuelinst_records(END, 12)
+    for i, record in enumerate(records):
+        if i < 50:
+            # Seen for the first time after the first flush.
+            del record["generation"]
+        if i % 9 == 0:
+            del record["fuelType"]
+    body = json.dumps({"data": records}).encode()
+    streamed = pmd._stream_frame(_chunks(body, size), "FUELINST")
+    assert streamed["Generation"].isna().sum() == 50
+    _assert_same(streamed, _whole(body, "FUELINST"))
@@ -0,0 +1,27 @@
+"""Checks conditional requests against the stand-in server."""
+
+import pandas as pd
+
+import power_market_dashboard as pmd
+
+
+def test_second_fetch_is_answered_from_the_cache(standin):
+    before = pmd.cache_stats()
+    first = pmd.fetch_fuelinst_data()
+    assert standin.stats["ok"] == 1
+    second = pmd.fetch_fuelinst_data()
+    after = pmd.cache_stats()
+
+    assert standin.stats["not_modified"] == 1
+    pd.testing.assert_frame_equal(second, first)
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+    assert after["bytes_saved"] - before["bytes_saved"] == len(standin.payloads["FUELINST"])
+
+
+def test_cache_disabled_downloads_every_time(standin, monkeypatch):
+    monkeypatch.setattr(pmd, "HTTP_CACHE_ENABLED", False)
+    pmd.fetch_tsdf_data()
+    pmd.fetch_tsdf_data()
+    assert standin.stats["ok"] == 2
+    assert standin.stats["not_modified"] == 0
@@ -0,0 +1,118 @@
+"""Checks that live chart patches reproduce the snapshot figures."""
+
+import json
+
+import pandas as pd
+import plotly.io as pio
+import pytest
+
+import power_market_dashboard as pmd
+from elexon_synthetic import FUEL_TYPES, generate_fuelinst, generate_tsdf
+
+FUELS = len(FUEL_TYPES)
+WINDOW = 288 * FUELS
+
+
+def _roundtrip(obj):
+    # What the browser receives.
+    return json.loads(pio.to_json(obj, validate=False))
+
+
+def _apply(figure, update):
+    """Applies a chart update to a browser-side figure, as Dash does."""
+    if update is pmd.no_update:
+        return figure
+    payload = _roundtrip(update)
+    if "__dash_patch_update" not in payload:
+        return payload
+    for op in payload["operations"]:
+        *path, leaf = op["location"]
+        target = figure
+        for key in path:
+            target = target.setdefault(key, {}) if isinstance(target, dict) else target[key]
+        if op["operation"] == "Assign":
+            target[leaf] = op["params"]["value"]
+        elif op["operation"] == "Extend":
+            target[leaf].extend(op["params"]["value"])
+        elif op["operation"] == "Delete":
+            del target[leaf]
+        else:
+            raise AssertionError(f"unexpected patch operation {op['operation']}")
+    return figure
+
+
+def _assert_matches(figures, snapshot):
+    for key in pmd.LIVE_CHARTS:
+        expected = _roundtrip(pmd._live_figure(snapshot, key)[0])
+        for held, trace in zip(figures[key]["data"], expected["data"]):
+            assert held["x"] == trace["x"]
+            assert held["y"] == trace["y"]
+        if key == "carbon_intensity":
+            assert figures[key]["layout"]["yaxis"]["range"] == expected["layout"]["yaxis"]["range"]
+
+
+def _revision(fuel_df, interval):
+    """A later publish of one held interval with different generation."""
+    rows = fuel_df.iloc[interval * FUELS : (interval + 1) * FUELS].copy()
+    rows["PublishTime"] = rows["PublishTime"] + 3_600 * 10**9
+    rows["Generation"] = rows["Generation"] * 1.5
+    return rows
+
+
+@pytest.mark.parametrize("revise", [None, 250, 150])
+def test_patches_track_the_snapshot(revise):
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", 2), generate_tsdf("2024-10-26", 2)
+    refresher = pmd.SnapshotRefresher()
+    snapshot = refresher.seed(fuel_df.iloc[:WINDOW], tsdf_df)
+    state = pmd.chart_state(snapshot)
+    figures = {key: _roundtrip(pmd._live_figure(snapshot, key)[0]) for key in pmd.LIVE_CHARTS}
+    patched = 0
+    for tick in range(6):
+        batch = fuel_df.iloc[WINDOW + tick * FUELS : WINDOW + (tick + 1) * FUELS]
+        if revise is not None and tick == 2:
+            # A revision a few intervals (or half hours) back in the window.
+            batch = pd.concat([batch, _revision(fuel_df, revise + tick)])
+        snapshot = refresher.ingest(batch)
+        updates, state = pmd.chart_updates(snapshot, state)
+        patched += sum(isinstance(update, pmd.Patch) for update in updates.values())
+        figures = {key: _apply(figures[key], updates[key]) for key in pmd.LIVE_CHARTS}
+        _assert_matches(figures, snapshot)
+    assert patched
+
+
+def test_unknown_revisions_send_full_arrays():
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", 2), generate_tsdf("2024-10-26", 2)
+    refresher = pmd.SnapshotRefresher()
+    snapshot = refresher.seed(fuel_df.iloc[:WINDOW], tsdf_df)
+    state = pmd.chart_state(snapshot)
+    figures = {key: _roundtrip(pmd._live_figure(snapshot, key)[0]) for key in pmd.LIVE_CHARTS}
+    for tick in range(pmd.REVISION_HISTORY + 1):
+        batch = fuel_df.iloc[WINDOW + tick * FUELS : WINDOW + (tick + 1) * FUELS]
+        snapshot = refresher.ingest(batch)
+    updates, _ = pmd.chart_updates(snapshot, state)
+    for update in updates.values():
+        # Data arrays are replaced whole, not extended.
+        operations = _roundtrip(update).get("operations", [])
+        assert all(op["operation"] != "Extend" for op in operations)
+    figures = {key: _apply(figures[key], updates[key]) for key in pmd.LIVE_CHARTS}
+    _assert_matches(figures, snapshot)
+
+
+def test_layout_json_is_cached_per_snapshot():
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", 2), generate_tsdf("2024-10-26", 2)
+    refresher = pmd.SnapshotRefresher()
+    refresher.seed(fuel_df.iloc[:WINDOW], tsdf_df)
+    app = pmd.create_live_dashboard(refresher)
+    client = app.server.test_client()
+
+    first = client.get("/_dash-layout")
+    assert first.mimetype == "application/json"
+    assert client.get("/_dash-layout").data == first.data
+    expected = pmd._layout(refresher.snapshot, min(pmd.POLL_INTERVAL, refresher.interval))
+    assert json.loads(first.data) == _roundtrip(expected)
+
+    refresher.ingest(fuel_df.iloc[WINDOW : WINDOW + FUELS])
+    second = json.loads(client.get("/_dash-layout").data)
+    store = next(c for c in second["props"]["children"] if c["props"].get("id") == "chart-state")
+    assert store["props"]["data"]["version"] == refresher.snapshot.version
+    assert client.get("/").status_code == 200
@@ -0,0 +1,95 @@
+"""Checks `process_data` against the original pivot_table implementation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import power_market_dashboard as pmd
+from elexon_synthetic import generate_fuelinst, generate_tsdf
+
+
+def _reference(fuel_df: pd.DataFrame, tsdf_df: pd.DataFrame):
+    """The pivot_table / groupby pipeline `process_data` replaced."""
+    fuel_df = fuel_df.astype({"Generation": "float64"})
+    fuel_df["LocalTime"] = pd.to_datetime(fuel_df["StartTime"], utc=True).dt.tz_convert(
+        "Europe/London"
+    )
+    fuel_df["Generation_clipped"] = fuel_df["Generation"].clip(lower=0)
+    fuel_df["Category"] = fuel_df["FuelType"].astype(str).apply(pmd._categorise_fuel_types)
+    pivot = fuel_df.pivot_table(
+        index="LocalTime", columns="Category", values="Generation_clipped", aggfunc="sum"
+    ).fillna(0)
+    for col in pmd.CATEGORIES:
+        if col not in pivot.columns:
+            pivot[col] = 0.0
+    pivot = pivot[pmd.CATEGORIES]
+    pivot["TotalGeneration"] = pivot[pmd.CATEGORIES].sum(axis=1)
+    ci_numerator = sum(pivot[cat] * ef for cat, ef in pmd.EMISSION_FACTORS.items())
+    pivot["CarbonIntensity"] = ci_numerator / pivot["TotalGeneration"].replace(0, np.nan)
+    # Floored in UTC: a local floor is ambiguous on the fall-back day
+    fuel_df["LocalHalfHour"] = (
+        pd.to_datetime(fuel_df["StartTime"], utc=True).dt.floor("30min").dt.tz_convert("Europe/London")
+    )
+    half_hour_gen = fuel_df.groupby("LocalHalfHour")["Generation_clipped"].sum()
+    tsdf_df = tsdf_df[tsdf_df["Boundary"] == pmd.NATIONAL_BOUNDARY].copy()
+    tsdf_df["LocalHalfHour"] = pd.to_datetime(tsdf_df["StartTime"], utc=True).dt.tz_convert(
+        "Europe/London"
+    )
+    latest = tsdf_df.sort_values("PublishTime", kind="stable").groupby("LocalHalfHour").tail(1)
+    demand = latest.set_index("LocalHalfHour")["demand"].astype("float64")
+    merged = pd.DataFrame({"DemandForecast": demand, "TotalGeneration": half_hour_gen}).dropna()
+    merged["SupplyMinusDemand"] = merged["TotalGeneration"] - merged["DemandForecast"]
+    return pivot, merged.sort_index()
+
+
+@pytest.mark.parametrize(
+    "start, change_day, periods",
+    [
+        ("2024-03-30", "2024-03-31", 46),  # spring forward
+        ("2024-10-26", "2024-10-27", 50),  # fall back
+    ],
+)
+@pytest.mark.parametrize("compact", [True, False], ids=["compact", "strings"])
+def test_process_data_matches_pivot_table(start, change_day, periods, compact):
+    fuel_df = generate_fuelinst(start, days=3)
+    tsdf_df = generate_tsdf(start, days=3, boundaries=("N", "B1"))
+    if not compact:
+        # The fetchers' original string format
+        fuel_df = fuel_df.assign(
+            StartTime=pd.to_datetime(fuel_df["StartTime"], utc=True).dt.strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+            FuelType=fuel_df["FuelType"].astype(str),
+            SettlementDate=fuel_df["SettlementDate"].astype(str),
+        )
+    expected_pivot, expected_demand = _reference(fuel_df, tsdf_df)
+
+    pivot, area, demand = pmd.process_data(fuel_df, tsdf_df)
+
+    columns = pmd.CATEGORIES + ["TotalGeneration", "CarbonIntensity"]
+    pd.testing.assert_frame_equal(
+        pivot[columns], expected_pivot[columns],
+        check_names=False, check_freq=False, check_column_type=False, rtol=1e-9,
+    )
+    pd.testing.assert_frame_equal(
+        area, expected_pivot[pmd.CATEGORIES], check_names=False, check_freq=False,
+        check_column_type=False, rtol=1e-9,
+    )
+    demand = demand.set_index("LocalHalfHour")
+    assert demand.index.equals(expected_demand.index)
+    pd.testing.assert_frame_equal(
+        demand[expected_demand.columns], expected_demand,
+        check_names=False, check_freq=False, rtol=1e-9,
+    )
+    # The clock‑change day keeps every settlement period
+    day = demand[demand["SettlementDate"] == pd.Timestamp(change_day).date()]
+    assert day["SettlementPeriod"].tolist() == list(range(1, periods + 1))
+
+
+def test_process_data_leaves_inputs_unchanged():
+    fuel_df = generate_fuelinst("2024-10-27", days=1)
+    tsdf_df = generate_tsdf("2024-10-27", days=1)
+    before = fuel_df.copy(), tsdf_df.copy()
+    pmd.process_data(fuel_df, tsdf_df)
+    pd.testing.assert_frame_equal(fuel_df, before[0])
+    pd.testing.assert_frame_equal(tsdf_df, before[1])
@@ -0,0 +1,42 @@
+"""Checks `SnapshotRefresher` snapshots built from incremental updates."""
+
+import pandas as pd
+
+import power_market_dashboard as pmd
+from elexon_synthetic import FUEL_TYPES, generate_fuelinst, generate_tsdf
+
+
+def test_snapshots_match_a_full_reprocess():
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", 2), generate_tsdf("2024-10-26", 2)
+    fuels = len(FUEL_TYPES)
+    window = 288 * fuels
+    refresher = pmd.SnapshotRefresher()
+    first = refresher.seed(fuel_df.iloc[:window], tsdf_df)
+    expected_first = pmd.process_data(fuel_df.iloc[:window], tsdf_df)
+    for start in range(window, window + 12 * fuels, fuels):
+        snapshot = refresher.ingest(fuel_df.iloc[start : start + fuels])
+
+    pivot, _, demand = pmd.process_data(refresher.store.frame(), tsdf_df)
+    assert snapshot.pivot.index[-1] == pivot.index[-1]
+    assert len(refresher.store) == len(snapshot.pivot) * fuels
+    pd.testing.assert_frame_equal(
+        snapshot.pivot, pivot[snapshot.pivot.columns], check_freq=False, check_names=False
+    )
+    held = demand[demand["LocalHalfHour"] >= snapshot.pivot.index[0]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(snapshot.demand.reset_index(drop=True), held, check_dtype=False)
+    # Frames of an earlier snapshot are built from its own refresh only.
+    pd.testing.assert_frame_equal(
+        first.pivot, expected_first[0][first.pivot.columns], check_freq=False, check_names=False
+    )
+
+
+def test_trim_keeps_the_retained_window():
+    fuel_df = generate_fuelinst("2024-10-26", 1)
+    store = pmd.FuelinstStore()
+    store.upsert(fuel_df)
+    cutoff = pd.Timestamp("2024-10-26 12:00", tz="UTC")
+    removed = store.trim(cutoff)
+    starts = pd.to_datetime(store.frame()["StartTime"], utc=True)
+    assert removed == len(fuel_df) - len(store)
+    assert starts.min() == cutoff
+    assert store.trim(cutoff) == 0
@@ -0,0 +1,60 @@
+"""Checks that incremental `RollupPyramid` updates match a rebuild."""
+
+import pandas as pd
+
+import power_market_dashboard as pmd
+from elexon_synthetic import generate_fuelinst, generate_tsdf
+
+
+def _frames(days: float = 2.0):
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", days), generate_tsdf("2024-10-26", days)
+    pivot, _, demand = pmd.process_data(fuel_df, tsdf_df)
+    return pivot, demand
+
+
+def _assert_levels_equal(result, expected):
+    for level in pmd.ROLLUP_LEVELS:
+        pd.testing.assert_frame_equal(result[level], expected[level], rtol=1e-9)
+
+
+def _demand_for(demand, pivot_rows):
+    return demand[demand["LocalHalfHour"].isin(pivot_rows.index)]
+
+
+def test_incremental_updates_match_rebuild():
+    pivot, demand = _frames()
+    pyramid = pmd.RollupPyramid()
+    # Out of order: the second day first, then the first day in batches.
+    split = len(pivot) // 2
+    batches = [pivot.iloc[split:]] + [pivot.iloc[i : min(i + 50, split)] for i in range(0, split, 50)]
+    for rows in batches:
+        pyramid.update(rows, _demand_for(demand, rows))
+    _assert_levels_equal(pyramid.levels(), pmd.RollupPyramid.from_frames(pivot, demand).levels())
+
+
+def test_revision_and_trim_match_rebuild():
+    pivot, demand = _frames()
+    pyramid = pmd.RollupPyramid.from_frames(pivot, demand)
+    revised = pivot.iloc[100:110] * 1.5
+    pyramid.update(revised)
+    cutoff = pivot.index[300]
+    pyramid.trim(cutoff)
+
+    expected_pivot = pivot.copy()
+    expected_pivot.iloc[100:110] = revised
+    expected = pmd.RollupPyramid.from_frames(
+        expected_pivot[expected_pivot.index >= cutoff],
+        demand[demand["LocalHalfHour"] >= cutoff],
+    )
+    _assert_levels_equal(pyramid.levels(), expected.levels())
+
+
+def test_published_levels_do_not_change():
+    pivot, demand = _frames()
+    pyramid = pmd.RollupPyramid.from_frames(pivot.iloc[:-20], demand)
+    published = pyramid.levels()
+    copies = {level: frame.copy() for level, frame in published.items()}
+    pyramid.update(pivot.iloc[-20:])
+    pyramid.update(pivot.iloc[-30:-25] * 2.0)
+    pyramid.trim(pivot.index[50])
+    _assert_levels_equal(published, copies)
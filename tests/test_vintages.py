@@ -0,0 +1,83 @@
+"""Checks `ForecastVintageStore` error statistics."""
+
+import numpy as np
+import pandas as pd
+
+import power_market_dashboard as pmd
+from elexon_synthetic import generate_fuelinst, generate_tsdf
+
+COLUMNS = ["Count", "MeanError", "MeanAbsoluteError", "RMSE"]
+
+
+def _outturn(days: float = 1.0):
+    fuel_df, tsdf_df = generate_fuelinst("2024-10-26", days), generate_tsdf("2024-10-26", days)
+    pivot, _, _ = pmd.process_data(fuel_df, tsdf_df)
+    return pmd.realised_generation(pivot)
+
+
+def test_error_by_lead_before_any_outturn():
+    store = pmd.ForecastVintageStore()
+    store.add(generate_tsdf("2024-10-26", 1))
+    result = store.error_by_lead()
+    assert result.empty
+    assert list(result.columns) == COLUMNS
+    assert store.error_by_lead("B1").empty
+
+
+def test_error_by_lead_with_boundary_added_late():
+    store = pmd.ForecastVintageStore()
+    tsdf = generate_tsdf("2024-10-26", 1, boundaries=("N", "B1"))
+    store.add(tsdf[tsdf["Boundary"] == "N"])
+    store.set_outturn(*_outturn())
+    national = store.error_by_lead()
+    assert national["Count"].sum() > 0
+    # A boundary first seen after the statistics exist
+    store.add(tsdf[tsdf["Boundary"] == "B1"])
+    assert store.error_by_lead("B1")["Count"].sum() == national["Count"].sum()
+    # And one with no realised period yet
+    store.add(generate_tsdf("2024-10-28", 1, boundaries=("B2",)))
+    assert store.error_by_lead("B2").empty
+    pd.testing.assert_frame_equal(store.error_by_lead(), national)
+
+
+def test_error_by_lead_matches_pandas():
+    tsdf = generate_tsdf("2024-10-26", 2)
+    keys, generation = _outturn(2)
+    store = pmd.ForecastVintageStore()
+    store.add(tsdf)
+    store.set_outturn(keys, generation)
+
+    vintages = store.frame()
+    realised = pd.Series(generation, index=keys)
+    target = vintages["SettlementDate"].map(
+        lambda day: (pd.Timestamp(day).value // pmd._DAY_NS) * pmd._SETTLEMENT_STRIDE
+    ) + vintages["SettlementPeriod"]
+    error = vintages["DemandForecast"].to_numpy() - realised.reindex(target).to_numpy()
+    lead = (
+        vintages["LocalHalfHour"].dt.tz_convert("UTC").astype("int64") - vintages["PublishTime"]
+    ) // pmd._HALF_HOUR_NS
+    frame = pd.DataFrame({"lead": lead, "error": error}).dropna()
+    frame = frame[frame["lead"] >= 0]
+    grouped = frame.groupby("lead")["error"]
+    expected = pd.DataFrame(
+        {
+            "Count": grouped.size(),
+            "MeanError": grouped.mean(),
+            "MeanAbsoluteError": grouped.apply(lambda e: e.abs().mean()),
+            "RMSE": grouped.apply(lambda e: np.sqrt((e**2).mean())),
+        }
+    )
+    expected.index = pd.TimedeltaIndex(expected.index * pmd._HALF_HOUR_NS, name="LeadTime")
+    pd.testing.assert_frame_equal(store.error_by_lead(), expected, check_freq=False, rtol=1e-6)
+
+
+def test_incremental_processor_before_first_complete_half_hour():
+    processor = pmd.IncrementalProcessor()
+    processor.update(None, generate_tsdf("2024-10-26", 1))
+    assert processor.vintages.error_by_lead().empty
+    fuel = generate_fuelinst("2024-10-26", 1)
+    # Five intervals: the first half hour is not complete yet
+    processor.update(fuel.iloc[: 5 * len(fuel) // 288])
+    assert processor.vintages.error_by_lead().empty
+    processor.update(fuel.iloc[5 * len(fuel) // 288 :])
+    assert processor.vintages.error_by_lead()["Count"].sum() > 0